@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+개정문 조문 단위 색인
+- amendments.reason(개정이유 + 【개정문】)을 적재 시 1회 파싱 → 구조화 색인
+  · 개정 조문: 제25조, 제5조의3, 별표 2, 별지 제50호서식 (+ 개정/신설/삭제)
+  · 용어 변경: "폐광지역" → "석탄산업전환지역", 제명 변경
+  · 부칙 시행일: 시행일자 또는 공포 후 경과기간, 단서 여부
+- 타법개정(부칙 "다른 법률의 개정")은 해당 법령 항목(⑦ ○○법 일부를 …)만 대상 조문으로 인식
+- 토큰 정규식 1개로 본문을 앞에서부터 한 번만 훑음 (코퍼스 전체 선형 시간)
+- "이번 분기에 제n조가 바뀐 기본법규" 같은 질의는 amendment_articles 색인 조회
+
+사용법:
+  python amendment_index.py build              (기존 DB 개정내역 전체 재색인)
+  python amendment_index.py query 제25조 [--from 2026-01-01] [--to 2026-03-31] [--base]
+  (law_db 적재 시 자동 색인: LawDatabase.upsert_corpus)
+"""
+
+import argparse
+import re
+import sys
+
+from exact_matching_analyzer import normalize_law_name
+
+CIRCLED = "①-⑳㉑-㉟㊱-㊿"  # 타법개정 항목 번호 (<21> 형태도 사용)
+
+TOKEN_RE = re.compile(
+    r'(?P<start>일부를\s*다음과\s*같이\s*개정한다)'
+    r'|(?P<others>\(다른\s*법(?:률|령)의\s*개정\))'
+    r'|(?P<sibling>(?:[' + CIRCLED + r']|<\d+>)\s*(?=\S))'
+    r'|(?P<addenda>부\s*칙)'
+    r'|(?P<effective>(?:제1조\s*\(시행일\)\s*)?이\s*(?:법|영|규칙|령)은\s*(?P<when>[^.]{0,120}?)시행한다\.?'
+    r'(?P<proviso>\s*다만)?)'
+    r'|(?P<rename>(?P<title>제명\s*)?"(?P<old>[^"]+)"\s*[을를]\s*(?:각각\s*)?"(?P<new>[^"]+)"\s*(?:으로|로))'
+    r'|(?P<foreign>「[^」]*」\s*(?:제\s*\d+\s*조(?:\s*의\s*\d+)?)?)'
+    r'|(?P<quote>"[^"]*"|“[^”]*”)'
+    r'|(?P<article>제\s*(?P<art_no>\d+)\s*조(?:\s*의\s*(?P<art_sub>\d+))?|별표\s*(?P<table_no>\d+)(?:\s*의\s*(?P<table_sub>\d+))?'
+    r'|별지\s*제\s*(?P<form_no>\d+)\s*호(?:\s*의\s*(?P<form_sub>\d+))?\s*서식)'
+    r'|(?P<verb>(?P<op>신설|삭제)?(?:한다\.|하고\s*,|하며\s*,))'
+)
+DATE_RE = re.compile(r"(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일")
+DELAY_RE = re.compile(r"공포\s*후\s*(\d+\s*(?:개월|년|일))이?\s*경과한\s*날")
+
+AMENDMENT_MARKER = "【개정문】"
+
+
+def _article_key(m):
+    if m.group("art_no"):
+        key = f"제{m.group('art_no')}조"
+        return key + (f"의{m.group('art_sub')}" if m.group("art_sub") else "")
+    if m.group("table_no"):
+        key = f"별표 {m.group('table_no')}"
+        return key + (f"의{m.group('table_sub')}" if m.group("table_sub") else "")
+    return f"별지 제{m.group('form_no')}호" + (f"의{m.group('form_sub')}" if m.group("form_sub") else "") + "서식"
+
+
+def _parse_effective(m):
+    when = m.group("when")
+    date = DATE_RE.search(when)
+    delay = DELAY_RE.search(when)
+    clause = m.group(0)[:m.start("proviso") - m.start()] if m.group("proviso") else m.group(0)
+    return {
+        "clause": clause.strip(),
+        "date": f"{int(date.group(1)):04d}-{int(date.group(2)):02d}-{int(date.group(3)):02d}" if date else None,
+        "delay": re.sub(r"\s+", "", delay.group(1)) if delay else ("0일" if "공포한 날" in when else None),
+        "hasProviso": bool(m.group("proviso")),
+    }
+
+
+def parse_amendment(text, title=None):
+    """개정내역 본문 1건 → {"articles": [(조문, 구분)], "renames": [(구, 신)],
+    "titleRenames": [(구, 신)], "relatedTitleRenames": [(구, 신)], "effective": {...}|None}
+
+    title: 대상 법령명. 타법개정 본문에서 이 법령 항목만 대상 조문으로 인식 (None이면 첫 항목)
+    """
+    result = {"articles": [], "renames": [], "titleRenames": [], "relatedTitleRenames": [],
+              "effective": None}
+    if not text:
+        return result
+    body_start = text.find(AMENDMENT_MARKER)
+    body = text[body_start + len(AMENDMENT_MARKER):] if body_start >= 0 else text
+    want = normalize_law_name(title) if title else None
+
+    in_target = nested = in_addenda = False
+    seen_target = False
+    pending, seen_articles = [], set()
+
+    def flush(op):
+        for key in pending:
+            if (key, op) not in seen_articles:
+                seen_articles.add((key, op))
+                result["articles"].append((key, op))
+        pending.clear()
+
+    for m in TOKEN_RE.finditer(body):
+        kind = m.lastgroup
+        if kind == "start":
+            # 직전 텍스트가 대상 법령명으로 끝나는 항목만 대상 (법령명 길이만큼만 되돌아봄)
+            if want is None:
+                in_target = not seen_target
+            else:
+                head = body[max(0, m.start() - len(title) * 2 - 8):m.start()]
+                in_target = normalize_law_name(head).endswith(want)
+            seen_target |= in_target
+        elif kind == "others":
+            nested = True
+        elif kind == "sibling":
+            if in_target and nested:
+                flush("개정")
+                in_target = False
+        elif kind == "addenda":
+            if in_target and not nested:
+                flush("개정")
+                in_target = False
+            in_addenda = True
+        elif kind == "effective":
+            if in_addenda and result["effective"] is None:
+                result["effective"] = _parse_effective(m)
+        elif kind == "rename":
+            pair = (m.group("old"), m.group("new"))
+            if m.group("title"):
+                result["titleRenames" if in_target else "relatedTitleRenames"].append(pair)
+            elif in_target and pair not in result["renames"]:
+                result["renames"].append(pair)
+        elif kind == "article":
+            if in_target:
+                pending.append(_article_key(m))
+        elif kind == "verb":
+            if in_target:
+                flush(m.group("op") or "개정")
+    if in_target:
+        flush("개정")
+    return result
+
+
+def index_rows(rows):
+    """(amendment_id, reason, title) 목록 → 색인 테이블 행 (articles, terms, effective)"""
+    articles, terms, effective = [], [], []
+    for amendment_id, reason, title in rows:
+        parsed = parse_amendment(reason, title)
+        articles.extend((amendment_id, key, op) for key, op in parsed["articles"])
+        for kind, field in (("term", "renames"), ("title", "titleRenames"),
+                            ("related_title", "relatedTitleRenames")):
+            terms.extend((amendment_id, kind, old, new) for old, new in parsed[field])
+        e = parsed["effective"]
+        if e:
+            effective.append((amendment_id, e["clause"], e["date"], e["delay"], int(e["hasProviso"])))
+    return articles, terms, effective
+
+
+def normalize_article(ref):
+    """'제 25 조의2' / '25' → '제25조의2'"""
+    ref = re.sub(r"\s+", "", ref)
+    m = re.fullmatch(r"(?:제)?(\d+)(?:조)?(?:의(\d+))?", ref)
+    if not m:
+        return ref
+    return f"제{m.group(1)}조" + (f"의{m.group(2)}" if m.group(2) else "")
+
+
+def laws_with_article(db, article, start=None, end=None, base_only=False):
+    """조문 → 해당 조문이 개정된 (법령, 개정일, 구분[, 기본법규]) 목록"""
+    # 같은 법령·개정일이 여러 데이터셋(index/quarterly)에 있으면 1건으로
+    sql = ("SELECT DISTINCT c.title, a.date, aa.op"
+           + (", b.id AS base_law_id, b.title AS base_title" if base_only else "")
+           + " FROM amendment_articles aa JOIN amendments a ON a.id = aa.amendment_id"
+           " JOIN corpus c ON c.id = a.corpus_id"
+           + (" JOIN matches m ON m.corpus_id = c.id JOIN base_laws b ON b.id = m.base_law_id"
+              if base_only else "")
+           + " WHERE aa.article = ?")
+    args = [normalize_article(article)]
+    if start:
+        sql += " AND a.date >= ?"
+        args.append(start)
+    if end:
+        sql += " AND a.date <= ?"
+        args.append(end)
+    return db.conn.execute(sql + " ORDER BY a.date, c.title", args).fetchall()
+
+
+def main(argv=None):
+    """메인 실행"""
+    from law_db import DB_PATH, LawDatabase
+
+    parser = argparse.ArgumentParser(description="개정문 조문 단위 색인")
+    parser.add_argument("--db", default=DB_PATH)
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("build", help="개정내역 전체 재색인")
+    p = sub.add_parser("query", help="조문 → 개정 법령")
+    p.add_argument("article")
+    p.add_argument("--from", dest="start")
+    p.add_argument("--to", dest="end")
+    p.add_argument("--base", action="store_true", help="기본법규 매칭 법령만")
+    args = parser.parse_args(argv)
+
+    with LawDatabase(args.db) as db:
+        if args.command == "build":
+            counts = db.reindex_amendments()
+            print(f"🧾 개정내역 {counts['amendments']:,}건 색인: 조문 {counts['articles']:,}, "
+                  f"용어 {counts['terms']:,}, 시행일 {counts['effective']:,}")
+            return 0
+        rows = laws_with_article(db, args.article, args.start, args.end, args.base)
+        print(f"🔎 {normalize_article(args.article)} 개정: {len(rows)}건")
+        for r in rows:
+            base = f" ← {r['base_law_id']} {r['base_title']}" if args.base else ""
+            print(f"   • {r['date']} {r['title']} [{r['op']}]{base}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
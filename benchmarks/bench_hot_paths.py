@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+핫 패스 마이크로 벤치마크 (회귀 감지)
+- 대상: scrape.categorize / is_amendment / yyyymmdd_to_iso / norm_lawtype / build_results,
+        ExactMatchingAnalyzer.normalize_law_name / find_exact_matches,
+        create_207_base_laws.determine_law_type / determine_ministry
+- 입력: docs/index.json + docs/2025_laws_complete.xlsx 에서 추출 (1× 및 확대 배수)
+- 결과는 초당 처리 건수(ops/s). 저장된 기준값 대비 임계치 이상 느려지면 실패(exit 1)
+- 비교값은 같은 실행 안의 기준 루프(reference_loop) 대비 상대 처리량 → 머신 부하/클럭 변동 상쇄
+  · 반복마다 기준 루프와 대상을 번갈아 측정, 비율의 중앙값 사용
+  · 반복 간 흩어짐(사분위 범위)을 잡음으로 보고 임계치에 더함 (잡음 하한 NOISE_FLOOR)
+
+사용법:
+  python benchmarks/bench_hot_paths.py                 # 측정 + 기준값 비교
+  python benchmarks/bench_hot_paths.py --save          # 기준값 갱신 (benchmarks/baseline.json)
+  python benchmarks/bench_hot_paths.py --threshold 0.3 --only categorize
+기준값은 측정한 머신에 종속되므로 같은 환경에서 비교할 것
+"""
+
+import argparse
+import contextlib
+import gc
+import io
+import json
+import os
+import platform
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "scraper"))
+
+BASELINE_PATH = os.path.join(ROOT, "benchmarks", "baseline.json")
+INDEX_JSON = os.path.join(ROOT, "docs", "index.json")
+CORPUS_XLSX = os.path.join(ROOT, "docs", "2025_laws_complete.xlsx")
+BASE_LAWS_JSON = os.path.join(ROOT, "docs", "base_laws_207.json")
+
+DEFAULT_THRESHOLD = 0.30   # 기준 대비 30% 이상 (상대) 처리량 감소 시 실패
+NOISE_FLOOR = 0.05         # 잡음 추정 하한 (임계치에 더함)
+MIN_TIME = 0.3             # 벤치마크 1회 최소 측정 시간(초)
+REF_TIME = 0.1             # 기준 루프 1회 최소 측정 시간(초)
+REPEATS = 7                # 반복 측정 후 중앙값 사용
+
+REF_WORDS = [f"법령 {i} 시행령" for i in range(2000)]
+
+
+def reference_loop():
+    """기준 루프: 문자열 치환 + dict 갱신 (대상 함수들과 비슷한 순수 파이썬 작업)"""
+    counts = {}
+    for word in REF_WORDS:
+        key = word.replace(" ", "").strip()
+        counts[key] = counts.get(key, 0) + len(key)
+    return counts
+
+
+def load_inputs():
+    """실데이터 기반 입력 (법령명, 부처, 날짜 원문, 개정구분, 후보 레코드)"""
+    import pandas as pd
+
+    with open(INDEX_JSON, "r", encoding="utf-8") as f:
+        index_items = json.load(f)["items"]
+    df = pd.read_excel(CORPUS_XLSX, sheet_name=0, dtype=str)
+    df = df.where(df.notna(), None)
+
+    titles = [it["title"] for it in index_items] + df["법령명"].dropna().tolist()
+    ministries = [it.get("ministry") or "" for it in index_items] + df["소관부처"].fillna("").tolist()
+    raw_dates = df["시행일자"].dropna().tolist() + [d.replace("-", "") for d in df["공포일자"].dropna()]
+    amend_texts = [f"{t} {a}" for t, a in zip(df["법령명"].fillna(""), df["제개정구분"].fillna(""))]
+    lawtypes = list(zip(df["법령명"].fillna(""), df["제개정구분"].fillna("")))
+    candidates = [{
+        "title": r["법령명"] or "",
+        "effectiveDate": r["시행일자"],
+        "lawType": r["제개정구분"] or "",
+        "categories": ["기타"],
+        "meta": {"ministry": r["소관부처"] or "", "lsId": r["법령ID"] or ""},
+        "source": {"name": "OpenAPI", "url": f"https://www.law.go.kr/LSW/lsInfoP.do?lsId={r['법령ID']}"},
+    } for r in df.to_dict("records")]
+
+    with open(BASE_LAWS_JSON, "r", encoding="utf-8") as f:
+        base_items = json.load(f)["items"]
+    return {
+        "titles": titles, "ministries": ministries, "raw_dates": raw_dates,
+        "amend_texts": amend_texts, "lawtypes": lawtypes, "candidates": candidates,
+        "corpus_df": df, "base_items": base_items,
+    }
+
+
+def scaled(seq, scale):
+    return list(seq) * scale
+
+
+def build_benchmarks(data):
+    """(이름, 배수 목록, setup(scale) → (실행 함수, 처리 건수))"""
+    import pandas as pd
+    import scrape
+    from create_207_base_laws import determine_law_type, determine_ministry
+    from exact_matching_analyzer import ExactMatchingAnalyzer
+
+    analyzer = ExactMatchingAnalyzer()
+
+    def per_item(func, seq_fn):
+        def setup(scale):
+            seq = seq_fn(scale)
+            return (lambda: [func(*x) if isinstance(x, tuple) else func(x) for x in seq]), len(seq)
+        return setup
+
+    def setup_categorize(scale):
+        pairs = scaled(zip(data["titles"], data["ministries"]), scale)
+        return (lambda: [scrape.categorize(t, m) for t, m in pairs]), len(pairs)
+
+    def setup_build_results(scale):
+        cands = scaled(data["candidates"], scale)
+        return (lambda: scrape.build_results(cands, 200)), len(cands)
+
+    def setup_build_results_all(scale):
+        cands = scaled(data["candidates"], scale)
+        return (lambda: scrape.build_results(cands)), len(cands)
+
+    def setup_ministry(scale):
+        pairs = scaled(((b["title"], b["categories"][0]) for b in data["base_items"]), scale * 10)
+        return (lambda: [determine_ministry(t, c) for t, c in pairs]), len(pairs)
+
+    def setup_find_exact(scale):
+        # 중첩 iterrows 구조라 당사 법규는 소수로 고정, 수집법령 규모만 확대
+        company = pd.DataFrame([{
+            "법규ID": b["id"], "법령명": b["title"], "직무카테고리": b["categories"][0],
+            "시행일자": b["effectiveDate"],
+        } for b in data["base_items"][:8]])
+        corpus = pd.concat([data["corpus_df"]] * scale, ignore_index=True)
+
+        def run():
+            analyzer.company_laws = company
+            analyzer.collected_laws = corpus
+            with contextlib.redirect_stdout(io.StringIO()):
+                analyzer.find_exact_matches()
+        return run, len(company) * len(corpus)
+
+    return [
+        ("scrape.categorize", (1, 10), setup_categorize),
+        ("scrape.is_amendment", (1, 10), per_item(scrape.is_amendment, lambda s: scaled(data["amend_texts"], s))),
+        ("scrape.yyyymmdd_to_iso", (1, 10), per_item(scrape.yyyymmdd_to_iso, lambda s: scaled(data["raw_dates"], s))),
+        ("scrape.norm_lawtype", (1, 10), per_item(scrape.norm_lawtype, lambda s: scaled(data["lawtypes"], s))),
+        ("scrape.build_results", (1, 10), setup_build_results),
+        ("scrape.build_results(전체)", (1, 10), setup_build_results_all),
+        ("ExactMatchingAnalyzer.normalize_law_name", (1, 10),
+         per_item(analyzer.normalize_law_name, lambda s: scaled(data["titles"], s))),
+        ("ExactMatchingAnalyzer.find_exact_matches", (1, 4), setup_find_exact),
+        ("determine_law_type", (1, 10),
+         per_item(determine_law_type, lambda s: scaled((b["title"] for b in data["base_items"]), s * 10))),
+        ("determine_ministry", (1, 10), setup_ministry),
+    ]
+
+
+def _ops(run, n_items, min_time):
+    loops, start = 0, time.perf_counter()
+    while True:
+        run()
+        loops += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return n_items * loops / elapsed
+
+
+def _quantile(values, q):
+    values = sorted(values)
+    pos = (len(values) - 1) * q
+    lo = int(pos)
+    hi = min(lo + 1, len(values) - 1)
+    return values[lo] + (values[hi] - values[lo]) * (pos - lo)
+
+
+def measure(run, n_items):
+    """기준 루프와 번갈아 REPEATS회 측정 → (처리량 중앙값, 상대 처리량 중앙값, 잡음). timeit처럼 GC 비활성
+
+    잡음: 상대 처리량의 사분위 범위 / 중앙값
+    """
+    ops, ratios = [], []
+    gc.collect()
+    gc.disable()
+    try:
+        run()  # 워밍업 (지연 import, 정규식 컴파일 캐시)
+        for _ in range(REPEATS):
+            ref = _ops(reference_loop, len(REF_WORDS), REF_TIME)
+            ops.append(_ops(run, n_items, MIN_TIME))
+            ratios.append(ops[-1] / ref)
+    finally:
+        gc.enable()
+    relative = _quantile(ratios, 0.5)
+    noise = (_quantile(ratios, 0.75) - _quantile(ratios, 0.25)) / relative
+    return _quantile(ops, 0.5), relative, noise
+
+
+def main():
+    parser = argparse.ArgumentParser(description="핫 패스 마이크로 벤치마크")
+    parser.add_argument("--save", action="store_true", help="측정값을 기준값으로 저장")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="허용 상대 처리량 감소율 (기본 0.30, 측정 잡음만큼 추가 허용)")
+    parser.add_argument("--only", help="이름에 포함된 벤치마크만 실행")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    args = parser.parse_args()
+
+    baseline, baseline_rel = {}, {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            saved = json.load(f)
+        baseline, baseline_rel = saved.get("results", {}), saved.get("relative", {})
+
+    print("⏱️  핫 패스 벤치마크")
+    print("=" * 78)
+    data = load_inputs()
+
+    results, relative, regressions = {}, {}, []
+    for name, scales, setup in build_benchmarks(data):
+        if args.only and args.only not in name:
+            continue
+        for scale in scales:
+            key = f"{name}@{scale}x"
+            run, n_items = setup(scale)
+            ops, rel, noise = measure(run, n_items)
+            results[key], relative[key] = round(ops, 1), round(rel, 4)
+
+            base = baseline_rel.get(key)
+            if base:
+                change = rel / base - 1
+                allowed = args.threshold + max(noise, NOISE_FLOOR)
+                mark = "❌" if change < -allowed else "✅"
+                if change < -allowed:
+                    regressions.append(key)
+                note = f"{mark} {change:+.1%} (허용 -{allowed:.0%}, 잡음 {noise:.1%})"
+            else:
+                note = "기준값 없음"
+            print(f"   {key:<48} {ops:>14,.0f} ops/s  {note}")
+
+    if args.save:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump({"python": platform.python_version(), "machine": platform.machine(),
+                       "results": dict(baseline, **results), "relative": dict(baseline_rel, **relative)},
+                      f, ensure_ascii=False, indent=2)
+        print(f"\n💾 기준값 저장: {os.path.relpath(args.baseline, ROOT)}")
+
+    if regressions and not args.save:
+        print(f"\n❌ 처리량 회귀 {len(regressions)}건 (임계치 -{args.threshold:.0%}): {', '.join(regressions)}")
+        return 1
+    print("\n✅ 회귀 없음")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+통합 CLI 기동 시간 측정
+- regrader_cli.py 하위 명령별 프로세스 기동~종료 시간 (중앙값/최소, ms)
+- 비교 기준: 빈 인터프리터, `import pandas`
+- 경량 경로(--help, health, 모듈 import)에서 pandas/openpyxl/requests가 로드되지 않는지 확인
+
+사용법:
+  python benchmarks/cli_startup.py [--runs 10]
+경량 경로에서 무거운 모듈이 로드되면 실패(exit 1)
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CLI = os.path.join(ROOT, "regrader_cli.py")
+HEAVY_MODULES = ("pandas", "numpy", "openpyxl", "requests")
+
+CASES = [
+    ("python (빈 인터프리터)", [sys.executable, "-c", "pass"]),
+    ("import pandas", [sys.executable, "-c", "import pandas"]),
+    ("regrader --help", [sys.executable, CLI, "--help"]),
+    ("regrader health", [sys.executable, CLI, "health"]),
+    ("regrader build-base --help", [sys.executable, CLI, "build-base", "--help"]),
+]
+
+# 경량 경로: 이 모듈들을 import 해도 무거운 모듈이 로드되면 안 됨
+LIGHT_IMPORTS = ("regrader_cli", "exact_matching_analyzer", "fast_law_collector",
+                 "law_db", "corpus_index", "incremental_matcher", "crawl_archive",
+                 "crawl_queue", "profiling_hooks", "index_snapshot", "law_alias_index")
+
+
+def time_command(cmd, runs):
+    """실행 시간 목록(ms)"""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(cmd, cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def loaded_heavy_modules(imports):
+    """imports 후 로드된 무거운 모듈 목록"""
+    code = (f"import sys; sys.path.insert(0, {ROOT!r}); sys.path.insert(0, {os.path.join(ROOT, 'scraper')!r})\n"
+            + "".join(f"import {m}\n" for m in imports)
+            + f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))")
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True)
+    if out.returncode != 0:
+        raise RuntimeError(out.stderr.strip())
+    return [m for m in out.stdout.strip().split(",") if m]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="통합 CLI 기동 시간 측정")
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    print("⏱️  CLI 기동 시간")
+    print("=" * 70)
+    for name, cmd in CASES:
+        samples = time_command(cmd, args.runs)
+        print(f"   {name:<32} 중앙값 {statistics.median(samples):>7.1f}ms   최소 {min(samples):>7.1f}ms")
+
+    print("\n🔍 경량 경로 무거운 모듈 로드 여부")
+    failed = False
+    for mod in LIGHT_IMPORTS:
+        heavy = loaded_heavy_modules([mod])
+        failed |= bool(heavy)
+        print(f"   {'❌' if heavy else '✅'} import {mod:<28} {', '.join(heavy) or '없음'}")
+
+    if failed:
+        print("\n❌ 경량 경로에서 무거운 모듈 로드됨")
+        return 1
+    print("\n✅ 경량 경로 pandas/openpyxl/requests 미로드")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+소관부처 보강 조회 비교 (scrape.fetch_ministry_from_*)
+- 로컬 HTTP 서버가 상세 페이지(lsInfoP.do)와 DRF 목록 응답(lawSearch.do)을 흉내냄
+  · 상세 페이지: 스크립트/스타일 머리말 + 소관부처 표 + 조문 본문 (--page-kb)
+  · DRF 목록: 법령명 검색 결과 20건 (같은 법령ID 1건 포함)
+- 방식별 법령 1건당 수신 바이트, 소요 시간, 결과 일치 여부
+  · full:   기존 방식 (상세 페이지 전체 수신 후 정규식)
+  · stream: 상세 페이지를 블록 단위로 읽다가 소관부처 셀 수신 즉시 중단
+  · api:    DRF 목록 응답에서 법령ID로 소관부처명
+- 수신 바이트는 scrape.http_get이 읽은 본문 크기 (아카이브 기록 훅으로 집계)
+
+사용법:
+  python benchmarks/ministry_lookup.py [--laws 50] [--page-kb 400]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "scraper"))
+
+# 로컬 서버 요청은 공유 속도 제한 상태와 분리 (측정값에 대기 시간이 섞이지 않도록)
+os.environ["RATE_LIMIT_DIR"] = tempfile.mkdtemp(prefix="ratelimit_")
+os.environ["RATE_LIMIT_RPS"] = "100000"
+os.environ["RATE_LIMIT_BURST"] = "100000"
+
+import scrape  # noqa: E402
+
+MINISTRIES = ("고용노동부", "환경부", "소방청", "금융위원회", "개인정보보호위원회")
+HEAD = "<script>var cfg = {};</script><link rel='stylesheet' href='/css/law.css'>" * 600
+ARTICLE = "<div class='pgroup'><p class='pty1_p4'>제{n}조(목적) 이 법은 …를 목적으로 한다.</p></div>"
+
+
+def article_body(page_kb):
+    """조문 본문 (법령 공통, page_kb 바이트 이상)"""
+    body, size, n = [], 0, 0
+    while size < page_kb * 1024:
+        n += 1
+        body.append(ARTICLE.format(n=n).encode("utf-8"))
+        size += len(body[-1])
+    return b"".join(body) + b"</div></body></html>"
+
+
+def detail_page(law_id, body):
+    ministry = MINISTRIES[law_id % len(MINISTRIES)]
+    head = (f"<html><head>{HEAD}</head><body><div class='ct_sub'><table>"
+            f"<tr><th>법령명</th><td>시험법 {law_id}</td></tr>"
+            f"<tr><th>소관부처</th><td class='ministry'>{ministry}</td></tr></table>")
+    return head.encode("utf-8") + body
+
+
+def search_response(title, law_id):
+    items = [{"법령일련번호": str(900000 + i), "법령명한글": f"{title} {i}", "법령ID": f"{law_id + i + 1:06d}",
+              "소관부처명": MINISTRIES[(law_id + i + 1) % len(MINISTRIES)], "제개정구분명": "일부개정"}
+             for i in range(scrape.MINISTRY_LOOKUP_DISPLAY - 1)]
+    items.insert(0, {"법령일련번호": "800000", "법령명한글": title, "법령ID": f"{law_id:06d}",
+                     "소관부처명": MINISTRIES[law_id % len(MINISTRIES)], "제개정구분명": "일부개정"})
+    return json.dumps({"LawSearch": {"totalCnt": str(len(items)), "law": items}},
+                      ensure_ascii=False).encode("utf-8")
+
+
+def make_handler(page_kb):
+    articles = article_body(page_kb)
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            parts = urllib.parse.urlsplit(self.path)
+            query = urllib.parse.parse_qs(parts.query)
+            if parts.path.endswith("lsInfoP.do"):
+                body, ctype = detail_page(int(query["lsId"][0]), articles), "text/html; charset=utf-8"
+            else:
+                title = query["query"][0]
+                body, ctype = search_response(title, int(title.rsplit(" ", 1)[1])), "application/json"
+            self.send_response(200)
+            self.send_header("Content-Type", ctype)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            try:
+                self.wfile.write(body)
+            except (BrokenPipeError, ConnectionResetError):
+                pass  # 클라이언트가 조기 종료
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+class ByteCounter:
+    """scrape.ARCHIVE 자리에 두고 http_get이 읽은 본문 크기만 집계"""
+
+    replay = False
+
+    def __init__(self):
+        self.bytes = 0
+
+    def record(self, key, raw, kind="http"):
+        if kind == "http":
+            self.bytes += len(raw)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="소관부처 보강 조회 비교")
+    parser.add_argument("--laws", type=int, default=50)
+    parser.add_argument("--page-kb", type=int, default=400, help="상세 페이지 크기(KB)")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(args.page_kb))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    scrape.OPENAPI = f"{base}/DRF/lawSearch.do"
+    scrape.DETAIL_URL = f"{base}/LSW/lsInfoP.do"
+
+    def full(law_id):
+        # 변경 전 방식: 본문 전체 수신
+        raw = scrape.http_get(f"{scrape.DETAIL_URL}?lsId={law_id}", timeout=30, retries=3)
+        return scrape.parse_ministry_html(raw.decode("utf-8", "ignore"))
+
+    methods = {
+        "full": full,
+        "stream": lambda law_id: scrape.fetch_ministry_from_html(f"{law_id:06d}"),
+        "api": lambda law_id: scrape.fetch_ministry_from_api(f"{law_id:06d}", f"시험법 {law_id}", "bench"),
+    }
+    expected = [MINISTRIES[i % len(MINISTRIES)] for i in range(1, args.laws + 1)]
+
+    print(f"🏛️  소관부처 보강 조회: 법령 {args.laws}건, 상세 페이지 {args.page_kb}KB")
+    print("=" * 70)
+    ok, baseline = True, None
+    try:
+        for name, fetch in methods.items():
+            counter = ByteCounter()
+            scrape.ARCHIVE = counter
+            start = time.perf_counter()
+            got = [fetch(i) for i in range(1, args.laws + 1)]
+            elapsed = time.perf_counter() - start
+            same = got == expected
+            ok &= same
+            per_law = counter.bytes / args.laws
+            baseline = baseline or per_law
+            print(f"   {name:<7} {per_law / 1024:9.1f}KB/건 ({per_law / baseline:6.1%})  "
+                  f"{elapsed / args.laws * 1000:7.2f}ms/건  {'✅ 일치' if same else '❌ 결과 다름'}")
+    finally:
+        scrape.ARCHIVE = None
+        server.shutdown()
+
+    if not ok:
+        print("\n❌ 조회 방식별 소관부처 결과가 다름")
+        return 1
+    print("\n✅ 모든 방식이 같은 소관부처 반환")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+다년도 비교 리포트 규모 측정 (multi_year_report.prepare + build_report)
+- 합성 연간 코퍼스: docs/index.json, docs/base_laws_207.json 법령명/부처 + 무작위 시행일자·개정유형
+  (연도마다 일부 법령은 빠지고 새 법령이 추가되어 신규/사라짐 집계가 0이 아님)
+- 연도 수(기본 10) × 연간 건수(기본 5,000) 처리 시간, 단계별(정리/리포트) 분리
+- 목표 시간(--budget 초) 초과 시 실패(exit 1)
+
+사용법:
+  python benchmarks/multi_year_scale.py [--years 10] [--per-year 5000] [--budget 10]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from exact_matching_analyzer import normalize_law_name  # noqa: E402
+from multi_year_report import COLUMNS, build_report, prepare  # noqa: E402
+
+INDEX_JSON = os.path.join(ROOT, "docs", "index.json")
+BASE_LAWS_JSON = os.path.join(ROOT, "docs", "base_laws_207.json")
+SUFFIXES = ("", " 시행령", " 시행규칙")
+AMEND_TYPES = ("일부개정", "타법개정", "전부개정", "제정", "폐지")
+
+
+def synthetic_years(years, per_year, seed=42):
+    import pandas as pd
+
+    with open(INDEX_JSON, "r", encoding="utf-8") as f:
+        index_items = json.load(f)["items"]
+    with open(BASE_LAWS_JSON, "r", encoding="utf-8") as f:
+        base_items = json.load(f)["items"]
+    stems = [it["title"] for it in index_items] + [b["title"] for b in base_items]
+    ministries = sorted({it.get("ministry") for it in index_items if it.get("ministry")})
+
+    rng = random.Random(seed)
+    pool = [f"{rng.choice(stems)} {i}{rng.choice(SUFFIXES)}" for i in range(per_year)]
+    rows = []
+    for year in range(2026 - years + 1, 2027):
+        # 매년 10%는 새 법령으로 교체
+        for i in rng.sample(range(len(pool)), len(pool) // 10):
+            pool[i] = f"{rng.choice(stems)} {year}-{i}{rng.choice(SUFFIXES)}"
+        for _ in range(per_year):
+            title = rng.choice(pool)
+            rows.append((title, f"{year}{rng.randint(1, 12):02d}{rng.randint(1, 28):02d}",
+                         rng.choice(AMEND_TYPES), None, rng.choice(ministries), f"y{year}"))
+    df = pd.DataFrame(rows, columns=["title", "effective_date", "amend_type", "category", "ministry", "dataset"])
+    df["norm_title"] = df["title"].map({t: normalize_law_name(t) for t in df["title"].unique()})
+    base = pd.DataFrame({"norm_title": [normalize_law_name(b["title"]) for b in base_items],
+                         "base_category": [(b.get("categories") or ["미분류"])[0] for b in base_items]})
+    return df[COLUMNS], base
+
+
+def main():
+    parser = argparse.ArgumentParser(description="다년도 비교 리포트 규모 측정")
+    parser.add_argument("--years", type=int, default=10)
+    parser.add_argument("--per-year", type=int, default=5000)
+    parser.add_argument("--budget", type=float, default=10.0, help="허용 시간(초)")
+    args = parser.parse_args()
+
+    raw, base = synthetic_years(args.years, args.per_year)
+    print(f"📈 다년도 비교: {args.years}개 연도 × {args.per_year:,}건 = {len(raw):,}건")
+    print("=" * 60)
+    start = time.perf_counter()
+    df = prepare(raw)
+    prepared = time.perf_counter()
+    report = build_report(df, base)
+    done = time.perf_counter()
+    total = done - start
+    changes = report["lawChanges"]
+    print(f"   정리(날짜/중복/분류): {prepared - start:6.2f}s")
+    print(f"   리포트(집계/비교):    {done - prepared:6.2f}s")
+    print(f"   전체:                 {total:6.2f}s ({len(raw) / total:,.0f}건/s)")
+    print(f"   분기 {len(report['quarters'])}개, 연도 비교 {len(changes)}개 "
+          f"(신규 합계 {sum(c['appeared'] for c in changes.values()):,}개)")
+    if total > args.budget:
+        print(f"\n❌ 허용 시간 {args.budget:.1f}s 초과")
+        return 1
+    print(f"\n✅ 허용 시간 {args.budget:.1f}s 이내")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
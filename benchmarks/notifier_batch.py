@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+법령 변경 알림 다이제스트 발송 측정 (notifier.send_digests → 로컬 SMTP 수신기)
+- 메모리 DB: docs/base_laws_207.json 기본법규 + 분기 내 합성 변경 버전 (law_versions)
+- 수신자 N명 (구독 카테고리 무작위 1~3개, 일부는 전체)
+- 1차 발송: 수신자당 다이제스트 1통, SMTP 연결 재사용 횟수, 섹션 렌더링 재사용률, 처리량
+- 2차 발송: 발송 이력으로 재발송 0통인지 확인 / 변경 추가 후 3차: 추가분만 발송
+- 수신기에 도착한 메시지 수·수신자가 기대와 다르면 실패(exit 1)
+
+사용법:
+  python benchmarks/notifier_batch.py [--recipients 300] [--changes 60]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from email import message_from_bytes, policy
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from law_db import LawDatabase  # noqa: E402
+from law_version_store import LawVersionStore  # noqa: E402
+from notifier import SMTPBatchSender, SMTPSink, send_digests  # noqa: E402
+
+BASE_LAWS_JSON = os.path.join(ROOT, "docs", "base_laws_207.json")
+START, END = "2026-01-01", "2026-03-31"
+
+
+def synthetic_versions(db, count, rng, month=1):
+    titles = [r["title"] for r in db.base_laws()]
+    return [{"title": t, "effective_date": f"2026-{month:02d}-{rng.randint(1, 28):02d}",
+             "amend_type": rng.choice(("일부개정", "타법개정")), "ministry": "환경부",
+             "serial_no": f"{month}{i:05d}"}
+            for i, t in enumerate(rng.sample(titles, count))]
+
+
+def synthetic_recipients(db, n, rng):
+    categories = sorted({r["category"] for r in db.base_laws() if r["category"]})
+    recipients = []
+    for i in range(n):
+        cats = [] if i % 10 == 0 else sorted(rng.sample(categories, rng.randint(1, 3)))
+        recipients.append({"email": f"user{i:04d}@example.com", "name": f"담당자{i}", "categories": cats})
+    return recipients
+
+
+def main():
+    parser = argparse.ArgumentParser(description="법령 변경 알림 다이제스트 발송 측정")
+    parser.add_argument("--recipients", type=int, default=300)
+    parser.add_argument("--changes", type=int, default=60)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    sink = SMTPSink()
+    port = sink.start_in_thread()
+
+    with LawDatabase(":memory:") as db:
+        db.import_base_laws(BASE_LAWS_JSON)
+        store = LawVersionStore(db)
+        store.ingest_records(synthetic_versions(db, args.changes, rng), "bench")
+        recipients = synthetic_recipients(db, args.recipients, rng)
+
+        print(f"📧 다이제스트 발송: 수신자 {len(recipients)}명, 기본법규 변경 {args.changes}건")
+        print("=" * 70)
+        ok = True
+        for label, extra in (("1차", 0), ("2차 (재실행)", 0), ("3차 (변경 추가)", 10)):
+            if extra:
+                store.ingest_records(synthetic_versions(db, extra, rng, month=3), "bench")
+            before = len(sink.messages)
+            sender = SMTPBatchSender("127.0.0.1", port, starttls=False)
+            start = time.perf_counter()
+            stats = send_digests(db, recipients, START, END, sender=sender)
+            elapsed = time.perf_counter() - start
+            received = sink.messages[before:]
+            to = sorted(m["to"][0] for m in received)
+            ok &= len(received) == stats["sent"] == len(set(to))
+            if label.startswith("2차"):
+                ok &= stats["sent"] == 0
+            print(f"   {label:<14} 발송 {stats['sent']:>4}통 / 변경 {stats['items']:>5}건  "
+                  f"연결 {stats.get('connections', 0)}회  섹션 렌더링 {stats.get('sectionsRendered', 0)}회  "
+                  f"{elapsed:6.2f}s ({stats['sent'] / elapsed if elapsed else 0:,.0f}통/s)")
+
+        sample = message_from_bytes(sink.messages[0]["data"], policy=policy.default) if sink.messages else None
+        total = db.conn.execute("SELECT COUNT(*) FROM notification_deliveries").fetchone()[0]
+    print(f"\n   발송 이력 {total:,}건, SMTP 세션 {sink.sessions}회")
+    if sample is not None:
+        print(f"   예시 제목: {sample['Subject']}")
+    if not ok:
+        print("\n❌ 수신 메시지 수/수신자 또는 재발송 방지 결과가 기대와 다름")
+        return 1
+    print("\n✅ 수신자당 1통, 재실행 시 재발송 없음, 추가 변경만 발송")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
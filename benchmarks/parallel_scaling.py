@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+병렬 파싱/분류 확장성 측정 (parallel_parse.process_records)
+- 합성 코퍼스: docs/index.json, docs/base_laws_207.json 의 법령명/부처/개정문으로 N건 생성
+  (일부는 소관부처 없이 상세 페이지 HTML 포함, 일부는 개정문 포함)
+- 워커 수 1, 2, 4, … CPU 수까지 처리 시간, 속도 향상, 효율(속도 향상 / 워커 수)
+- 모든 워커 수에서 결과가 순차 처리와 동일한지(순서 포함) 확인, 다르면 실패(exit 1)
+
+사용법:
+  python benchmarks/parallel_scaling.py [--records 100000] [--workers 1,2,4,8] [--chunk 2000]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from parallel_parse import DEFAULT_CHUNK, process_records  # noqa: E402
+
+INDEX_JSON = os.path.join(ROOT, "docs", "index.json")
+BASE_LAWS_JSON = os.path.join(ROOT, "docs", "base_laws_207.json")
+
+DETAIL_HTML = ("<html><body>" + "<div class='pad'>본문</div>" * 200
+               + "<table><tr><th>소관부처</th><td class='v'>{ministry}</td></tr></table></body></html>")
+SUFFIXES = ("", " 시행령", " 시행규칙")
+AMEND_TYPES = ("일부개정", "타법개정", "전부개정", "")
+
+
+def synthetic_corpus(n, seed=42):
+    """실데이터 조각을 섞은 OpenAPI 형태 원본 레코드 n건 (seed 고정 → 재현 가능)"""
+    with open(INDEX_JSON, "r", encoding="utf-8") as f:
+        index_items = json.load(f)["items"]
+    with open(BASE_LAWS_JSON, "r", encoding="utf-8") as f:
+        base_items = json.load(f)["items"]
+    titles = [it["title"] for it in index_items] + [b["title"] for b in base_items]
+    ministries = sorted({it.get("ministry") for it in index_items if it.get("ministry")})
+    bodies = [a["reason"] for it in index_items for a in it.get("amendments") or [] if a.get("reason")]
+
+    rng = random.Random(seed)
+    records = []
+    for i in range(n):
+        title = rng.choice(titles) + rng.choice(SUFFIXES)
+        ministry = rng.choice(ministries)
+        rec = {
+            "법령명한글": title,
+            "시행일자": f"2026{rng.randint(1, 12):02d}{rng.randint(1, 28):02d}",
+            "제개정구분명": rng.choice(AMEND_TYPES),
+            "법령ID": f"{i:06d}",
+            "소관부처명": ministry,
+        }
+        roll = rng.random()
+        if roll < 0.2:
+            rec["소관부처명"] = ""
+            rec["detailHtml"] = DETAIL_HTML.format(ministry=ministry)
+        elif roll < 0.4:
+            rec["개정문"] = rng.choice(bodies)
+        records.append(rec)
+    return records
+
+
+def main():
+    cpus = os.cpu_count() or 1
+    default_workers = sorted({1, 2, 4, 8, cpus} & set(range(1, cpus + 1))) or [1]
+    parser = argparse.ArgumentParser(description="병렬 파싱/분류 확장성 측정")
+    parser.add_argument("--records", type=int, default=100_000)
+    parser.add_argument("--workers", default=",".join(map(str, default_workers)))
+    parser.add_argument("--chunk", type=int, default=DEFAULT_CHUNK)
+    args = parser.parse_args()
+
+    records = synthetic_corpus(args.records)
+    print(f"⚙️  병렬 파싱/분류: 합성 레코드 {len(records):,}건, CPU {cpus}개")
+    print("=" * 70)
+
+    baseline = None
+    serial_time = None
+    ok = True
+    worker_counts = sorted({1} | {int(w) for w in args.workers.split(",")})  # 1 = 순차 기준
+    for workers in worker_counts:
+        start = time.perf_counter()
+        result = process_records(records, workers=workers, chunksize=args.chunk)
+        elapsed = time.perf_counter() - start
+        if baseline is None:
+            baseline, serial_time = result, elapsed
+        same = result == baseline
+        ok &= same
+        speedup = serial_time / elapsed
+        print(f"   워커 {workers:>2}: {elapsed:7.2f}s  {len(records) / elapsed:>9,.0f}건/s  "
+              f"×{speedup:4.2f} (효율 {speedup / workers:4.0%})  {'✅ 동일' if same else '❌ 결과 다름'}")
+
+    if worker_counts[-1] > cpus:
+        print(f"\n⚠️  CPU {cpus}개: 워커 수가 CPU 수를 넘으면 속도 향상 없음")
+    if not ok:
+        print("\n❌ 병렬 결과가 순차 처리와 다름")
+        return 1
+    print("\n✅ 모든 워커 수에서 순차 처리와 동일한 결과 (순서 포함)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
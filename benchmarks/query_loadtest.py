@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+법령 조회 API 부하 테스트
+- keep-alive 연결 N개로 동시 요청, 초당 처리량(requests/sec) 측정
+- --spawn: 테스트용 서버를 별도 프로세스로 띄운 뒤 측정
+
+사용법: python benchmarks/query_loadtest.py --spawn --concurrency 64 --duration 10
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import subprocess
+import sys
+import time
+from urllib.parse import quote
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+QUERIES = [
+    "/api/laws",
+    "/api/laws?category=" + quote("환경"),
+    "/api/laws?category=" + quote("재무회계") + "&quarter=2026-Q1",
+    "/api/laws?status=" + quote("시행예정") + "&sort=effectiveDate",
+    "/api/laws?amendType=" + quote("타법개정") + "&page=2&size=10",
+    "/api/laws?q=" + quote("근로") + "&sort=title",
+    "/api/laws?ministry=" + quote("고용노동부"),
+    "/api/facets",
+]
+
+
+async def worker(host, port, deadline, stats):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while time.perf_counter() < deadline:
+            path = random.choice(QUERIES)
+            writer.write(f"GET {path} HTTP/1.1\r\nHost: {host}\r\n\r\n".encode("latin-1"))
+            await writer.drain()
+            status = await reader.readline()
+            length = 0
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b""):
+                    break
+                if line.lower().startswith(b"content-length:"):
+                    length = int(line.split(b":")[1])
+            await reader.readexactly(length)
+            stats["ok" if b" 200 " in status or b" 304 " in status else "error"] += 1
+            stats["bytes"] += length
+    finally:
+        writer.close()
+
+
+async def run(host, port, concurrency, duration):
+    stats = {"ok": 0, "error": 0, "bytes": 0}
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(host, port, start + duration, stats) for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    return stats, elapsed
+
+
+async def wait_port(host, port, timeout=15):
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        try:
+            _, writer = await asyncio.open_connection(host, port)
+            writer.close()
+            return True
+        except OSError:
+            await asyncio.sleep(0.1)
+    return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description="법령 조회 API 부하 테스트")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--spawn", action="store_true", help="테스트용 서버 실행")
+    args = parser.parse_args()
+
+    proc = None
+    if args.spawn:
+        proc = subprocess.Popen(
+            [sys.executable, os.path.join(ROOT, "law_query_server.py"),
+             "--host", args.host, "--port", str(args.port)], cwd=ROOT)
+    try:
+        if not asyncio.run(wait_port(args.host, args.port)):
+            print(f"❌ 서버 연결 실패: {args.host}:{args.port}")
+            return 1
+        print(f"🚀 부하 테스트: 동시 연결 {args.concurrency}개, {args.duration:.0f}초")
+        stats, elapsed = asyncio.run(run(args.host, args.port, args.concurrency, args.duration))
+        total = stats["ok"] + stats["error"]
+        print(f"   • 요청: {total:,}건 (오류 {stats['error']:,}건)")
+        print(f"   • 처리량: {total / elapsed:,.0f} requests/sec")
+        print(f"   • 평균 응답 크기: {stats['bytes'] / max(total, 1):,.0f} bytes")
+        return 0 if stats["error"] == 0 else 1
+    finally:
+        if proc:
+            proc.terminate()
+            proc.wait()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+스크랩 단계별 실행(scrape.run) vs 파이프라인(scrape.run_pipelined) 비교
+- 로컬 HTTP 서버가 OpenAPI 시행법령 목록(target=eflaw, 페이지당 100건)과 소관부처 조회
+  (target=law 법령명 검색)를 흉내냄. 요청마다 지연(--page-ms, --lookup-ms)
+  · 일부 항목은 소관부처가 비어 있고 제목 규칙에도 걸리지 않아 보강(소관부처 조회) 대상
+- 방식별 경과 시간, 파이프라인 단계별 처리량(작업/입력 대기/출력 대기)
+- 두 방식 결과(generatedAt 제외)가 다르면 실패(exit 1)
+
+사용법:
+  python benchmarks/scrape_pipeline.py [--pages 20] [--page-ms 150] [--lookup-ms 100] [--queue 4]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "scraper"))
+
+# 로컬 서버 요청은 공유 속도 제한 상태와 분리 (측정값에 대기 시간이 섞이지 않도록)
+os.environ["RATE_LIMIT_DIR"] = tempfile.mkdtemp(prefix="ratelimit_")
+os.environ["RATE_LIMIT_RPS"] = "100000"
+os.environ["RATE_LIMIT_BURST"] = "100000"
+
+import scrape  # noqa: E402
+
+INDEX_JSON = os.path.join(ROOT, "docs", "index.json")
+TODAY = "2026-06-30"
+MINISTRIES = ("고용노동부", "환경부", "소방청", "금융위원회", "국토교통부")
+AMEND_TYPES = ("일부개정", "타법개정", "전부개정", "제정")
+
+
+def synthetic_laws(pages, seed=11):
+    """OpenAPI 원본 항목 (마지막 페이지는 100건 미만)"""
+    with open(INDEX_JSON, "r", encoding="utf-8") as f:
+        stems = [it["title"] for it in json.load(f)["items"]]
+    rng = random.Random(seed)
+    laws = []
+    for i in range(pages * 100 - 37):
+        if i % 7 == 0:
+            # 제목 규칙·소관부처로 분류되지 않는 항목 → 보강 대상
+            title, ministry = f"시험 특별법 {i}", ""
+        else:
+            title, ministry = f"{rng.choice(stems)} {i}", rng.choice(MINISTRIES)
+        laws.append({"법령일련번호": str(100000 + i), "법령ID": f"{i + 1:06d}", "법령명한글": title,
+                     "시행일자": f"2026{rng.randint(1, 12):02d}{rng.randint(1, 28):02d}",
+                     "제개정구분명": rng.choice(AMEND_TYPES), "소관부처명": ministry})
+    return laws
+
+
+def make_handler(laws, page_ms, lookup_ms):
+    by_title = {law["법령명한글"]: law for law in laws}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            query = urllib.parse.parse_qs(urllib.parse.urlsplit(self.path).query)
+            if query.get("target") == ["eflaw"]:
+                time.sleep(page_ms / 1000)
+                display, page = int(query["display"][0]), int(query["page"][0])
+                items = laws[(page - 1) * display:page * display]
+                data = {"LawSearch": {"totalCnt": str(len(laws)), "law": items}}
+            else:
+                time.sleep(lookup_ms / 1000)
+                law = by_title.get((query.get("query") or [""])[0])
+                items = [dict(law, 소관부처명=MINISTRIES[int(law["법령ID"]) % len(MINISTRIES)])] if law else []
+                data = {"LawSearch": {"totalCnt": str(len(items)), "law": items}}
+            body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+def timed_in_tempdir(fn):
+    """소관부처 캐시(docs/_debug)가 방식 간에 공유되지 않도록 빈 작업 디렉터리에서 실행"""
+    cwd = os.getcwd()
+    os.chdir(tempfile.mkdtemp(prefix="scrape_pipeline_"))
+    try:
+        start = time.perf_counter()
+        result = fn()
+        return result, time.perf_counter() - start
+    finally:
+        os.chdir(cwd)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="스크랩 단계별 실행 vs 파이프라인 비교")
+    parser.add_argument("--pages", type=int, default=20, help="OpenAPI 페이지 수 (페이지당 100건)")
+    parser.add_argument("--page-ms", type=float, default=150, help="목록 페이지 응답 지연(ms)")
+    parser.add_argument("--lookup-ms", type=float, default=100, help="소관부처 조회 응답 지연(ms)")
+    parser.add_argument("--queue", type=int, default=scrape.PIPELINE_QUEUE_SIZE, help="단계 간 큐 크기(묶음)")
+    args = parser.parse_args()
+
+    laws = synthetic_laws(args.pages)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(laws, args.page_ms, args.lookup_ms))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    scrape.OPENAPI = f"{base}/DRF/lawSearch.do"
+    scrape.DETAIL_URL = f"{base}/LSW/lsInfoP.do"
+    scrape.ARCHIVE = None
+
+    print(f"🧵 스크랩 파이프라인: OpenAPI {len(laws):,}건 ({args.pages}페이지 × {args.page_ms:.0f}ms), "
+          f"소관부처 조회 {args.lookup_ms:.0f}ms, 큐 {args.queue}묶음")
+    print("=" * 70)
+    stats = {}
+    try:
+        phased, phased_s = timed_in_tempdir(lambda: scrape.run("bench", today=TODAY))
+        piped, piped_s = timed_in_tempdir(
+            lambda: scrape.run_pipelined("bench", today=TODAY, queue_size=args.queue, stats=stats))
+    finally:
+        server.shutdown()
+
+    same = ({k: v for k, v in phased.items() if k != "generatedAt"}
+            == {k: v for k, v in piped.items() if k != "generatedAt"})
+    print(f"   단계별 실행   {phased_s:6.2f}s  결과 {phased['totalCount']:,}건")
+    print(f"   파이프라인    {piped_s:6.2f}s  결과 {piped['totalCount']:,}건  ({phased_s / piped_s:.2f}배)")
+    print("\n   단계     입력 →   출력   작업(s)  입력대기(s)  출력대기(s)   처리량")
+    for st in stats["stages"]:
+        rate = f"{st['perSec']:,.0f}건/s" if st["perSec"] else "-"
+        print(f"   {st['stage']:<7} {st['in']:>5,} → {st['out']:>5,}  {st['busy']:8.2f}  {st['waited']:11.2f}  "
+              f"{st['blocked']:11.2f}  {rate:>10}")
+    if not same:
+        print("\n❌ 파이프라인 결과가 단계별 실행과 다름")
+        return 1
+    print("\n✅ 파이프라인 결과가 단계별 실행과 동일")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
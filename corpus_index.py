@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+수집법령 인덱스
+- 정규화 법령명 → 수집법령 레코드 (O(1) 조회)
+- 법령명 별칭(law_alias_index) 적용: 제명이 바뀐 법령은 이전/현재 이름 어느 쪽으로도 조회
+- 법령 DB(law_db) / 수집 Excel / 레코드 목록에서 생성
+- cached_from_excel / cached_from_db: 인덱스 스냅샷(index_snapshot) 재사용 → 재시작 시 재구축 생략
+"""
+
+import os
+
+import exact_matching_analyzer
+import law_alias_index
+from exact_matching_analyzer import normalize_law_name
+from law_alias_index import AliasIndex
+from law_db import DB_PATH, LawDatabase
+
+# 인덱스 생성 코드 (변경 시 스냅샷 무효화)
+INDEX_CODE = (os.path.abspath(__file__), exact_matching_analyzer.__file__, law_alias_index.__file__)
+
+DEFAULT_DATASET = "2025_laws_complete"
+COLLECTED_DATASET = "collected"  # FastLawCollector / crawl_queue merge 적재분
+
+# law_db corpus 컬럼 → 수집법령 레코드 키 (수집 Excel 컬럼명)
+DB_FIELD_MAP = {
+    "ls_id": "법령ID",
+    "serial_no": "법령일련번호",
+    "title": "법령명",
+    "law_type": "법령종류",
+    "amend_type": "제개정구분",
+    "effective_date": "시행일자",
+    "announced_date": "공포일자",
+    "ministry": "소관부처",
+    "status": "법령상태",
+    "source": "수집소스",
+}
+
+
+
+def default_dataset(db):
+    """매칭 기본 수집법령 데이터셋: 수집기 적재분(collected)이 있으면 그것, 없으면 2025_laws_complete"""
+    if db.conn.execute("SELECT 1 FROM corpus WHERE dataset = ? LIMIT 1", (COLLECTED_DATASET,)).fetchone():
+        return COLLECTED_DATASET
+    return DEFAULT_DATASET
+
+class CorpusIndex:
+    """정규화 법령명 기준 수집법령 인덱스"""
+
+    def __init__(self, records, dataset=None, aliases=None):
+        self.records = []
+        self.by_name = {}
+        self.dataset = dataset  # 법령 DB 데이터셋 (from_db로 생성한 경우)
+        self.aliases = aliases  # law_alias_index.AliasIndex (없으면 정규화 법령명 그대로)
+        for rec in records:
+            self.add(rec)
+
+    def add(self, rec):
+        """레코드 추가 (위치 반환)"""
+        pos = len(self.records)
+        self.records.append(rec)
+        name = self.key(rec.get("법령명"))
+        if name:
+            self.by_name.setdefault(name, []).append(pos)
+        return pos
+
+    def key(self, law_name):
+        """색인 키: 정규화 법령명 → 별칭이면 현재 법령명"""
+        if self.aliases is not None:
+            return self.aliases.canonical(law_name)
+        return normalize_law_name(law_name)
+
+    def lookup(self, law_name):
+        """정규화 법령명 완전 일치 레코드 목록 (별칭 포함)"""
+        return [self.records[p] for p in self.by_name.get(self.key(law_name), ())]
+
+    def __len__(self):
+        return len(self.records)
+
+    @classmethod
+    def from_db(cls, db=None, dataset=DEFAULT_DATASET):
+        """법령 DB corpus 테이블에서 생성 (레코드에 corpus_id 포함, 별칭은 law_aliases)"""
+        own = db is None
+        db = db or LawDatabase(DB_PATH)
+        try:
+            aliases = AliasIndex.load(db)
+            records = []
+            for row in db.query_corpus(dataset=dataset):
+                rec = {label: row[col] for col, label in DB_FIELD_MAP.items()}
+                rec["corpus_id"] = row["id"]
+                records.append(rec)
+        finally:
+            if own:
+                db.close()
+        return cls(records, dataset, aliases)
+
+    @classmethod
+    def from_excel(cls, path, sheet_name=0):
+        """수집 Excel(2025_Laws_Complete_*.xlsx 등)에서 생성 (별칭: 법령 DB + 파일 내 법령ID 연속성)"""
+        import pandas as pd
+
+        df = pd.read_excel(path, sheet_name=sheet_name, dtype=str)
+        records = df.where(df.notna(), None).to_dict("records")
+        for rec in records:
+            # 2025_laws_complete.xlsx는 법령구분, FastLawCollector 결과는 법령종류
+            rec.setdefault("법령종류", rec.get("법령구분"))
+        return cls(records, aliases=AliasIndex.from_records(records, AliasIndex.load()))
+
+    @classmethod
+    def cached_from_excel(cls, path, sheet_name=0):
+        """from_excel + 스냅샷 (Excel 파일 해시·법령 DB 별칭이 같으면 파싱/정규화 생략)"""
+        from index_snapshot import aliases_fingerprint, cached
+
+        return cached("corpus", f"excel:{os.path.abspath(path)}:{sheet_name}", [path, *INDEX_CODE],
+                      lambda: cls.from_excel(path, sheet_name), fingerprint=aliases_fingerprint())
+
+    @classmethod
+    def cached_from_db(cls, db, dataset=DEFAULT_DATASET):
+        """from_db + 스냅샷 (데이터셋 지문이 같으면 조회/정규화 생략)"""
+        from index_snapshot import cached, db_fingerprint
+
+        return cached("corpus", f"db:{os.path.abspath(db.path)}:{dataset}", list(INDEX_CODE),
+                      lambda: cls.from_db(db, dataset), fingerprint=db_fingerprint(db, dataset))
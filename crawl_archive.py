@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+수집 기록/재처리 아카이브
+- 수집 1회 = 압축 아카이브 1개 (zip/deflate, 키 → 멤버 인덱스 포함)
+- 원본 응답(OpenAPI/RSS/상세페이지)을 키(URL)별로 기록
+- 재처리: 네트워크 없이 아카이브에서 응답을 읽어 파싱/분류/매칭/게시 재실행
+- 기록/조회는 잠금으로 직렬화 (scrape.py 파이프라인의 수집·보강 스레드가 동시에 기록)
+- 비정상 종료 대비: 메타(meta.json)와 응답별 키(<멤버>.key)를 기록 즉시 함께 저장
+  · 종료 시 index.json 기록, 없으면 읽을 때 키 멤버로 인덱스 재구성
+  · zip 중앙 디렉터리가 없는(기록 중 중단된) 파일은 로컬 헤더를 순서대로 읽어 완전한 멤버만 복구
+
+사용법:
+  python crawl_archive.py list data/archive/scrape_20260101_000000.zip
+  python crawl_archive.py reprocess data/archive/scrape_20260101_000000.zip [출력.json] [--publish]
+    --publish: 재처리 결과(기본 docs/index.json)를 게시 산출물로 (publish_artifacts, scrape 아카이브)
+"""
+
+import json
+import os
+import struct
+import sys
+import threading
+import zipfile
+import zlib
+from datetime import datetime
+
+ARCHIVE_DIR = os.environ.get("LAW_ARCHIVE_DIR", "data/archive")
+INDEX_MEMBER = "index.json"
+META_MEMBER = "meta.json"
+KEY_SUFFIX = ".key"
+LOCAL_HEADER = struct.Struct("<IHHHHHIIIHH")  # zip 로컬 파일 헤더 (30바이트)
+
+
+class _SalvagedZip:
+    """중앙 디렉터리가 없는 zip (기록 중 중단): 로컬 헤더를 앞에서부터 읽어 완전한 멤버만 복구"""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            data = f.read()
+        self.members = {}
+        pos = 0
+        while pos + LOCAL_HEADER.size <= len(data):
+            sig, _, flags, method, _, _, crc, csize, _, name_len, extra_len = \
+                LOCAL_HEADER.unpack_from(data, pos)
+            start = pos + LOCAL_HEADER.size + name_len + extra_len
+            if sig != 0x04034B50 or flags & 0x08 or start + csize > len(data):
+                break  # 헤더 아님 / 크기 미기록 / 잘린 멤버
+            name = data[pos + LOCAL_HEADER.size:pos + LOCAL_HEADER.size + name_len]
+            raw = data[start:start + csize]
+            try:
+                if method == zipfile.ZIP_DEFLATED:
+                    raw = zlib.decompress(raw, -15)
+            except zlib.error:
+                break
+            if zlib.crc32(raw) != crc:
+                break
+            self.members[name.decode("utf-8" if flags & 0x800 else "cp437")] = raw
+            pos = start + csize
+
+    def namelist(self):
+        return list(self.members)
+
+    def read(self, name):
+        return self.members[name]
+
+    def close(self):
+        self.members = {}
+
+
+class CrawlArchive:
+    """수집 응답 아카이브 (기록 모드 'w' / 재생 모드 'r')"""
+
+    def __init__(self, path, mode="r", meta=None):
+        self.path = path
+        self.mode = mode
+        self.replay = mode == "r"
+        self._lock = threading.Lock()
+        self._seq = 0  # 기록 멤버 번호
+        self.recovered = False  # index.json 없이 키 멤버로 인덱스 재구성
+        if self.replay:
+            try:
+                self._zip = zipfile.ZipFile(path, "r")
+            except zipfile.BadZipFile:
+                self._zip = _SalvagedZip(path)
+            if INDEX_MEMBER in self._zip.namelist():
+                index = json.loads(self._zip.read(INDEX_MEMBER).decode("utf-8"))
+                self.meta = index.get("meta", {})
+                self.entries = index.get("entries", {})
+            else:
+                self._recover_index()
+        else:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            self._zip = zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=6)
+            self.meta = dict(meta or {}, createdAt=datetime.now().isoformat(timespec="seconds"))
+            self.entries = {}
+            self._zip.writestr(META_MEMBER, json.dumps(self.meta, ensure_ascii=False))
+
+    def _recover_index(self):
+        """index.json 없음 (종료 전 중단) → meta.json + 키 멤버로 인덱스 재구성 (멤버 순서 = 기록 순서)"""
+        self.recovered = True
+        names = self._zip.namelist()
+        self.meta = json.loads(self._zip.read(META_MEMBER).decode("utf-8")) if META_MEMBER in names else {}
+        self.entries = {}
+        for name in sorted(n for n in names if n.endswith(KEY_SUFFIX)):
+            try:
+                entry = json.loads(self._zip.read(name).decode("utf-8"))
+            except ValueError:
+                continue
+            if entry.get("member") in names:
+                self.entries[entry.pop("key")] = entry
+
+    @classmethod
+    def new_run(cls, source, meta=None, archive_dir=ARCHIVE_DIR):
+        """수집 실행별 신규 아카이브 (archive_dir가 비어 있으면 기록 안 함)"""
+        if not archive_dir:
+            return None
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        path = os.path.join(archive_dir, f"{source}_{stamp}.zip")
+        return cls(path, "w", dict(meta or {}, source=source))
+
+    def record(self, key, raw, kind="http"):
+        """응답 기록 (같은 키는 마지막 응답 유지)"""
+        if self.replay or raw is None:
+            return
+        with self._lock:
+            member = f"{self._seq:06d}_{kind}"
+            self._seq += 1
+            self._zip.writestr(member, raw)
+            entry = {"member": member, "kind": kind, "size": len(raw),
+                     "at": datetime.now().isoformat(timespec="seconds")}
+            self._zip.writestr(member + KEY_SUFFIX, json.dumps(dict(entry, key=key), ensure_ascii=False))
+            self.entries[key] = entry
+
+    def get(self, key):
+        """기록된 응답 (없으면 None)"""
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        with self._lock:
+            return self._zip.read(entry["member"])
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def close(self):
+        if self._zip is None:
+            return
+        if not self.replay:
+            self._zip.writestr(INDEX_MEMBER, json.dumps(
+                {"meta": self.meta, "entries": self.entries}, ensure_ascii=False, indent=1))
+        self._zip.close()
+        self._zip = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def reprocess_scrape(archive, output_path=None, publish=False):
+    """scrape.py 파싱/분류를 아카이브로 재실행 (publish: 출력 파일을 게시 산출물로)"""
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "scraper"))
+    import scrape
+
+    if publish and not output_path:
+        output_path = os.path.join("docs", "index.json")
+    scrape.ARCHIVE = archive
+    result = scrape.run(archive.meta.get("oc"), today=archive.meta.get("today"))
+    text = json.dumps(result, ensure_ascii=False, indent=2)
+    if output_path:
+        with open(output_path, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        print(text)
+    if publish:
+        publish_output(output_path)
+    return result
+
+
+def publish_output(output_path):
+    """재처리 출력이 있는 디렉터리의 게시 산출물 갱신 (매니페스트의 다른 산출물 항목 유지)"""
+    from publish_artifacts import ARTIFACTS, publish
+
+    name = os.path.basename(output_path)
+    artifacts = ARTIFACTS if name in ARTIFACTS else ARTIFACTS + (name,)
+    for name, entry in publish(os.path.dirname(output_path) or ".", artifacts).items():
+        print(f"   📦 {name} → {entry['path']} (gz {entry['gzipBytes']:,} bytes)", file=sys.stderr)
+
+
+def reprocess_collector(archive, base_laws_path="docs/base_laws_207.json"):
+    """FastLawCollector 수집 + 기본법규 매칭을 아카이브로 재실행"""
+    from corpus_index import CorpusIndex
+    from fast_law_collector import FastLawCollector
+    from incremental_matcher import IncrementalMatcher
+    from multi_tenant_matcher import load_company_laws
+
+    collector = FastLawCollector(archive=archive)
+    df = collector.collect_all_laws()
+    corpus = CorpusIndex(df.to_dict("records"))
+    matcher = IncrementalMatcher(corpus, load_company_laws(base_laws_path))
+    summary = matcher.aggregates.summary()
+    print(f"\n🎯 재처리 매칭: {summary['total']}개 (분기별 {summary['quarters']})")
+    return collector, matcher
+
+
+def main():
+    """메인 실행"""
+
+    publish = "--publish" in sys.argv[1:]
+    argv = [a for a in sys.argv[1:] if a != "--publish"]
+    if len(argv) < 2 or argv[0] not in ("list", "reprocess"):
+        print(__doc__)
+        return 1
+
+    with CrawlArchive(argv[1], "r") as archive:
+        if archive.recovered:
+            print(f"⚠️  index.json 없음 (수집 중단) → 키 멤버로 재구성: 응답 {len(archive.entries)}건",
+                  file=sys.stderr)
+        if argv[0] == "list":
+            print(f"📦 {archive.path}")
+            print(f"   메타: {json.dumps(archive.meta, ensure_ascii=False)}")
+            total = sum(e["size"] for e in archive.entries.values())
+            print(f"   응답 {len(archive.entries)}건, 원본 {total:,} bytes, "
+                  f"압축 {os.path.getsize(archive.path):,} bytes")
+            for key, entry in archive.entries.items():
+                print(f"   • [{entry['kind']}] {entry['size']:>9,}  {key}")
+        elif archive.meta.get("source") == "collector":
+            if publish:
+                print("❌ --publish는 scrape 아카이브용 (collector 결과는 DB 적재 후 regrader_cli.py publish)",
+                      file=sys.stderr)
+                return 1
+            reprocess_collector(archive)
+        else:
+            reprocess_scrape(archive, argv[2] if len(argv) > 2 else None, publish)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
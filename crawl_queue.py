@@ -0,0 +1,385 @@
+#!/usr/bin/env python3
+"""
+분산 수집 작업 큐
+- 코디네이터: 수집 작업을 (target × 시행일자 구간 × 페이지 구간) 샤드로 분할하여 큐에 등록
+- 워커: 샤드를 리스(lease)로 점유 → 페이지 수집 → 결과 저장. 리스 만료 시 다른 워커가 재점유
+- 실패 샤드는 지수 백오프로 재시도, max_attempts 초과 시 failed
+- 마지막 페이지가 가득 찬 샤드는 다음 페이지 구간 샤드를 추가 등록 (전체 페이지 수 사전 조회 불필요)
+- 요청 속도는 fetch_page의 공유 속도 제한(rate_limiter)이 워커 전체에 걸쳐 조절
+- 큐 백엔드는 교체 가능 (QueueBackend). 기본 구현: SQLite 파일 (단일 호스트 다중 프로세스)
+
+사용법:
+  python crawl_queue.py plan 2025-backfill --year 2025 [--targets law,eflaw] [--months 1] [--pages 5]
+  python crawl_queue.py work 2025-backfill [--worker-id w1] [--lease 120]   (프로세스/노드 수만큼 실행)
+  python crawl_queue.py status 2025-backfill
+  python crawl_queue.py merge 2025-backfill [--dataset collected]
+큐 위치: --queue sqlite:///data/crawl_queue.db (또는 CRAWL_QUEUE 환경변수)
+"""
+
+import abc
+import argparse
+import json
+import os
+import socket
+import sqlite3
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+DEFAULT_QUEUE = os.environ.get("CRAWL_QUEUE", "sqlite:///data/crawl_queue.db")
+DEFAULT_LEASE = 120        # 리스 유지 시간(초). 페이지마다 heartbeat로 연장
+DEFAULT_MAX_ATTEMPTS = 3
+RETRY_BACKOFF = 30         # 재시도 대기(초) = RETRY_BACKOFF * 2^(시도-1)
+
+
+class QueueBackend(abc.ABC):
+    """작업 큐 백엔드 인터페이스 (샤드 = dict payload)"""
+
+    @abc.abstractmethod
+    def enqueue(self, job, shards, max_attempts=DEFAULT_MAX_ATTEMPTS):
+        """샤드 등록 (같은 key는 무시). 신규 등록 수 반환"""
+
+    @abc.abstractmethod
+    def claim(self, job, worker, lease_seconds=DEFAULT_LEASE):
+        """대기/리스 만료 샤드 1개 점유 → {"id", "key", "payload", "attempts"} 또는 None"""
+
+    @abc.abstractmethod
+    def heartbeat(self, shard_id, worker, lease_seconds=DEFAULT_LEASE):
+        """리스 연장. 리스를 잃었으면 False"""
+
+    @abc.abstractmethod
+    def complete(self, shard_id, worker, records):
+        """결과 저장 + 완료 처리. 리스를 잃었으면 False (결과 버림)"""
+
+    @abc.abstractmethod
+    def fail(self, shard_id, worker, error):
+        """실패 기록 → 재시도 대기 또는 failed"""
+
+    @abc.abstractmethod
+    def results(self, job):
+        """완료 샤드 결과 레코드 스트림"""
+
+    @abc.abstractmethod
+    def stats(self, job):
+        """상태별 샤드 수"""
+
+
+QUEUE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS shards (
+    id              INTEGER PRIMARY KEY,
+    job             TEXT NOT NULL,
+    key             TEXT NOT NULL,
+    payload         TEXT NOT NULL,
+    status          TEXT NOT NULL DEFAULT 'pending',
+    attempts        INTEGER NOT NULL DEFAULT 0,
+    max_attempts    INTEGER NOT NULL,
+    available_at    REAL NOT NULL DEFAULT 0,
+    lease_owner     TEXT,
+    lease_expires   REAL,
+    last_error      TEXT,
+    result_count    INTEGER,
+    updated_at      TEXT,
+    UNIQUE (job, key)
+);
+CREATE INDEX IF NOT EXISTS idx_shards_job_status ON shards (job, status);
+
+CREATE TABLE IF NOT EXISTS shard_results (
+    shard_id        INTEGER PRIMARY KEY REFERENCES shards (id) ON DELETE CASCADE,
+    records         TEXT NOT NULL
+);
+"""
+
+
+class SQLiteQueue(QueueBackend):
+    """SQLite 파일 큐 (BEGIN IMMEDIATE로 점유 경쟁 직렬화)"""
+
+    def __init__(self, path):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.conn = sqlite3.connect(path, timeout=30, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.executescript(QUEUE_SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def _tx(self):
+        return _ImmediateTransaction(self.conn)
+
+    def enqueue(self, job, shards, max_attempts=DEFAULT_MAX_ATTEMPTS):
+        now = datetime.now().isoformat(timespec="seconds")
+        with self._tx():
+            before = self.conn.total_changes
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO shards (job, key, payload, max_attempts, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [(job, shard_key(s), json.dumps(s, ensure_ascii=False), max_attempts, now)
+                 for s in shards])
+            return self.conn.total_changes - before
+
+    def claim(self, job, worker, lease_seconds=DEFAULT_LEASE):
+        now = time.time()
+        with self._tx():
+            # 재시도 한도를 넘긴 만료 리스 → failed
+            self.conn.execute(
+                "UPDATE shards SET status = 'failed', lease_owner = NULL, "
+                "last_error = COALESCE(last_error, 'lease expired') "
+                "WHERE job = ? AND status = 'leased' AND lease_expires < ? AND attempts >= max_attempts",
+                (job, now))
+            row = self.conn.execute(
+                "SELECT * FROM shards WHERE job = ? AND "
+                "((status = 'pending' AND available_at <= ?) OR (status = 'leased' AND lease_expires < ?)) "
+                "ORDER BY id LIMIT 1", (job, now, now)).fetchone()
+            if row is None:
+                return None
+            self.conn.execute(
+                "UPDATE shards SET status = 'leased', lease_owner = ?, lease_expires = ?, "
+                "attempts = attempts + 1, updated_at = ? WHERE id = ?",
+                (worker, now + lease_seconds, datetime.now().isoformat(timespec="seconds"), row["id"]))
+        return {"id": row["id"], "key": row["key"], "payload": json.loads(row["payload"]),
+                "attempts": row["attempts"] + 1}
+
+    def heartbeat(self, shard_id, worker, lease_seconds=DEFAULT_LEASE):
+        with self._tx():
+            cur = self.conn.execute(
+                "UPDATE shards SET lease_expires = ? WHERE id = ? AND status = 'leased' AND lease_owner = ?",
+                (time.time() + lease_seconds, shard_id, worker))
+            return cur.rowcount == 1
+
+    def complete(self, shard_id, worker, records):
+        with self._tx():
+            cur = self.conn.execute(
+                "UPDATE shards SET status = 'done', lease_owner = NULL, result_count = ?, updated_at = ? "
+                "WHERE id = ? AND status = 'leased' AND lease_owner = ?",
+                (len(records), datetime.now().isoformat(timespec="seconds"), shard_id, worker))
+            if cur.rowcount != 1:
+                return False
+            self.conn.execute(
+                "INSERT OR REPLACE INTO shard_results (shard_id, records) VALUES (?, ?)",
+                (shard_id, json.dumps(records, ensure_ascii=False)))
+            return True
+
+    def fail(self, shard_id, worker, error):
+        with self._tx():
+            row = self.conn.execute(
+                "SELECT attempts, max_attempts FROM shards WHERE id = ? AND status = 'leased' "
+                "AND lease_owner = ?", (shard_id, worker)).fetchone()
+            if row is None:
+                return False
+            if row["attempts"] >= row["max_attempts"]:
+                status, available_at = "failed", 0
+            else:
+                status, available_at = "pending", time.time() + RETRY_BACKOFF * 2 ** (row["attempts"] - 1)
+            self.conn.execute(
+                "UPDATE shards SET status = ?, available_at = ?, lease_owner = NULL, last_error = ?, "
+                "updated_at = ? WHERE id = ?",
+                (status, available_at, str(error)[:500], datetime.now().isoformat(timespec="seconds"),
+                 shard_id))
+            return True
+
+    def results(self, job):
+        for r in self.conn.execute(
+                "SELECT r.records FROM shard_results r JOIN shards s ON s.id = r.shard_id "
+                "WHERE s.job = ? AND s.status = 'done' ORDER BY s.id", (job,)):
+            yield from json.loads(r["records"])
+
+    def stats(self, job):
+        return {r["status"]: r["n"] for r in self.conn.execute(
+            "SELECT status, COUNT(*) AS n FROM shards WHERE job = ? GROUP BY status", (job,))}
+
+    def failures(self, job):
+        return self.conn.execute(
+            "SELECT key, attempts, last_error FROM shards WHERE job = ? AND status = 'failed' ORDER BY id",
+            (job,)).fetchall()
+
+
+class _ImmediateTransaction:
+    """BEGIN IMMEDIATE ... COMMIT/ROLLBACK (autocommit 연결용)"""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        self.conn.execute("BEGIN IMMEDIATE")
+        return self.conn
+
+    def __exit__(self, exc_type, *exc):
+        self.conn.execute("ROLLBACK" if exc_type else "COMMIT")
+
+
+BACKENDS = {"sqlite": SQLiteQueue}
+
+
+def open_queue(url=DEFAULT_QUEUE):
+    """큐 URL → 백엔드 (sqlite:///경로, 스킴 생략 시 SQLite 파일 경로)"""
+    scheme, sep, rest = url.partition("://")
+    if not sep:
+        return SQLiteQueue(url)
+    if scheme not in BACKENDS:
+        raise ValueError(f"지원하지 않는 큐 백엔드: {scheme}")
+    return BACKENDS[scheme](rest[1:] if rest.startswith("/") else rest)
+
+
+# ----------------------------------------------------------------------
+# 코디네이터 / 워커
+# ----------------------------------------------------------------------
+
+def shard_key(payload):
+    return f"{payload['target']}|{payload['efYd']}|{payload['pageStart']}"
+
+
+def month_windows(start, end, months=1):
+    """[start, end] → months개월 단위 efYd 구간 ('YYYYMMDD~YYYYMMDD')"""
+    cur = start
+    while cur <= end:
+        y, m = divmod(cur.month - 1 + months, 12)
+        nxt = date(cur.year + y, m + 1, 1)
+        last = min(nxt - timedelta(days=1), end)
+        yield f"{cur:%Y%m%d}~{last:%Y%m%d}"
+        cur = nxt
+
+
+def plan_shards(start, end, targets=("law", "eflaw"), months=1, pages=5, display=100):
+    """초기 샤드: target × 시행일자 구간 × 첫 페이지 구간"""
+    return [{"target": t, "efYd": window, "pageStart": 1, "pageEnd": pages, "display": display}
+            for t in targets for window in month_windows(start, end, months)]
+
+
+def process_shard(shard, fetcher, queue, worker, lease_seconds=DEFAULT_LEASE):
+    """샤드 페이지 수집 → (레코드 목록, 후속 샤드 또는 None)"""
+    p = shard["payload"]
+    records, full = [], False
+    for page in range(p["pageStart"], p["pageEnd"] + 1):
+        laws = fetcher.fetch_page(p["target"], page, p["efYd"], p["display"])
+        records.extend(laws)
+        full = len(laws) >= p["display"]
+        if not queue.heartbeat(shard["id"], worker, lease_seconds):
+            raise RuntimeError("lease lost")
+        if not full:
+            break
+    follow_up = None
+    if full:
+        span = p["pageEnd"] - p["pageStart"] + 1
+        follow_up = dict(p, pageStart=p["pageEnd"] + 1, pageEnd=p["pageEnd"] + span)
+    return records, follow_up
+
+
+def run_worker(queue, job, worker=None, fetcher=None, lease_seconds=DEFAULT_LEASE, poll=2.0):
+    """큐가 빌 때까지 샤드 처리. 처리 통계 반환"""
+    if fetcher is None:
+        from fast_law_collector import FastLawCollector
+        fetcher = FastLawCollector()
+    worker = worker or f"{socket.gethostname()}:{os.getpid()}"
+    done = failed = records = 0
+    while True:
+        shard = queue.claim(job, worker, lease_seconds)
+        if shard is None:
+            stats = queue.stats(job)
+            if not stats.get("pending") and not stats.get("leased"):
+                break
+            time.sleep(poll)  # 재시도 대기/타 워커 리스 중
+            continue
+        try:
+            found, follow_up = process_shard(shard, fetcher, queue, worker, lease_seconds)
+        except Exception as e:
+            queue.fail(shard["id"], worker, e)
+            failed += 1
+            print(f"   ❌ [{worker}] {shard['key']} (시도 {shard['attempts']}): {e}", file=sys.stderr)
+            continue
+        if follow_up:
+            queue.enqueue(job, [follow_up])
+        if queue.complete(shard["id"], worker, found):
+            done += 1
+            records += len(found)
+            print(f"   ✅ [{worker}] {shard['key']}~{shard['payload']['pageEnd']}: {len(found)}개"
+                  + (" (+후속 샤드)" if follow_up else ""))
+    return {"worker": worker, "shards": done, "failed": failed, "records": records}
+
+
+def merge_results(queue, job, dataset=None, db_path="data/regrader.db"):
+    """완료 샤드 결과 → 중복 제거(법령명+시행일자, 법령명은 별칭 해소) → 법령 DB 적재. 적재 수 반환
+
+    dataset 기본: collected (FastLawCollector와 같은 데이터셋 → regrader_cli.py match 기본 대상)
+    """
+    from corpus_index import COLLECTED_DATASET
+    from law_alias_index import AliasIndex
+    from law_db import LawDatabase
+
+    dataset = dataset or COLLECTED_DATASET
+
+    aliases = AliasIndex.load(db_path=db_path)
+    seen, unique = set(), []
+    for rec in queue.results(job):
+        key = (aliases.canonical(rec.get("법령명")), rec.get("시행일자"))
+        if key in seen:
+            continue
+        seen.add(key)
+        unique.append(rec)
+    with LawDatabase(db_path) as db:
+        run_id = db.start_crawl_run("crawl_queue", {"job": job, "stats": queue.stats(job)})
+        ids = db.import_corpus_records(unique, dataset=dataset)
+        db.finish_crawl_run(run_id, len(ids))
+    return len(ids)
+
+
+def main(argv=None):
+    """메인 실행"""
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--queue", default=DEFAULT_QUEUE, help="큐 URL (sqlite:///data/crawl_queue.db)")
+    parser = argparse.ArgumentParser(description="분산 수집 작업 큐")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("plan", parents=[common], help="샤드 등록")
+    p.add_argument("job")
+    p.add_argument("--year", type=int, default=date.today().year)
+    p.add_argument("--targets", default="law,eflaw")
+    p.add_argument("--months", type=int, default=1, help="샤드당 시행일자 구간(개월)")
+    p.add_argument("--pages", type=int, default=5, help="샤드당 페이지 수")
+    p.add_argument("--max-attempts", type=int, default=DEFAULT_MAX_ATTEMPTS)
+
+    p = sub.add_parser("work", parents=[common], help="워커 실행 (큐가 빌 때까지)")
+    p.add_argument("job")
+    p.add_argument("--worker-id")
+    p.add_argument("--lease", type=int, default=DEFAULT_LEASE)
+
+    p = sub.add_parser("status", parents=[common], help="샤드 상태")
+    p.add_argument("job")
+
+    p = sub.add_parser("merge", parents=[common], help="결과 → 법령 DB 적재")
+    p.add_argument("job")
+    p.add_argument("--dataset", help="적재 데이터셋 (기본: collected)")
+    p.add_argument("--db", default="data/regrader.db")
+
+    args = parser.parse_args(argv)
+    queue = open_queue(args.queue)
+    try:
+        if args.command == "plan":
+            shards = plan_shards(date(args.year, 1, 1), date(args.year, 12, 31),
+                                 tuple(args.targets.split(",")), args.months, args.pages)
+            added = queue.enqueue(args.job, shards, args.max_attempts)
+            print(f"🗂️  {args.job}: 샤드 {added}개 등록 (요청 {len(shards)}개)")
+        elif args.command == "work":
+            result = run_worker(queue, args.job, args.worker_id, lease_seconds=args.lease)
+            print(f"\n👷 {result['worker']}: 샤드 {result['shards']}개, 실패 {result['failed']}개, "
+                  f"레코드 {result['records']:,}개")
+        elif args.command == "status":
+            stats = queue.stats(args.job)
+            print(f"📊 {args.job}: " + ", ".join(f"{k} {v}" for k, v in sorted(stats.items())))
+            for f in queue.failures(args.job):
+                print(f"   ❌ {f['key']} (시도 {f['attempts']}): {f['last_error']}")
+        else:
+            stats = queue.stats(args.job)
+            if stats.get("pending") or stats.get("leased"):
+                print(f"⚠️  미완료 샤드 있음: {stats}")
+            count = merge_results(queue, args.job, args.dataset, args.db)
+            print(f"🗄️  {args.job} → {args.db} [{args.dataset}] {count:,}개 적재")
+    finally:
+        queue.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,8 +4,12 @@
 """
 
 import json
+import os
+import sys
 from datetime import datetime
 
+OUTPUT_PATH = "docs/base_laws_207.json"
+
 # 207개 기본 법규 데이터
 base_laws_data = {
     "인사노무": [
@@ -329,7 +333,7 @@ def determine_ministry(law_name, category):
     
     return category_default.get(category, "기타")
 
-def create_base_laws_json():
+def create_base_laws_json(output_path=OUTPUT_PATH):
     """207개 기본 법규 JSON 생성"""
     
     items = []
@@ -362,7 +366,7 @@ def create_base_laws_json():
     }
     
     # 파일 저장
-    output_path = "/home/user/webapp/docs/base_laws_207.json"
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
     with open(output_path, 'w', encoding='utf-8') as f:
         json.dump(base_laws_json, f, ensure_ascii=False, indent=2)
     
@@ -383,4 +387,4 @@ def create_base_laws_json():
     return base_laws_json
 
 if __name__ == "__main__":
-    create_base_laws_json()
\ No newline at end of file
+    create_base_laws_json(sys.argv[1] if len(sys.argv) > 1 else OUTPUT_PATH)
@@ -1,7 +1,17 @@
 #!/usr/bin/env python3
+"""
+RegRader PWA 아이콘 생성 (docs/icon-192.png, docs/icon-512.png)
+사용법: python create_icons.py [--force]
+"""
 from PIL import Image, ImageDraw, ImageFont
-import base64
-from io import BytesIO
+import os
+import sys
+
+from icon_pipeline import build_icons, file_sha256
+
+FONT_BOLD = "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
+FONT_REGULAR = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
+FONT_PATHS = (FONT_BOLD, FONT_REGULAR)
 
 def create_icon(size):
     # 이미지 생성
@@ -17,7 +27,7 @@ def create_icon(size):
     # 기본 폰트 사용
     try:
         font_size = int(size * 0.35)
-        font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", font_size)
+        font = ImageFont.truetype(FONT_BOLD, font_size)
     except:
         font = ImageFont.load_default()
     
@@ -34,7 +44,7 @@ def create_icon(size):
     subtext = "법령"
     try:
         subfont_size = int(size * 0.12)
-        subfont = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", subfont_size)
+        subfont = ImageFont.truetype(FONT_REGULAR, subfont_size)
     except:
         subfont = ImageFont.load_default()
     
@@ -45,13 +55,29 @@ def create_icon(size):
     
     return img
 
-# 아이콘 생성 및 저장
-icon_192 = create_icon(192)
-icon_512 = create_icon(512)
+# 출력 (파일, 크기) - 가장 큰 크기로 1회 렌더링 후 축소
+OUTPUTS = [
+    ('docs/icon-512.png', 512),
+    ('docs/icon-192.png', 192),
+]
+
+def main():
+    # 렌더링 원본 = 이 스크립트(색상/폰트/배치) + 폰트 파일 → 변경 없으면 생략
+    source_hash = file_sha256(os.path.abspath(__file__))
+    for font_path in FONT_PATHS:
+        if os.path.exists(font_path):
+            source_hash += file_sha256(font_path)
+
+    render_size = max(size for _, size in OUTPUTS)
+    written = build_icons('pwa_icons', source_hash, lambda: create_icon(render_size), OUTPUTS,
+                          force='--force' in sys.argv)
+    if written is None:
+        print("아이콘 변경 없음 - 생성 생략 (--force 로 강제 재생성)")
+        return
 
-icon_192.save('docs/icon-192.png', 'PNG')
-icon_512.save('docs/icon-512.png', 'PNG')
+    print("아이콘 생성 완료!")
+    for path, _ in sorted(OUTPUTS, key=lambda o: o[1]):
+        print(f"- {path}")
 
-print("아이콘 생성 완료!")
-print("- docs/icon-192.png")
-print("- docs/icon-512.png")
\ No newline at end of file
+if __name__ == '__main__':
+    main()
@@ -20,8 +20,24 @@ self.addEventListener('install', event => {
   self.skipWaiting();
 });
 
+// 콘텐츠 해시 산출물 (data/<이름>.<해시>.json) - 내용 불변이므로 최초 1회만 받아 영구 캐시
+const HASHED_JSON = /\/data\/[\w-]+\.[0-9a-f]{12}\.json$/;
+
 // Fetch event - serve from cache when offline
 self.addEventListener('fetch', event => {
+  if (HASHED_JSON.test(new URL(event.request.url).pathname)) {
+    event.respondWith(
+      caches.open(CACHE_NAME).then(cache =>
+        cache.match(event.request).then(cached => cached || fetch(event.request).then(response => {
+          if (response.ok) {
+            cache.put(event.request, response.clone());
+          }
+          return response;
+        }))
+      )
+    );
+    return;
+  }
   event.respondWith(
     caches.match(event.request)
       .then(response => {
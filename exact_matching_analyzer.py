@@ -3,15 +3,43 @@
 100% 정확 매칭 분석기
 - 깃허브 8직무 207개 vs 2809개 수집법령
 - 완전 일치만 추출 (유사도 1.0)
+- pandas는 DataFrame이 필요한 메서드에서만 로드 (normalize_law_name/NDJSON 경로는 비의존)
+- 법령명 별칭(law_db law_aliases)이 있으면 제명이 바뀐 법령도 현재 법령명으로 비교
+- 프로파일링: --profile 또는 REGRADER_PROFILE=1 (profiling_hooks, 단계별 CPU/메모리)
+
+사용법:
+  python exact_matching_analyzer.py
+  python fast_law_collector.py --ndjson | python exact_matching_analyzer.py --ndjson [--base-laws docs/index.json]
 """
 
-import pandas as pd
 import json
 import glob
 import os
 import re
+import sys
 from datetime import datetime
 
+import profiling_hooks
+from profiling_hooks import stage as profile_stage
+
+# 당사 적용법규 기본 경로 (저장소 기준, 실행 위치와 무관)
+COMPANY_LAWS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "docs", "index.json")
+
+def normalize_law_name(law_name):
+    """법령명 정규화 (완전 일치용, pandas 비의존)"""
+    
+    if law_name is None or law_name != law_name or not law_name:  # None/NaN/빈값
+        return ""
+    
+    name = str(law_name).strip()
+    
+    # 공통 정규화 (완전 일치를 위해 최소한만)
+    name = re.sub(r'\s+', ' ', name)  # 다중 공백을 단일 공백으로
+    name = name.replace('·', '.')     # 중점을 마침표로 통일
+    name = name.replace('ㆍ', '.')     # 가운뎃점을 마침표로 통일
+    
+    return name.strip()
+
 class ExactMatchingAnalyzer:
     """100% 정확 매칭 분석기"""
     
@@ -19,29 +47,36 @@ class ExactMatchingAnalyzer:
         self.company_laws = None
         self.collected_laws = None
         self.exact_matches = []
-        
+        self.aliases = None  # law_alias_index.AliasIndex (load_aliases)
+        
+    def read_company_laws(self, path=COMPANY_LAWS_PATH):
+        """당사 적용법규 레코드 목록 (pandas 비의존)"""
+        
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        
+        laws = []
+        for item in data["items"]:
+            law_info = {
+                "법규ID": item["id"],
+                "법령명": item["title"], 
+                "직무카테고리": item["categories"][0] if item["categories"] else "미분류",
+                "시행일자": item["effectiveDate"],
+                "법령종류": item["lawType"],
+                "소관부처": item.get("ministry") or item.get("meta", {}).get("ministry", "")
+            }
+            laws.append(law_info)
+        return laws
+    
     def load_github_company_laws(self):
         """깃허브 8직무 당사 적용법규 로드"""
         
+        import pandas as pd
+        
         print("📋 깃허브 8직무 당사 적용법규 로드 중...")
         
         try:
-            with open("/home/user/webapp/docs/index.json", "r", encoding="utf-8") as f:
-                data = json.load(f)
-            
-            laws = []
-            for item in data["items"]:
-                law_info = {
-                    "법규ID": item["id"],
-                    "법령명": item["title"], 
-                    "직무카테고리": item["categories"][0] if item["categories"] else "미분류",
-                    "시행일자": item["effectiveDate"],
-                    "법령종류": item["lawType"],
-                    "소관부처": item["meta"]["ministry"]
-                }
-                laws.append(law_info)
-            
-            self.company_laws = pd.DataFrame(laws)
+            self.company_laws = pd.DataFrame(self.read_company_laws())
             
             print(f"   ✅ {len(self.company_laws)}개 당사 적용법규 로드")
             
@@ -60,6 +95,8 @@ class ExactMatchingAnalyzer:
     def load_collected_laws(self):
         """수집된 법령 로드"""
         
+        import pandas as pd
+        
         print(f"\n📊 수집된 법령 로드 중...")
         
         files = glob.glob("/home/user/webapp/2025_Laws_Complete_*.xlsx")
@@ -71,7 +108,10 @@ class ExactMatchingAnalyzer:
         print(f"   📂 파일: {os.path.basename(latest_file)}")
         
         try:
-            self.collected_laws = pd.read_excel(latest_file, sheet_name="전체")
+            # 같은 파일이면 파싱 결과 스냅샷 재사용 (index_snapshot, 파일 해시로 무효화)
+            from index_snapshot import cached
+            self.collected_laws = cached("collected", os.path.abspath(latest_file), [latest_file],
+                                         lambda: pd.read_excel(latest_file, sheet_name="전체"))
             print(f"   ✅ {len(self.collected_laws)}개 수집 법령 로드")
             return True
         except Exception as e:
@@ -79,19 +119,20 @@ class ExactMatchingAnalyzer:
             return False
     
     def normalize_law_name(self, law_name):
-        """법령명 정규화 (완전 일치용)"""
+        """법령명 정규화 (완전 일치용, 별칭이면 현재 법령명)"""
         
-        if pd.isna(law_name) or not law_name:
-            return ""
-        
-        name = str(law_name).strip()
+        if self.aliases is not None:
+            return self.aliases.canonical(law_name)
+        return normalize_law_name(law_name)
+    
+    def load_aliases(self, db_path=None):
+        """법령 DB 법령명 별칭 로드 (DB가 없거나 별칭이 없으면 정규화 법령명만 비교)"""
         
-        # 공통 정규화 (완전 일치를 위해 최소한만)
-        name = re.sub(r'\s+', ' ', name)  # 다중 공백을 단일 공백으로
-        name = name.replace('·', '.')     # 중점을 마침표로 통일
-        name = name.replace('ㆍ', '.')     # 가운뎃점을 마침표로 통일
+        from law_alias_index import AliasIndex
         
-        return name.strip()
+        aliases = AliasIndex.load(db_path=db_path)
+        self.aliases = aliases if len(aliases) else None
+        return len(aliases)
     
     def find_exact_matches(self):
         """100% 정확 매칭 찾기"""
@@ -150,9 +191,75 @@ class ExactMatchingAnalyzer:
         
         return exact_matches
     
+    def stream_exact_matches(self, lines, out=None):
+        """NDJSON 수집법령 스트림 → 100% 매칭 결과 NDJSON 즉시 출력
+        
+        fast_law_collector.py --ndjson / scrape.py --ndjson 출력을 파이프로 입력받음
+        마지막 줄은 요약 레코드 ({"type": "summary", ...})
+        """
+        
+        out = out or sys.stdout
+        
+        # 당사 법규를 정규화 법령명으로 1회 인덱싱
+        company_laws = self.company_laws
+        if hasattr(company_laws, "to_dict"):  # DataFrame (load_github_company_laws)
+            company_laws = company_laws.to_dict("records")
+        company_by_name = {}
+        for company_law in company_laws:
+            name = self.normalize_law_name(company_law["법령명"])
+            if name:
+                company_by_name.setdefault(name, []).append(company_law)
+        
+        exact_matches = []
+        total_processed = 0
+        upstream = None
+        
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            collected_law = json.loads(line)
+            if collected_law.get("type") == "summary":
+                upstream = collected_law
+                continue
+            total_processed += 1
+            
+            # fast_law_collector(한글 키) / scrape.py(영문 키) 레코드 모두 지원
+            meta = collected_law.get("meta") or {}
+            source = collected_law.get("source")
+            collected_name = collected_law.get("법령명") or collected_law.get("title")
+            
+            for company_law in company_by_name.get(self.normalize_law_name(collected_name), ()):
+                match_info = {
+                    "당사법규ID": company_law["법규ID"],
+                    "당사법령명": company_law["법령명"],
+                    "직무카테고리": company_law["직무카테고리"],
+                    "당사시행일자": company_law["시행일자"],
+                    "수집법령명": collected_name,
+                    "수집시행일자": collected_law.get("시행일자") or collected_law.get("effectiveDate") or "",
+                    "법령상태": collected_law.get("법령상태") or collected_law.get("status") or "",
+                    "법령종류": collected_law.get("법령종류") or collected_law.get("lawType") or "",
+                    "소관부처": collected_law.get("소관부처") or meta.get("ministry") or "",
+                    "수집소스": collected_law.get("수집소스") or (source.get("name") if isinstance(source, dict) else source) or "",
+                    "매칭타입": "100%완전일치"
+                }
+                exact_matches.append(match_info)
+                out.write(json.dumps(match_info, ensure_ascii=False, separators=(",", ":"), default=str) + "\n")
+                out.flush()
+        
+        self.exact_matches = exact_matches
+        
+        summary = {"type": "summary", "processed": total_processed, "matches": len(exact_matches),
+                   "companyLaws": len(self.company_laws), "upstream": upstream}
+        out.write(json.dumps(summary, ensure_ascii=False, separators=(",", ":"), default=str) + "\n")
+        out.flush()
+        return exact_matches
+    
     def analyze_exact_matches(self):
         """정확 매칭 결과 분석"""
         
+        import pandas as pd
+        
         if not self.exact_matches:
             print("❌ 매칭 결과가 없습니다.")
             return
@@ -197,42 +304,37 @@ class ExactMatchingAnalyzer:
         if not multiple_dates.empty:
             print(f"   📊 {len(multiple_dates)}개 법령이 여러 시행일자를 가짐:")
             
+            # 법령별 시행일자 1회 그룹화 (법령마다 DataFrame 재필터링하지 않음)
+            dates_by_law = df_matches.groupby("당사법령명")["수집시행일자"].unique()
+            
             for law_name, count in multiple_dates.head(10).items():
                 print(f"      • {law_name}: {count}개 시행일자")
                 
                 # 해당 법령의 모든 시행일자 표시
-                law_versions = df_matches[df_matches["당사법령명"] == law_name]
-                dates = law_versions["수집시행일자"].unique()
+                dates = dates_by_law[law_name]
                 # numpy 타입을 문자열로 변환 후 정렬 및 조인
                 dates_str = [str(date) for date in dates if pd.notna(date)]
                 print(f"        시행일자: {', '.join(sorted(dates_str))}")
         else:
             print(f"   ℹ️  모든 법령이 단일 시행일자를 가집니다.")
         
-        # 5. 분기별 영향도
-        print(f"\n📅 2025년 분기별 100% 매칭 법령:")
-        q_counts = {"Q1": 0, "Q2": 0, "Q3": 0, "Q4": 0}
-        
-        for _, match in df_matches.iterrows():
-            date_str = str(match["수집시행일자"]).replace("-", "")
-            if len(date_str) >= 8:
-                if "20250101" <= date_str <= "20250331":
-                    q_counts["Q1"] += 1
-                elif "20250401" <= date_str <= "20250630":
-                    q_counts["Q2"] += 1
-                elif "20250701" <= date_str <= "20250930":
-                    q_counts["Q3"] += 1
-                elif "20251001" <= date_str <= "20251231":
-                    q_counts["Q4"] += 1
-        
-        for quarter, count in q_counts.items():
-            print(f"   • 2025 {quarter}: {count}개")
+        # 5. 분기별 영향도 (시행일자 연도별, 다년도 비교는 multi_year_report.py)
+        print(f"\n📅 분기별 100% 매칭 법령:")
+        digits = df_matches["수집시행일자"].astype(str).str.replace(r"\D", "", regex=True).str[:8]
+        dates = pd.to_datetime(digits, format="%Y%m%d", errors="coerce").dropna()
+        q_counts = dates.groupby([dates.dt.year, dates.dt.quarter]).size()
+        
+        for year in sorted(dates.dt.year.unique()):
+            for quarter in range(1, 5):
+                print(f"   • {year} Q{quarter}: {q_counts.get((year, quarter), 0)}개")
         
         return df_matches
     
     def save_exact_matches(self, df_matches):
         """정확 매칭 결과 저장"""
         
+        import pandas as pd
+        
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         filename = f"/home/user/webapp/100%매칭결과_{timestamp}.xlsx"
         
@@ -263,9 +365,43 @@ class ExactMatchingAnalyzer:
             print(f"❌ 저장 오류: {e}")
             return ""
 
+def main_ndjson(company_laws=None, path=COMPANY_LAWS_PATH, db_path=None):
+    """스트리밍 실행: stdin NDJSON → stdout 매칭 NDJSON (로그는 stderr). 종료 코드 반환
+    
+    company_laws: 당사 적용법규 레코드 목록 (없으면 path 의 index.json 형식 파일에서 로드)
+    db_path: 법령명 별칭을 읽을 법령 DB (기본: law_db.DB_PATH)
+    """
+    
+    analyzer = ExactMatchingAnalyzer()
+    
+    # DataFrame 없이 레코드 목록으로 로드 (pandas 미로드)
+    try:
+        if company_laws is None:
+            company_laws = analyzer.read_company_laws(path)
+    except Exception as e:
+        print(f"   ❌ 로드 오류: {e}", file=sys.stderr)
+        return 1
+    if not company_laws:
+        print("   ❌ 당사 적용법규가 없습니다.", file=sys.stderr)
+        return 1
+    analyzer.company_laws = company_laws
+    print(f"   ✅ {len(analyzer.company_laws)}개 당사 적용법규 로드", file=sys.stderr)
+    analyzer.load_aliases(db_path)
+    
+    with profile_stage("stream"):
+        analyzer.stream_exact_matches(sys.stdin, sys.stdout)
+    return 0
+
 def main():
     """메인 실행"""
     
+    profiling_hooks.init("exact_matching_analyzer")
+    if "--ndjson" in sys.argv[1:]:
+        # --base-laws <index.json 형식 파일> (기본: 저장소 docs/index.json)
+        args = sys.argv[1:]
+        path = args[args.index("--base-laws") + 1] if "--base-laws" in args[:-1] else COMPANY_LAWS_PATH
+        return main_ndjson(path=path)
+    
     print("🎯 100% 정확 매칭 분석기")
     print("🔹 깃허브 8직무 207개 vs 수집법령 100% 완전일치만 추출")
     print("=" * 70)
@@ -273,24 +409,30 @@ def main():
     analyzer = ExactMatchingAnalyzer()
     
     # 1. 데이터 로드
-    if not analyzer.load_github_company_laws():
-        return
+    with profile_stage("load_company"):
+        if not analyzer.load_github_company_laws():
+            return
     
-    if not analyzer.load_collected_laws():
-        return
+    with profile_stage("load_collected"):
+        if not analyzer.load_collected_laws():
+            return
+        analyzer.load_aliases()
     
     # 2. 100% 정확 매칭 찾기
-    exact_matches = analyzer.find_exact_matches()
+    with profile_stage("find_exact_matches"):
+        exact_matches = analyzer.find_exact_matches()
     
     if not exact_matches:
         print("❌ 100% 매칭된 법령이 없습니다.")
         return
     
     # 3. 매칭 결과 분석
-    df_matches = analyzer.analyze_exact_matches()
+    with profile_stage("analyze"):
+        df_matches = analyzer.analyze_exact_matches()
     
     # 4. 결과 저장
-    saved_file = analyzer.save_exact_matches(df_matches)
+    with profile_stage("save"):
+        saved_file = analyzer.save_exact_matches(df_matches)
     
     if saved_file:
         print(f"\n🎉 100% 정확 매칭 분석 완료!")
@@ -298,4 +440,4 @@ def main():
         print(f"📊 총 {len(exact_matches)}개 완전 일치 법령 발견")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
@@ -3,100 +3,168 @@
 빠른 2025년 법령 수집기
 - target=law + target=eflaw 이중 접근
 - 2,702개 법령 빠른 수집
+- requests/pandas는 수집·저장 시점에만 로드
+- 요청 속도는 rate_limiter 공유 토큰 버킷으로 조절 (같은 OC 키를 쓰는 다른 작업과 합산)
+  · OC 키: LAW_OC 환경변수 (scrape.default_oc)
+  · 일일 쿼터 소진(QuotaExceeded)은 수집 중단, 그 밖의 페이지 오류는 해당 target만 중단 → 수집이력 partial
+- 프로파일링: --profile 또는 REGRADER_PROFILE=1 (profiling_hooks)
 """
 
-import requests
-import pandas as pd
+import contextlib
+import json
+import os
+import sys
 from datetime import datetime
-import time
+
+import profiling_hooks
+from crawl_archive import CrawlArchive
+from profiling_hooks import stage as profile_stage
+from rate_limiter import QuotaExceeded, limiter_for_url
+
+EF_RANGE = "20250101~20251231"  # 시행일자 범위 (efYd)
+
+
+def default_oc():
+    """OpenAPI OC 키 (scrape.default_oc: LAW_OC 환경변수)"""
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "scraper"))
+    from scrape import default_oc as scrape_default_oc
+
+    return scrape_default_oc()
+
+
+def load_aliases():
+    """법령 DB 법령명 별칭 (중복 제거 키, DB가 없으면 빈 인덱스)"""
+    from law_alias_index import AliasIndex
+
+    return AliasIndex.load()
+
 
 class FastLawCollector:
     """빠른 법령 수집기"""
     
-    def __init__(self):
+    def __init__(self, archive=None):
         self.base_url = "https://www.law.go.kr/DRF/lawSearch.do"
-        self.oc = "knowhow1"
+        self.oc = default_oc()
         self.all_laws = []
+        self.errors = []  # 중단된 target 페이지 오류 (수집이력 partial)
+        self.archive = archive  # CrawlArchive (기록/재생)
         
     def fetch_laws_by_target(self, target):
         """특정 target으로 법령 수집"""
         
+        return list(self.iter_laws_by_target(target))
+    
+    def fetch_page(self, target, page, ef_range=EF_RANGE, display=100):
+        """target 1페이지 조회 → 법령 목록 (마지막 페이지 이후는 빈 목록, 네트워크 오류는 예외)"""
+        
+        import requests
+        
+        params = {
+            "OC": self.oc,
+            "target": target,
+            "type": "JSON", 
+            "efYd": ef_range,
+            "display": display,
+            "page": page,
+            "sort": "efasc"
+        }
+        
+        url = requests.Request("GET", self.base_url, params=params).prepare().url
+        
+        if self.replay:
+            raw = self.archive.get(url)
+            if raw is None:
+                return []
+            data = json.loads(raw.decode("utf-8"))
+        else:
+            limiter = limiter_for_url(url)
+            limiter.acquire()  # 프로세스 간 공유 속도 제한 (같은 OC 키)
+            response = requests.get(url, timeout=30)
+            if response.status_code in (429, 503):
+                limiter.penalize(float(response.headers.get("Retry-After") or 5))
+            response.raise_for_status()
+            if self.archive is not None:
+                self.archive.record(url, response.content)
+            
+            data = response.json()
+        
+        if not data or "LawSearch" not in data:
+            return []
+            
+        law_search = data["LawSearch"]
+        
+        if not law_search or "law" not in law_search:
+            return []
+        
+        law_items = law_search["law"]
+        if not law_items:
+            return []
+        
+        # 리스트가 아니면 단일 항목을 리스트로 변환
+        if not isinstance(law_items, list):
+            law_items = [law_items]
+        
+        return [{
+            "법령ID": item.get("법령일련번호", ""),
+            "법령명": item.get("법령명한글", ""),
+            "시행일자": item.get("시행일자", ""),
+            "공포일자": item.get("공포일자", ""), 
+            "소관부처": item.get("소관부처명", ""),
+            "법령종류": item.get("법종구분명", ""),
+            "법령상태": "현행" if target == "law" else "시행예정",
+            "수집소스": f"target={target}",
+            "수집일시": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        } for item in law_items]
+    
+    @property
+    def replay(self):
+        return self.archive is not None and self.archive.replay
+    
+    def iter_laws_by_target(self, target):
+        """특정 target으로 법령 수집 (페이지 수신 즉시 법령 단위로 반환)"""
+        
         print(f"📊 Target={target} 법령 수집 중...")
         
-        laws = []
+        collected = 0
         page = 1
         
         while True:
-            params = {
-                "OC": self.oc,
-                "target": target,
-                "type": "JSON", 
-                "efYd": "20250101~20251231",
-                "display": 100,
-                "page": page,
-                "sort": "efasc"
-            }
-            
             try:
-                response = requests.get(self.base_url, params=params, timeout=30)
-                response.raise_for_status()
-                
-                data = response.json()
-                
-                if not data or "LawSearch" not in data:
-                    break
-                    
-                law_search = data["LawSearch"]
-                
-                if not law_search or "law" not in law_search:
-                    break
-                
-                law_items = law_search["law"]
+                law_items = self.fetch_page(target, page)
                 if not law_items:
                     break
                 
-                # 리스트가 아니면 단일 항목을 리스트로 변환
-                if not isinstance(law_items, list):
-                    law_items = [law_items]
-                
-                for item in law_items:
-                    law_info = {
-                        "법령ID": item.get("법령일련번호", ""),
-                        "법령명": item.get("법령명한글", ""),
-                        "시행일자": item.get("시행일자", ""),
-                        "공포일자": item.get("공포일자", ""), 
-                        "소관부처": item.get("소관부처명", ""),
-                        "법령종류": item.get("법종구분명", ""),
-                        "법령상태": "현행" if target == "law" else "시행예정",
-                        "수집소스": f"target={target}",
-                        "수집일시": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    }
-                    laws.append(law_info)
+                for law_info in law_items:
+                    collected += 1
+                    yield law_info
                 
-                print(f"   페이지 {page}: {len(law_items)}개 수집 (누적: {len(laws)}개)")
+                print(f"   페이지 {page}: {len(law_items)}개 수집 (누적: {collected}개)")
                 page += 1
                 
-                # API 부하 방지
-                time.sleep(0.1)
-                
+            except QuotaExceeded:
+                raise  # 쿼터 소진: 이후 요청도 모두 실패하므로 수집 전체 중단
             except Exception as e:
                 print(f"   ❌ 오류 (페이지 {page}): {e}")
+                self.errors.append(f"target={target} page={page}: {e}")
                 break
         
-        print(f"   ✅ Target={target} 총 {len(laws)}개 수집 완료")
-        return laws
+        print(f"   ✅ Target={target} 총 {collected}개 수집 완료")
     
     def collect_all_laws(self):
         """모든 법령 수집 (현행 + 시행예정)"""
         
+        import pandas as pd
+        
         print("🚀 2025년 법령 전체 수집 시작")
         print("=" * 50)
         
         # 1. 현행 법령 수집
-        current_laws = self.fetch_laws_by_target("law")
+        with profile_stage("fetch:law"):
+            current_laws = self.fetch_laws_by_target("law")
         
         # 2. 시행예정 법령 수집  
-        future_laws = self.fetch_laws_by_target("eflaw")
+        with profile_stage("fetch:eflaw"):
+            future_laws = self.fetch_laws_by_target("eflaw")
         
         # 3. 통합 및 중복 제거
         all_laws = current_laws + future_laws
@@ -106,18 +174,52 @@ class FastLawCollector:
         print(f"   시행예정 법령: {len(future_laws):,}개")
         print(f"   전체 수집: {len(all_laws):,}개")
         
-        # 중복 제거 (법령명 + 시행일자 기준)
-        df = pd.DataFrame(all_laws)
-        df_unique = df.drop_duplicates(subset=["법령명", "시행일자"], keep="first")
+        # 중복 제거 (법령명 + 시행일자 기준, 법령명은 별칭 → 현재 법령명)
+        with profile_stage("dedupe"):
+            df = pd.DataFrame(all_laws)
+            aliases = load_aliases()
+            canonical = df["법령명"].map({t: aliases.canonical(t) for t in df["법령명"].unique()})
+            df_unique = df[~pd.DataFrame({"법령명": canonical, "시행일자": df["시행일자"]}).duplicated()]
         
         print(f"   중복 제거 후: {len(df_unique):,}개")
         
         self.all_laws = df_unique
         return df_unique
     
+    def stream_ndjson(self, out=None):
+        """NDJSON 스트리밍 출력 (법령 1건 = 1줄, 마지막 줄은 요약 레코드)
+        
+        진행 로그는 stderr로 보내 파이프 소비자(ExactMatchingAnalyzer --ndjson 등)와 분리
+        """
+        
+        out = out or sys.stdout
+        seen = set()
+        by_source = {}
+        aliases = load_aliases()
+        
+        with contextlib.redirect_stdout(sys.stderr):
+            for target in ("law", "eflaw"):
+                for law in self.iter_laws_by_target(target):
+                    # 중복 제거 (법령명 + 시행일자 기준, collect_all_laws와 동일)
+                    key = (aliases.canonical(law["법령명"]), law["시행일자"])
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    by_source[law["수집소스"]] = by_source.get(law["수집소스"], 0) + 1
+                    out.write(json.dumps(law, ensure_ascii=False, separators=(",", ":")) + "\n")
+                    out.flush()
+        
+        summary = {"type": "summary", "count": len(seen), "sources": by_source,
+                   "generatedAt": datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+        out.write(json.dumps(summary, ensure_ascii=False, separators=(",", ":")) + "\n")
+        out.flush()
+        return summary
+    
     def save_to_excel(self):
         """Excel 파일로 저장"""
         
+        import pandas as pd
+        
         if len(self.all_laws) == 0:
             print("❌ 저장할 데이터가 없습니다.")
             return ""
@@ -126,7 +228,7 @@ class FastLawCollector:
         filename = f"/home/user/webapp/2025_Laws_Complete_{timestamp}.xlsx"
         
         try:
-            with pd.ExcelWriter(filename, engine="openpyxl") as writer:
+            with profile_stage("excel"), pd.ExcelWriter(filename, engine="openpyxl") as writer:
                 # 전체 시트
                 self.all_laws.to_excel(writer, sheet_name="전체", index=False)
                 
@@ -149,17 +251,67 @@ class FastLawCollector:
             print(f"❌ 저장 오류: {e}")
             return ""
 
+    def save_to_db(self, db_path="data/regrader.db"):
+        """법령 DB(law_db)에 적재 (Excel은 DB 조회로 생성 가능)"""
+        
+        if len(self.all_laws) == 0:
+            print("❌ 저장할 데이터가 없습니다.")
+            return 0
+        
+        from corpus_index import COLLECTED_DATASET
+        from law_db import LawDatabase
+        
+        status = "partial" if self.errors else "ok"
+        with profile_stage("db"), LawDatabase(db_path) as db:
+            run_id = db.start_crawl_run("FastLawCollector", self._run_params())
+            ids = db.import_corpus_records(self.all_laws.to_dict("records"), dataset=COLLECTED_DATASET)
+            db.finish_crawl_run(run_id, len(ids), status)
+        
+        print(f"\n🗄️  DB 적재 완료: {db_path} ({len(ids):,}개{', 일부 페이지 오류' if self.errors else ''})")
+        return len(ids)
+    
+    def record_failed_run(self, error, db_path="data/regrader.db"):
+        """수집 중단(쿼터 소진 등) → 적재 없이 수집이력만 failed로 기록"""
+        
+        from law_db import LawDatabase
+        
+        with LawDatabase(db_path) as db:
+            run_id = db.start_crawl_run("FastLawCollector", self._run_params(str(error)))
+            db.finish_crawl_run(run_id, 0, "failed")
+    
+    def _run_params(self, error=None):
+        params = {"targets": ["law", "eflaw"], "oc": self.oc}
+        if self.errors or error:
+            params["errors"] = self.errors + ([error] if error else [])
+        return params
+
 def main():
     """메인 실행"""
     
-    collector = FastLawCollector()
+    profiling_hooks.init("fast_law_collector")
+    
+    # 수집 응답 아카이브 (재처리: python crawl_archive.py reprocess <아카이브>)
+    archive = CrawlArchive.new_run("collector", {"oc": default_oc()})
+    collector = FastLawCollector(archive=archive)
     
     # 법령 수집
-    df_laws = collector.collect_all_laws()
+    try:
+        if "--ndjson" in sys.argv[1:]:
+            with profile_stage("stream_ndjson"):
+                collector.stream_ndjson()
+            return 0
+        df_laws = collector.collect_all_laws()
+    except QuotaExceeded as e:
+        print(f"❌ 수집 중단 (쿼터 소진): {e}", file=sys.stderr)
+        return 1
+    finally:
+        if archive is not None:
+            archive.close()
+            print(f"📦 수집 아카이브: {archive.path}", file=sys.stderr)
     
     if len(df_laws) == 0:
         print("❌ 수집된 법령이 없습니다.")
-        return
+        return 1
     
     # Excel 저장
     saved_file = collector.save_to_excel()
@@ -169,4 +321,4 @@ def main():
         print(f"📂 파일: {saved_file}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
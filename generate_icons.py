@@ -1,7 +1,9 @@
 #!/usr/bin/env python3
 """
 RegRader 앱 아이콘 생성 스크립트
-사용법: python generate_icons.py
+사용법: python generate_icons.py [--force]
+- 고유 크기별 1회 계산(가까운 큰 크기에서 단계 축소), 병렬 인코딩
+- 원본 해시/크기 명세가 같으면 생략 (data/icon_cache.json)
 
 필요 라이브러리:
   pip install Pillow
@@ -11,6 +13,10 @@ RegRader 앱 아이콘 생성 스크립트
 
 from PIL import Image
 import os
+import sys
+import time
+
+from icon_pipeline import build_icons, file_sha256
 
 # 원본 아이콘 경로 (512x512 png)
 SOURCE_ICON = "docs/icon-512.png"
@@ -43,40 +49,28 @@ ANDROID_ICONS = [
 # Google Play Store용
 PLAY_STORE_ICON_SIZE = 512
 
-def create_ios_icons(src_img, output_dir="icons/ios"):
-    os.makedirs(output_dir, exist_ok=True)
-    print("iOS 아이콘 생성 중...")
-    for filename, size in IOS_ICONS:
-        img = src_img.copy()
-        img = img.resize((size, size), Image.LANCZOS)
-        out_path = os.path.join(output_dir, filename)
-        img.save(out_path, "PNG")
-        print(f"  {filename} ({size}x{size})")
-    print(f"iOS 아이콘 {len(IOS_ICONS)}개 생성 완료 -> {output_dir}/")
-
-def create_android_icons(src_img, output_dir="icons/android"):
-    os.makedirs(output_dir, exist_ok=True)
-    print("Android 아이콘 생성 중...")
+def ios_outputs(output_dir="icons/ios"):
+    """iOS 출력 목록 [(경로, 크기)]"""
+    return [(os.path.join(output_dir, filename), size) for filename, size in IOS_ICONS]
+
+def android_outputs(output_dir="icons/android"):
+    """Android 출력 목록 [(경로, 크기)] (Round icon 버전 + Google Play 스토어용 포함)"""
+    outputs = []
     for folder, size in ANDROID_ICONS:
         folder_path = os.path.join(output_dir, folder)
-        os.makedirs(folder_path, exist_ok=True)
-        img = src_img.copy()
-        img = img.resize((size, size), Image.LANCZOS)
-        out_path = os.path.join(folder_path, "ic_launcher.png")
-        img.save(out_path, "PNG")
+        outputs.append((os.path.join(folder_path, "ic_launcher.png"), size))
+        outputs.append((os.path.join(folder_path, "ic_launcher_round.png"), size))
+    outputs.append((os.path.join(output_dir, "play_store_icon.png"), PLAY_STORE_ICON_SIZE))
+    return outputs
 
-        # Round icon 버전도 생성
-        out_round_path = os.path.join(folder_path, "ic_launcher_round.png")
-        img.save(out_round_path, "PNG")
-        print(f"  {folder}/ic_launcher.png ({size}x{size})")
-
-    # Google Play Store용 512x512
-    play_path = os.path.join(output_dir, "play_store_icon.png")
-    img_play = src_img.copy().resize((PLAY_STORE_ICON_SIZE, PLAY_STORE_ICON_SIZE), Image.LANCZOS)
-    img_play.save(play_path, "PNG")
-    print(f"  play_store_icon.png ({PLAY_STORE_ICON_SIZE}x{PLAY_STORE_ICON_SIZE}) - Google Play 스토어용")
+def load_source():
+    print(f"원본 아이콘 로드: {SOURCE_ICON}")
+    src_img = Image.open(SOURCE_ICON).convert("RGBA")
+    print(f"원본 크기: {src_img.size[0]}x{src_img.size[1]}")
 
-    print(f"Android 아이콘 생성 완료 -> {output_dir}/")
+    if src_img.size[0] < 512 or src_img.size[1] < 512:
+        print("경고: 원본 이미지가 512x512 미만입니다. 화질 저하가 발생할 수 있습니다.")
+    return src_img
 
 def main():
     if not os.path.exists(SOURCE_ICON):
@@ -84,15 +78,19 @@ def main():
         print("   docs/icon-512.png 파일을 확인해주세요.")
         return
 
-    print(f"원본 아이콘 로드: {SOURCE_ICON}")
-    src_img = Image.open(SOURCE_ICON).convert("RGBA")
-    print(f"원본 크기: {src_img.size[0]}x{src_img.size[1]}")
-
-    if src_img.size[0] < 512 or src_img.size[1] < 512:
-        print("경고: 원본 이미지가 512x512 미만입니다. 화질 저하가 발생할 수 있습니다.")
+    outputs = ios_outputs() + android_outputs()
+    sizes = sorted({size for _, size in outputs}, reverse=True)
+    start = time.perf_counter()
+    written = build_icons("app_icons", file_sha256(SOURCE_ICON), load_source, outputs,
+                          force="--force" in sys.argv)
+    if written is None:
+        print("원본/크기 명세 변경 없음 - 아이콘 생성 생략 (--force 로 강제 재생성)")
+        return
 
-    create_ios_icons(src_img)
-    create_android_icons(src_img)
+    for path, size in outputs:
+        print(f"  {os.path.relpath(path, 'icons')} ({size}x{size})")
+    print(f"고유 크기 {len(sizes)}개 계산, 출력 {len(outputs)}개 기록 "
+          f"({sum(written.values()):,} bytes, {time.perf_counter() - start:.2f}s)")
 
     print("모든 아이콘 생성 완료!")
     print("생성된 폴더:")
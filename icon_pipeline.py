@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+앱 아이콘 에셋 파이프라인 (generate_icons.py / create_icons.py 공용)
+- 출력 목록(파일, 크기)에서 고유 크기만 1회씩 계산
+- 큰 크기부터 직전 중간 결과(가장 가까운 큰 크기)에서 축소 → 매번 원본 전체를 리샘플링하지 않음
+- 같은 크기의 여러 출력(예: 120px 2개, ic_launcher/ic_launcher_round)은 1회 인코딩 후 바이트 복사
+- PNG 인코딩은 코어 수만큼 병렬 처리
+- 원본 해시 + 크기 명세가 이전 실행과 같고 출력이 모두 있으면 전체 생략
+
+필요 라이브러리:
+  pip install Pillow
+"""
+
+import hashlib
+import io
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+CACHE_PATH = os.environ.get("ICON_CACHE", "data/icon_cache.json")
+
+
+def file_sha256(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def spec_key(source_hash, outputs):
+    """원본 해시 + 크기 명세 → 캐시 키"""
+    spec = json.dumps(sorted(outputs), ensure_ascii=False)
+    return hashlib.sha256(f"{source_hash}|{spec}".encode("utf-8")).hexdigest()
+
+
+def group_by_size(outputs):
+    """[(경로, 크기)] → {크기: [경로, ...]}"""
+    groups = {}
+    for path, size in outputs:
+        groups.setdefault(size, []).append(path)
+    return groups
+
+
+def cascade_resize(src_img, sizes):
+    """고유 크기별 리사이즈. 원본보다 작은 크기는 가장 가까운 큰 중간 결과에서 축소"""
+    from PIL import Image
+
+    results = {}
+    base = src_img
+    for size in sorted(set(sizes), reverse=True):
+        if (size, size) == src_img.size:
+            results[size] = src_img
+            continue
+        # 원본보다 큰 크기(App Store 1024 등)는 원본에서 직접 확대
+        parent = src_img if size > min(src_img.size) else base
+        results[size] = parent.resize((size, size), Image.LANCZOS)
+        if size < min(src_img.size):
+            base = results[size]
+    return results
+
+
+def _encode_and_write(img, paths):
+    """PNG 1회 인코딩 → 같은 크기의 모든 출력 경로에 기록 (프로세스 풀 작업 단위)"""
+    buf = io.BytesIO()
+    img.save(buf, "PNG")
+    data = buf.getvalue()
+    for path in paths:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(data)
+    return len(data)
+
+
+def encode_all(images, groups, workers=None):
+    """크기별 이미지를 병렬 인코딩/저장 → {크기: 바이트 수}"""
+    workers = workers or os.cpu_count() or 1
+    jobs = [(size, images[size], groups[size]) for size in sorted(groups, reverse=True)]
+    if workers <= 1 or len(jobs) <= 1:
+        return {size: _encode_and_write(img, paths) for size, img, paths in jobs}
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+        futures = {size: pool.submit(_encode_and_write, img, paths) for size, img, paths in jobs}
+        return {size: fut.result() for size, fut in futures.items()}
+
+
+def load_cache(path=CACHE_PATH):
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_cache(cache, path=CACHE_PATH):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(cache, f, ensure_ascii=False, indent=2)
+
+
+def is_fresh(name, key, outputs, cache_path=CACHE_PATH):
+    """이전 실행과 키가 같고 출력 파일이 모두 존재하면 True"""
+    entry = load_cache(cache_path).get(name)
+    return bool(entry) and entry.get("key") == key and all(os.path.exists(p) for p, _ in outputs)
+
+
+def mark_fresh(name, key, outputs, cache_path=CACHE_PATH):
+    cache = load_cache(cache_path)
+    cache[name] = {"key": key, "outputs": sorted(p for p, _ in outputs)}
+    save_cache(cache, cache_path)
+
+
+def build_icons(name, source_hash, render, outputs, force=False, workers=None, cache_path=CACHE_PATH):
+    """
+    아이콘 세트 생성
+    - render(): 원본 RGBA 이미지 (캐시 적중 시 호출하지 않음)
+    - outputs: [(경로, 크기)]
+    반환: None(변경 없음 → 생략) 또는 {크기: 바이트 수}
+    """
+    key = spec_key(source_hash, outputs)
+    if not force and is_fresh(name, key, outputs, cache_path):
+        return None
+    groups = group_by_size(outputs)
+    images = cascade_resize(render(), groups)
+    written = encode_all(images, groups, workers)
+    mark_fresh(name, key, outputs, cache_path)
+    return written
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+기본법규 증분 매칭
+- 기본법규 1건 추가/삭제 시 수집법령 인덱스 조회만으로 매칭 결과 갱신
+- 총 매칭 수, 분기별 분포, 직무별 집계, TOP 3를 전체 재실행 없이 즉시 반영
+- 법령 DB(base_laws, matches) 동시 갱신
+
+사용법:
+  python incremental_matcher.py add "근로복지기본법 시행령" 인사노무
+  python incremental_matcher.py remove law_208
+"""
+
+import sys
+import time
+from collections import Counter
+
+from corpus_index import CorpusIndex, default_dataset
+from create_207_base_laws import determine_law_type, determine_ministry
+from law_db import LawDatabase, quarter_of
+
+MATCH_TYPE = "100%완전일치"
+
+
+def build_match(company_law, collected_law):
+    """매칭 결과 레코드 (ExactMatchingAnalyzer.find_exact_matches와 동일 구성)"""
+    return {
+        "당사법규ID": company_law["법규ID"],
+        "당사법령명": company_law["법령명"],
+        "직무카테고리": company_law["직무카테고리"],
+        "당사시행일자": company_law.get("시행일자"),
+        "수집법령명": collected_law.get("법령명"),
+        "수집시행일자": collected_law.get("시행일자", ""),
+        "법령상태": collected_law.get("법령상태", ""),
+        "법령종류": collected_law.get("법령종류", ""),
+        "소관부처": collected_law.get("소관부처", ""),
+        "수집소스": collected_law.get("수집소스", ""),
+        "매칭타입": MATCH_TYPE,
+    }
+
+
+class MatchAggregates:
+    """매칭 집계 (증감 반영)"""
+
+    def __init__(self):
+        self.total = 0
+        self.by_quarter = Counter()
+        self.by_category = Counter()
+        self.by_status = Counter()
+
+    def apply(self, match, sign=1):
+        self.total += sign
+        quarter = quarter_of(str(match.get("수집시행일자") or ""))
+        if quarter:
+            self.by_quarter[quarter] += sign
+        self.by_category[match["직무카테고리"]] += sign
+        self.by_status[match.get("법령상태") or ""] += sign
+        for counter in (self.by_quarter, self.by_category, self.by_status):
+            for key in [k for k, v in counter.items() if v <= 0]:
+                del counter[key]
+
+    def top(self, n=3):
+        return self.by_category.most_common(n)
+
+    def summary(self):
+        return {
+            "total": self.total,
+            "quarters": {q: self.by_quarter.get(q, 0) for q in ("Q1", "Q2", "Q3", "Q4")},
+            "categories": dict(self.by_category),
+            "statuses": dict(self.by_status),
+            "top3": self.top(3),
+        }
+
+
+class IncrementalMatcher:
+    """기본법규 증분 매칭기"""
+
+    def __init__(self, corpus, company_laws=(), db=None):
+        self.corpus = corpus
+        self.db = db
+        self.company_laws = {}
+        self.matches = {}
+        self.aggregates = MatchAggregates()
+        for law in company_laws:
+            self._add(law)
+
+    def _add(self, company_law):
+        law_id = company_law["법규ID"]
+        if law_id in self.company_laws:
+            self._remove(law_id)
+        self.company_laws[law_id] = company_law
+        found = [build_match(company_law, rec) for rec in self.corpus.lookup(company_law["법령명"])]
+        self.matches[law_id] = found
+        for match in found:
+            self.aggregates.apply(match, +1)
+        return found
+
+    def _remove(self, law_id):
+        self.company_laws.pop(law_id, None)
+        removed = self.matches.pop(law_id, [])
+        for match in removed:
+            self.aggregates.apply(match, -1)
+        return removed
+
+    def add_base_law(self, company_law):
+        """기본법규 추가 → 추가된 매칭 목록"""
+        found = self._add(company_law)
+        if self.db is not None:
+            self._persist_add(company_law)
+        return found
+
+    def remove_base_law(self, law_id):
+        """기본법규 삭제 → 제거된 매칭 목록 (DB 매칭은 모든 데이터셋에서 삭제, law_db.delete_base_law)"""
+        removed = self._remove(law_id)
+        if self.db is not None:
+            self.db.delete_base_law(law_id)
+        return removed
+
+    def _persist_add(self, company_law):
+        self.db.upsert_base_laws([{
+            "id": company_law["법규ID"],
+            "title": company_law["법령명"],
+            "categories": [company_law["직무카테고리"]],
+            "lawType": company_law.get("법령종류"),
+            "effectiveDate": company_law.get("시행일자"),
+            "status": company_law.get("상태", "현행"),
+            "meta": {"ministry": company_law.get("소관부처")},
+        }])
+        now = time.strftime("%Y-%m-%dT%H:%M:%S")
+        with self.db.conn:
+            # 같은 데이터셋의 기존 매칭만 교체 (index/quarterly 등 다른 데이터셋 매칭은 유지)
+            if self.corpus.dataset:
+                self.db.conn.execute(
+                    "DELETE FROM matches WHERE base_law_id = ? AND corpus_id IN "
+                    "(SELECT id FROM corpus WHERE dataset = ?)",
+                    (company_law["법규ID"], self.corpus.dataset))
+            else:
+                self.db.conn.execute("DELETE FROM matches WHERE base_law_id = ?", (company_law["법규ID"],))
+            self.db.conn.executemany(
+                "INSERT INTO matches (base_law_id, corpus_id, match_type, matched_at) VALUES (?, ?, ?, ?)",
+                [(company_law["법규ID"], rec["corpus_id"], MATCH_TYPE, now)
+                 for rec in self.corpus.lookup(company_law["법령명"]) if rec.get("corpus_id")])
+
+    def all_matches(self):
+        return [m for found in self.matches.values() for m in found]
+
+    def next_law_id(self):
+        numbers = [int(i.split("_")[1]) for i in self.company_laws if i.startswith("law_") and i[4:].isdigit()]
+        return f"law_{max(numbers, default=0) + 1:03d}"
+
+
+def company_law_from_db_row(row):
+    return {
+        "법규ID": row["id"],
+        "법령명": row["title"],
+        "직무카테고리": row["category"] or "미분류",
+        "시행일자": row["effective_date"],
+        "법령종류": row["law_type"],
+        "소관부처": row["ministry"],
+    }
+
+
+def main():
+    """메인 실행"""
+
+    if len(sys.argv) < 3 or sys.argv[1] not in ("add", "remove"):
+        print(__doc__)
+        return
+
+    with LawDatabase() as db:
+        corpus = CorpusIndex.cached_from_db(db, default_dataset(db))
+        if not len(corpus):
+            print("❌ 법령 DB에 수집법령이 없습니다. (python law_db.py 먼저 실행)")
+            return
+        matcher = IncrementalMatcher(corpus, [company_law_from_db_row(r) for r in db.base_laws()], db)
+        print(f"📋 기본법규 {len(matcher.company_laws)}개, 매칭 {matcher.aggregates.total}개")
+
+        start = time.perf_counter()
+        if sys.argv[1] == "add":
+            title = sys.argv[2]
+            category = sys.argv[3] if len(sys.argv) > 3 else "미분류"
+            law = {
+                "법규ID": matcher.next_law_id(),
+                "법령명": title,
+                "직무카테고리": category,
+                "시행일자": None,
+                "법령종류": determine_law_type(title),
+                "소관부처": determine_ministry(title, category),
+            }
+            changed = matcher.add_base_law(law)
+            print(f"\n➕ {law['법규ID']} {title}: {len(changed)}개 매칭 추가")
+        else:
+            changed = matcher.remove_base_law(sys.argv[2])
+            print(f"\n➖ {sys.argv[2]}: {len(changed)}개 매칭 제거")
+        elapsed = (time.perf_counter() - start) * 1000
+
+        for match in changed:
+            print(f"   📅 {match['수집시행일자']}: {match['수집법령명']} ({match['법령상태']})")
+
+        summary = matcher.aggregates.summary()
+        print(f"\n📊 갱신된 집계 ({elapsed:.2f}ms):")
+        print(f"   • 총 매칭: {summary['total']}개")
+        print(f"   • 분기별: {summary['quarters']}")
+        print(f"   • TOP 3: {', '.join(f'{c}({n})' for c, n in summary['top3'])}")
+
+
+if __name__ == "__main__":
+    main()
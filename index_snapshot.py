@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+사전 구축 인덱스 스냅샷 (웜 스타트)
+- 수집법령 인덱스(CorpusIndex: 레코드 + 정규화 법령명 색인), 조회 API 인덱스(LawIndex: 카테고리/부처/
+  분기/상태 패싯 + 제목 정렬 배열 + 정렬 순위)를 버전 있는 스냅샷 파일 1개로 저장 → 재시작 시 한 번에 로드
+- 파일 구성: 매직 + 헤더(JSON: 형식 버전, 원본 파일 크기/mtime/sha256, 추가 지문) + pickle 본문
+  → 헤더만 읽어 유효성 확인 후 본문 로드 (무효면 본문은 읽지 않음)
+- 원본 파일 해시가 바뀌면 자동 무효화 후 재구축 (크기·mtime 동일하면 해시 재계산 생략)
+  인덱스 생성 코드(정규화 규칙 등) 파일도 원본에 포함 → 코드 변경 시에도 재구축
+- 법령 DB 원본은 파일 대신 데이터셋 지문(건수, 최대 id, 최대 updated_at + 법령명 별칭 해시)으로 확인
+
+사용법:
+  from index_snapshot import cached
+  index = cached("corpus", key, [원본 파일…], build)          (없거나 무효면 build() 후 저장)
+  python index_snapshot.py list | clear                          (data/snapshots/)
+  python index_snapshot.py warm                                  (매칭/조회 API 스냅샷 미리 생성)
+설정(환경변수): REGRADER_SNAPSHOT_DIR, REGRADER_SNAPSHOT=0 (스냅샷 미사용)
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import struct
+import sys
+import time
+
+SNAPSHOT_DIR = os.environ.get("REGRADER_SNAPSHOT_DIR", "data/snapshots")
+FORMAT_VERSION = 1  # 스냅샷 구조가 바뀌면 올림 (기존 파일 자동 무효)
+MAGIC = b"RGSNAP\x00\x01"
+
+
+def enabled():
+    return os.environ.get("REGRADER_SNAPSHOT", "1") not in ("0", "off", "false")
+
+
+def file_digest(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def source_entry(path):
+    st = os.stat(path)
+    return {"path": os.path.abspath(path), "size": st.st_size, "mtime_ns": st.st_mtime_ns,
+            "sha256": file_digest(path)}
+
+
+def _source_valid(entry):
+    try:
+        st = os.stat(entry["path"])
+    except OSError:
+        return False
+    if st.st_size == entry["size"] and st.st_mtime_ns == entry["mtime_ns"]:
+        return True
+    # touch/복사로 mtime만 바뀐 경우는 내용 해시로 판단
+    return st.st_size == entry["size"] and file_digest(entry["path"]) == entry["sha256"]
+
+
+def snapshot_path(kind, key):
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:10]
+    return os.path.join(SNAPSHOT_DIR, f"{kind}.{digest}.snap")
+
+
+def _read_header(f):
+    if f.read(len(MAGIC)) != MAGIC:
+        return None
+    (size,) = struct.unpack(">I", f.read(4))
+    return json.loads(f.read(size))
+
+
+def read_header(path):
+    """스냅샷 헤더 (본문 미로드). 형식이 다르면 None"""
+    with open(path, "rb") as f:
+        return _read_header(f)
+
+
+def load(kind, key, sources, fingerprint=None):
+    """유효한 스냅샷 객체 또는 None"""
+    path = snapshot_path(kind, key)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "rb") as f:
+            header = _read_header(f)
+            if (header is None or header.get("version") != FORMAT_VERSION or header.get("kind") != kind
+                    or header.get("key") != key or header.get("fingerprint") != fingerprint):
+                return None
+            wanted = sorted(os.path.abspath(p) for p in sources)
+            if sorted(e["path"] for e in header["sources"]) != wanted:
+                return None
+            if not all(_source_valid(e) for e in header["sources"]):
+                return None
+            return pickle.load(f)
+    except (OSError, ValueError, struct.error, pickle.UnpicklingError, EOFError):
+        return None
+
+
+def save(kind, key, sources, obj, fingerprint=None):
+    """스냅샷 저장 (임시 파일 → rename). 경로 반환"""
+    os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+    header = json.dumps({
+        "version": FORMAT_VERSION,
+        "kind": kind,
+        "key": key,
+        "fingerprint": fingerprint,
+        "sources": [source_entry(p) for p in sources],
+        "createdAt": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }, ensure_ascii=False).encode("utf-8")
+    path = snapshot_path(kind, key)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack(">I", len(header)))
+        f.write(header)
+        pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+    return path
+
+
+def cached(kind, key, sources, build, fingerprint=None):
+    """스냅샷이 유효하면 로드, 아니면 build() 결과를 저장 후 반환
+
+    sources:     내용이 바뀌면 무효화할 파일 경로 목록 (원본 데이터 + 인덱스 생성 코드)
+    fingerprint: 파일로 표현되지 않는 원본 상태 (예: 법령 DB 데이터셋 지문)
+    """
+    if not enabled():
+        return build()
+    obj = load(kind, key, sources, fingerprint)
+    if obj is not None:
+        return obj
+    obj = build()
+    try:
+        save(kind, key, sources, obj, fingerprint)
+    except OSError as e:
+        print(f"⚠️  스냅샷 저장 실패 ({kind}): {e}", file=sys.stderr)
+    return obj
+
+
+def db_fingerprint(db, dataset):
+    """법령 DB 데이터셋 지문 (적재/재분류/별칭 변경 시 변경)"""
+    row = db.conn.execute(
+        "SELECT COUNT(*), MAX(id), MAX(updated_at) FROM corpus WHERE dataset = ?", (dataset,)).fetchone()
+    return f"{dataset}:{row[0]}:{row[1]}:{row[2]}:{aliases_fingerprint(db)}"
+
+
+def aliases_fingerprint(db=None):
+    """법령명 별칭(law_aliases) 지문 — 다른 데이터셋 적재로 별칭만 바뀌어도 무효화"""
+    if db is None:
+        from law_db import DB_PATH, LawDatabase
+
+        if not os.path.exists(DB_PATH):
+            return "none"
+        with LawDatabase(DB_PATH) as db:
+            return aliases_fingerprint(db)
+    h = hashlib.sha256()
+    for alias, head in db.conn.execute("SELECT norm_title, canonical FROM law_aliases ORDER BY norm_title"):
+        h.update(f"{alias}\0{head}\n".encode("utf-8"))
+    return h.hexdigest()[:16]
+
+
+def main(argv=None):
+    """메인 실행"""
+
+    argv = sys.argv[1:] if argv is None else argv
+    command = argv[0] if argv else "list"
+    if command == "warm":
+        from corpus_index import CorpusIndex
+        from law_query_server import DATA_FILES, LawIndex
+        from multi_tenant_matcher import CORPUS_EXCEL
+
+        for label, build in (("수집법령 인덱스", lambda: CorpusIndex.cached_from_excel(CORPUS_EXCEL)),
+                             ("조회 API 인덱스", lambda: LawIndex.cached_from_files(DATA_FILES))):
+            start = time.perf_counter()
+            build()
+            print(f"🔥 {label}: {(time.perf_counter() - start) * 1000:.1f}ms")
+        command = "list"
+    if command == "clear":
+        removed = 0
+        for fname in os.listdir(SNAPSHOT_DIR) if os.path.isdir(SNAPSHOT_DIR) else []:
+            if fname.endswith(".snap"):
+                os.remove(os.path.join(SNAPSHOT_DIR, fname))
+                removed += 1
+        print(f"🧹 스냅샷 {removed}개 삭제")
+        return 0
+    if command != "list":
+        print(__doc__)
+        return 1
+
+    print(f"📦 인덱스 스냅샷 ({SNAPSHOT_DIR})")
+    print("=" * 60)
+    for fname in sorted(os.listdir(SNAPSHOT_DIR)) if os.path.isdir(SNAPSHOT_DIR) else []:
+        if not fname.endswith(".snap"):
+            continue
+        path = os.path.join(SNAPSHOT_DIR, fname)
+        header = read_header(path)
+        if header is None:
+            print(f"   ❌ {fname}: 형식 불일치")
+            continue
+        fresh = header["version"] == FORMAT_VERSION and all(_source_valid(e) for e in header["sources"])
+        print(f"   {'✅' if fresh else '♻️ '} {fname} ({os.path.getsize(path):,} bytes, {header['createdAt']}) "
+              f"{header['key']}" + ("" if fresh else " — 원본 변경, 다음 로드 시 재구축"))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+법령명 별칭 인덱스 (제명 변경 추적)
+- 과거 법령명 → 현재 법령명(정규화) O(1) 조회: 이름이 바뀐 기본법규도 매칭/중복 제거/이력 조회 유지
+- 근거 (union-find로 같은 법령끼리 묶음)
+  · 개정문 제명 변경 조항: 제명 "폐광지역 개발 지원에 관한 특별법"을 "석탄산업전환지역 …"으로
+    (amendment_terms kind=title/related_title, 하위법령 "… 시행령"/"… 시행규칙"에도 적용)
+  · lsId 연속성: 같은 법령ID(corpus / law_versions)의 서로 다른 법령명
+- 대표 이름: 다른 이름으로 바뀐 적 없는(또는 그 뒤 다시 붙은) 이름 → 최근 제명 변경일/시행일자 순
+- 결과는 법령 DB law_aliases 테이블 (corpus 적재/개정내역 재색인 시 재생성)
+
+사용법:
+  python law_alias_index.py build
+  python law_alias_index.py lookup "폐광지역 개발 지원에 관한 특별법"
+"""
+
+import os
+import re
+import sys
+
+from exact_matching_analyzer import normalize_law_name
+
+SUB_SUFFIXES = (" 시행령", " 시행규칙")  # 제명 변경이 함께 적용되는 하위법령
+
+
+def _day(value):
+    """날짜 비교 키 (YYYYMMDD, 없으면 빈 문자열)"""
+    return re.sub(r"\D", "", str(value or ""))[:8]
+
+
+class AliasIndex:
+    """정규화 법령명 union-find + 대표 이름 사전"""
+
+    def __init__(self):
+        self.parent = {}
+        self.last_seen = {}   # 이름 → 최근 시행일자
+        self.named_at = {}    # 이름 → 그 이름으로 바뀐 날
+        self.renamed_at = {}  # 이름 → 다른 이름으로 바뀐 날
+        self._canonical = None
+
+    def _find(self, name):
+        parent = self.parent
+        root = name
+        while parent[root] != root:
+            root = parent[root]
+        while parent[name] != root:  # 경로 압축
+            parent[name], name = root, parent[name]
+        return root
+
+    def _union(self, a, b):
+        self._canonical = None
+        for name in (a, b):
+            self.parent.setdefault(name, name)
+        ra, rb = self._find(a), self._find(b)
+        if ra != rb:
+            self.parent[rb] = ra
+
+    def add_title(self, name, seen=None):
+        """법령명 등록 (seen: 시행일자 → 같은 묶음에서 최근 이름 우선)"""
+        name = normalize_law_name(name)
+        if not name:
+            return ""
+        self.parent.setdefault(name, name)
+        day = _day(seen)
+        if day > self.last_seen.get(name, ""):
+            self.last_seen[name] = day
+            self._canonical = None
+        return name
+
+    def add_rename(self, old, new, date=None):
+        """제명 변경 old → new (알려진 하위법령 이름에도 적용)"""
+        old, new = normalize_law_name(old), normalize_law_name(new)
+        if not old or not new or old == new:
+            return
+        day = _day(date)
+        for suffix in ("",) + SUB_SUFFIXES:
+            if suffix and old + suffix not in self.parent:
+                continue
+            a, b = old + suffix, new + suffix
+            self._union(b, a)
+            self.renamed_at[a] = max(self.renamed_at.get(a, ""), day)
+            self.named_at[b] = max(self.named_at.get(b, ""), day)
+
+    def add_same_law(self, names):
+        """같은 법령(같은 lsId)의 이름들"""
+        names = [n for n in (normalize_law_name(x) for x in names) if n]
+        for name in names[1:]:
+            self._union(names[0], name)
+
+    def _rank(self, name):
+        renamed = self.renamed_at.get(name)
+        current = renamed is None or self.named_at.get(name, "") > renamed
+        return (current, max(self.named_at.get(name, ""), self.last_seen.get(name, "")), name)
+
+    def _resolve(self):
+        if self._canonical is None:
+            groups = {}
+            for name in self.parent:
+                groups.setdefault(self._find(name), []).append(name)
+            canonical = {}
+            for members in groups.values():
+                if len(members) > 1:
+                    head = max(members, key=self._rank)
+                    canonical.update((m, head) for m in members if m != head)
+            self._canonical = canonical
+        return self._canonical
+
+    def canonical(self, name):
+        """법령명 → 대표 정규화 법령명 (별칭이 없으면 정규화 이름 그대로)"""
+        name = normalize_law_name(name)
+        return self._resolve().get(name, name)
+
+    def members(self, name):
+        """같은 법령의 모든 이름 (대표 이름 먼저)"""
+        head = self.canonical(name)
+        return [head] + sorted(a for a, c in self._resolve().items() if c == head)
+
+    def pairs(self):
+        """(별칭, 대표 이름) 목록 — law_aliases 테이블 행"""
+        return sorted(self._resolve().items())
+
+    def __len__(self):
+        return len(self._resolve())
+
+    def __getstate__(self):
+        # 스냅샷(CorpusIndex 피클)에는 조회용 사전만 저장
+        return {"canonical": self._resolve()}
+
+    def __setstate__(self, state):
+        self.__init__()
+        for alias, head in state["canonical"].items():
+            self._union(head, alias)
+            self.renamed_at[alias] = ""
+        self._canonical = dict(state["canonical"])
+
+    @classmethod
+    def from_db(cls, db):
+        """법령 DB에서 생성: corpus/law_versions lsId 연속성 + 개정문 제명 변경 조항"""
+        index = cls()
+        by_ls_id = {}
+        for table in ("corpus", "law_versions"):
+            for r in db.conn.execute(
+                    f"SELECT ls_id, norm_title, MAX(effective_date) FROM {table} GROUP BY ls_id, norm_title"):
+                name = index.add_title(r[1], r[2])
+                if r[0] and name:
+                    by_ls_id.setdefault(r[0], set()).add(name)
+        for names in by_ls_id.values():
+            index.add_same_law(sorted(names))
+        for r in db.conn.execute(
+                "SELECT t.old_term, t.new_term, a.date FROM amendment_terms t "
+                "JOIN amendments a ON a.id = t.amendment_id "
+                "WHERE t.kind IN ('title', 'related_title') ORDER BY a.date"):
+            index.add_rename(r[0], r[1], r[2])
+        return index
+
+    @classmethod
+    def from_records(cls, records, base=None):
+        """수집 레코드(법령ID/법령명/시행일자)에서 생성 (base: 기존 별칭에 추가)"""
+        index = cls()
+        if base is not None:
+            index.__setstate__(base.__getstate__())
+        by_ls_id = {}
+        for rec in records:
+            name = index.add_title(rec.get("법령명"), rec.get("시행일자"))
+            if rec.get("법령ID") and name:
+                by_ls_id.setdefault(rec["법령ID"], set()).add(name)
+        for names in by_ls_id.values():
+            index.add_same_law(sorted(names))
+        return index
+
+    @classmethod
+    def load(cls, db=None, db_path=None):
+        """법령 DB law_aliases 테이블 → 인덱스 (DB가 없으면 빈 인덱스)"""
+        if db is None:
+            from law_db import DB_PATH, LawDatabase
+
+            db_path = db_path or DB_PATH
+            if not os.path.exists(db_path):
+                return cls()
+            with LawDatabase(db_path) as db:
+                return cls.load(db)
+        return cls.from_pairs(db.conn.execute("SELECT norm_title, canonical FROM law_aliases"))
+
+    @classmethod
+    def from_pairs(cls, pairs):
+        index = cls()
+        index.__setstate__({"canonical": {alias: head for alias, head in pairs}})
+        return index
+
+
+def main():
+    """메인 실행"""
+
+    if len(sys.argv) < 2 or sys.argv[1] not in ("build", "lookup"):
+        print(__doc__)
+        return 1
+
+    from law_db import LawDatabase
+
+    with LawDatabase() as db:
+        if sys.argv[1] == "build":
+            count = db.rebuild_aliases()
+            print(f"🔗 법령명 별칭 {count:,}개")
+            for alias, head in db.conn.execute("SELECT norm_title, canonical FROM law_aliases LIMIT 20"):
+                print(f"   • {alias} → {head}")
+            return 0
+        index = AliasIndex.load(db)
+    for name in sys.argv[2:]:
+        members = index.members(name)
+        print(f"📜 {name} → {members[0]}")
+        for alias in members[1:]:
+            print(f"   • 별칭: {alias}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,832 @@
+#!/usr/bin/env python3
+"""
+RegRader 법령 DB (SQLite)
+- 수집법령(corpus) / 기본법규(base_laws) / 매칭(matches) / 개정내역(amendments + 조문 색인) / 수집이력(crawl_runs)
+  / 알림 발송이력(notification_deliveries) / 법령명 별칭(law_aliases)
+- 정규화 법령명, lsId, 시행일자, 카테고리, 소관부처 인덱스
+- 대량 upsert는 단일 트랜잭션
+- 법령명 별칭은 적재가 별칭 입력(lsId·법령명·최근 시행일자·제명 변경 조항)을 바꿀 때만 재생성
+  (여러 파일 적재는 deferred_aliases() 블록으로 끝에서 1회)
+- docs/*.json, Excel 산출물은 DB 조회로 생성
+"""
+
+import contextlib
+import json
+import os
+import re
+import sqlite3
+from datetime import datetime
+
+from exact_matching_analyzer import normalize_law_name
+
+DB_PATH = "data/regrader.db"
+
+AMEND_TYPE_RE = re.compile(r"(전부개정|일부개정|타법개정|일괄개정|타법폐지|폐지|제정)")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS corpus (
+    id              INTEGER PRIMARY KEY,
+    dataset         TEXT NOT NULL,
+    source_key      TEXT NOT NULL,
+    year            INTEGER,
+    item_id         TEXT,
+    title           TEXT NOT NULL,
+    norm_title      TEXT NOT NULL,
+    original_title  TEXT,
+    abbreviation    TEXT,
+    ls_id           TEXT,
+    serial_no       TEXT,
+    law_type        TEXT,
+    amend_type      TEXT,
+    effective_date  TEXT,
+    announced_date  TEXT,
+    announce_no     TEXT,
+    ministry        TEXT,
+    status          TEXT,
+    category        TEXT,
+    categories      TEXT,
+    summary         TEXT,
+    source          TEXT,
+    link            TEXT,
+    updated_at      TEXT,
+    UNIQUE (dataset, source_key)
+);
+CREATE INDEX IF NOT EXISTS idx_corpus_norm_title ON corpus (norm_title);
+CREATE INDEX IF NOT EXISTS idx_corpus_ls_id ON corpus (ls_id);
+CREATE INDEX IF NOT EXISTS idx_corpus_effective_date ON corpus (effective_date);
+CREATE INDEX IF NOT EXISTS idx_corpus_category ON corpus (category);
+CREATE INDEX IF NOT EXISTS idx_corpus_ministry ON corpus (ministry);
+CREATE INDEX IF NOT EXISTS idx_corpus_dataset_year ON corpus (dataset, year);
+
+CREATE TABLE IF NOT EXISTS base_laws (
+    id              TEXT PRIMARY KEY,
+    title           TEXT NOT NULL,
+    norm_title      TEXT NOT NULL,
+    category        TEXT,
+    law_type        TEXT,
+    ministry        TEXT,
+    status          TEXT,
+    effective_date  TEXT,
+    updated_at      TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_base_laws_norm_title ON base_laws (norm_title);
+CREATE INDEX IF NOT EXISTS idx_base_laws_category ON base_laws (category);
+CREATE INDEX IF NOT EXISTS idx_base_laws_ministry ON base_laws (ministry);
+
+-- base_law_id NULL: 기본법규(companyLawId) 없이 matchType만 있는 매칭
+CREATE TABLE IF NOT EXISTS matches (
+    id              INTEGER PRIMARY KEY,
+    base_law_id     TEXT,
+    corpus_id       INTEGER NOT NULL REFERENCES corpus (id) ON DELETE CASCADE,
+    match_type      TEXT,
+    matched_at      TEXT,
+    UNIQUE (base_law_id, corpus_id)
+);
+CREATE INDEX IF NOT EXISTS idx_matches_corpus_id ON matches (corpus_id);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_matches_unbound ON matches (corpus_id) WHERE base_law_id IS NULL;
+
+CREATE TABLE IF NOT EXISTS amendments (
+    id              INTEGER PRIMARY KEY,
+    corpus_id       INTEGER NOT NULL REFERENCES corpus (id) ON DELETE CASCADE,
+    seq             INTEGER NOT NULL,
+    date            TEXT,
+    reason          TEXT,
+    main_contents   TEXT,
+    UNIQUE (corpus_id, seq)
+);
+CREATE INDEX IF NOT EXISTS idx_amendments_date ON amendments (date);
+
+CREATE TABLE IF NOT EXISTS law_versions (
+    id              INTEGER PRIMARY KEY,
+    norm_title      TEXT NOT NULL,
+    title           TEXT NOT NULL,
+    ls_id           TEXT,
+    serial_no       TEXT,
+    effective_date  TEXT NOT NULL,
+    announced_date  TEXT,
+    amend_type      TEXT,
+    law_type        TEXT,
+    ministry        TEXT,
+    dataset         TEXT,
+    first_seen      TEXT,
+    UNIQUE (norm_title, effective_date, serial_no)
+);
+CREATE INDEX IF NOT EXISTS idx_law_versions_effective_date ON law_versions (effective_date);
+
+-- 법령 변경 알림 발송 이력 (notifier.py: 수신자별 이미 보낸 버전은 재발송하지 않음)
+CREATE TABLE IF NOT EXISTS notification_deliveries (
+    recipient       TEXT NOT NULL,
+    version_id      INTEGER NOT NULL REFERENCES law_versions (id) ON DELETE CASCADE,
+    digest_id       TEXT,
+    sent_at         TEXT,
+    PRIMARY KEY (recipient, version_id)
+) WITHOUT ROWID;
+
+-- 과거 법령명 → 현재 법령명 (law_alias_index: 제명 변경 + lsId 연속성, 적재 시 재생성)
+CREATE TABLE IF NOT EXISTS law_aliases (
+    norm_title      TEXT PRIMARY KEY,
+    canonical       TEXT NOT NULL
+) WITHOUT ROWID;
+
+-- 개정문 조문 단위 색인 (amendment_index.parse_amendment, 적재 시 생성)
+CREATE TABLE IF NOT EXISTS amendment_articles (
+    amendment_id    INTEGER NOT NULL REFERENCES amendments (id) ON DELETE CASCADE,
+    article         TEXT NOT NULL,
+    op              TEXT NOT NULL,
+    PRIMARY KEY (article, amendment_id, op)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_amendment_articles_amendment ON amendment_articles (amendment_id);
+CREATE TABLE IF NOT EXISTS amendment_terms (
+    id              INTEGER PRIMARY KEY,
+    amendment_id    INTEGER NOT NULL REFERENCES amendments (id) ON DELETE CASCADE,
+    kind            TEXT NOT NULL,
+    old_term        TEXT NOT NULL,
+    new_term        TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_amendment_terms_amendment ON amendment_terms (amendment_id);
+CREATE INDEX IF NOT EXISTS idx_amendment_terms_old ON amendment_terms (old_term);
+CREATE TABLE IF NOT EXISTS amendment_effective (
+    amendment_id    INTEGER PRIMARY KEY REFERENCES amendments (id) ON DELETE CASCADE,
+    clause          TEXT,
+    effective_date  TEXT,
+    delay           TEXT,
+    has_proviso     INTEGER
+);
+
+-- 법령명 1/2-gram 역색인 (recategorizer: 규칙 키워드 → 후보 레코드)
+CREATE TABLE IF NOT EXISTS title_grams (
+    gram            TEXT NOT NULL,
+    corpus_id       INTEGER NOT NULL REFERENCES corpus (id) ON DELETE CASCADE,
+    PRIMARY KEY (gram, corpus_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS title_gram_rows (
+    corpus_id       INTEGER PRIMARY KEY REFERENCES corpus (id) ON DELETE CASCADE,
+    title           TEXT NOT NULL
+);
+
+-- 분류 규칙(CATE_RULES/MINISTRY_TO_CAT) 버전 및 재분류 이력
+CREATE TABLE IF NOT EXISTS rule_versions (
+    id              INTEGER PRIMARY KEY,
+    hash            TEXT NOT NULL UNIQUE,
+    rules           TEXT NOT NULL,
+    created_at      TEXT
+);
+CREATE TABLE IF NOT EXISTS rule_applications (
+    id              INTEGER PRIMARY KEY,
+    dataset         TEXT NOT NULL,
+    rule_version_id INTEGER NOT NULL REFERENCES rule_versions (id),
+    mode            TEXT,
+    candidates      INTEGER,
+    changed         INTEGER,
+    applied_at      TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_rule_applications_dataset ON rule_applications (dataset);
+CREATE TABLE IF NOT EXISTS category_changes (
+    id              INTEGER PRIMARY KEY,
+    rule_version_id INTEGER NOT NULL REFERENCES rule_versions (id),
+    corpus_id       INTEGER NOT NULL REFERENCES corpus (id) ON DELETE CASCADE,
+    old_categories  TEXT,
+    new_categories  TEXT,
+    changed_at      TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_category_changes_version ON category_changes (rule_version_id);
+
+CREATE TABLE IF NOT EXISTS crawl_runs (
+    id              INTEGER PRIMARY KEY,
+    source          TEXT,
+    params          TEXT,
+    started_at      TEXT,
+    finished_at     TEXT,
+    item_count      INTEGER,
+    status          TEXT
+);
+"""
+
+CORPUS_COLUMNS = [
+    "dataset", "source_key", "year", "item_id", "title", "norm_title", "original_title",
+    "abbreviation", "ls_id", "serial_no", "law_type", "amend_type", "effective_date",
+    "announced_date", "announce_no", "ministry", "status", "category", "categories",
+    "summary", "source", "link", "updated_at",
+]
+
+# 2025_laws_complete.xlsx / FastLawCollector 결과 컬럼 → corpus 컬럼
+EXCEL_COLUMN_MAP = {
+    "법령ID": "ls_id",
+    "법령일련번호": "serial_no",
+    "법령명": "title",
+    "법령약칭": "abbreviation",
+    "법령구분": "law_type",
+    "법령종류": "law_type",
+    "제개정구분": "amend_type",
+    "시행일자": "effective_date",
+    "공포일자": "announced_date",
+    "공포번호": "announce_no",
+    "소관부처": "ministry",
+    "법령상태": "status",
+    "링크": "link",
+    "수집소스": "source",
+}
+
+EXCEL_EXPORT_COLUMNS = [
+    ("법령ID", "ls_id"), ("법령일련번호", "serial_no"), ("법령명", "title"),
+    ("법령약칭", "abbreviation"), ("법령구분", "law_type"), ("제개정구분", "amend_type"),
+    ("시행일자", "effective_date"), ("공포일자", "announced_date"), ("공포번호", "announce_no"),
+    ("소관부처", "ministry"), ("법령상태", "status"), ("링크", "link"),
+]
+
+
+def _text(value):
+    """DB 저장용 문자열 변환 (None/NaN → None)"""
+    if value is None or value != value:
+        return None
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    if hasattr(value, "strftime"):
+        return value.strftime("%Y-%m-%d")
+    value = str(value).strip()
+    return value or None
+
+
+def _date(value):
+    """날짜 문자열 ISO 통일 (20250101 / 2025.01.01 → 2025-01-01)"""
+    value = _text(value)
+    if not value:
+        return None
+    digits = "".join(ch for ch in value[:10] if ch.isdigit())
+    if len(digits) == 8:
+        return f"{digits[:4]}-{digits[4:6]}-{digits[6:]}"
+    return value
+
+
+def _year_of(date_str):
+    return int(date_str[:4]) if date_str and date_str[:4].isdigit() else None
+
+
+def quarter_of(date_str):
+    """YYYY-MM-DD / YYYYMMDD → Q1~Q4"""
+    digits = "".join(ch for ch in str(date_str or "")[:10] if ch.isdigit())
+    if len(digits) < 6 or not 1 <= int(digits[4:6]) <= 12:
+        return None
+    return f"Q{(int(digits[4:6]) - 1) // 3 + 1}"
+
+
+class LawDatabase:
+    """RegRader 법령 DB"""
+
+    def __init__(self, path=DB_PATH):
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        if path != ":memory:":
+            self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.executescript(SCHEMA)
+        self._migrate()
+        self._defer_aliases = 0
+        self._aliases_stale = False
+
+    def _migrate(self):
+        """이전 스키마 DB 보정: matches.base_law_id NOT NULL + 빈 문자열 자리표시 → NULL 허용"""
+        cols = {r["name"]: r for r in self.conn.execute("PRAGMA table_info(matches)")}
+        if not cols["base_law_id"]["notnull"]:
+            return
+        self.conn.execute("ALTER TABLE matches RENAME TO matches_old")
+        self.conn.executescript(SCHEMA)  # 새 matches 테이블
+        with self.conn:
+            self.conn.execute(
+                "INSERT INTO matches (id, base_law_id, corpus_id, match_type, matched_at) "
+                "SELECT id, NULLIF(base_law_id, ''), corpus_id, match_type, matched_at FROM matches_old")
+            self.conn.execute("DROP TABLE matches_old")
+        self.conn.executescript(SCHEMA)  # matches_old와 함께 지워진 인덱스 재생성
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ------------------------------------------------------------------
+    # 적재 (upsert)
+    # ------------------------------------------------------------------
+
+    def upsert_corpus(self, rows, amendments=None, matches=None):
+        """corpus 대량 upsert (단일 트랜잭션). (dataset, source_key) → id 반환
+
+        amendments: {(dataset, source_key): [{"date", "reason", "mainContents"}, ...]}
+        matches:    {(dataset, source_key): [(base_law_id, match_type), ...]}  (base_law_id None 허용)
+        """
+        rows = list(rows)
+        if not rows:
+            return {}
+        now = datetime.now().isoformat(timespec="seconds")
+        placeholders = ", ".join("?" for _ in CORPUS_COLUMNS)
+        updates = ", ".join(f"{c} = excluded.{c}" for c in CORPUS_COLUMNS[2:])
+        sql = (f"INSERT INTO corpus ({', '.join(CORPUS_COLUMNS)}) VALUES ({placeholders}) "
+               f"ON CONFLICT (dataset, source_key) DO UPDATE SET {updates}")
+
+        values = []
+        for row in rows:
+            row = dict(row)
+            row.setdefault("norm_title", normalize_law_name(row.get("title")))
+            row.setdefault("year", _year_of(row.get("effective_date")))
+            row["updated_at"] = now
+            values.append([row.get(c) for c in CORPUS_COLUMNS])
+
+        with self.conn:
+            stale = self._aliases_affected(values)
+            self.conn.executemany(sql, values)
+            ids = self._corpus_ids({(r["dataset"], r["source_key"]) for r in rows})
+
+            if amendments:
+                target = [ids[k] for k in amendments if k in ids]
+                title_terms = self._title_terms(target)
+                self.conn.executemany("DELETE FROM amendments WHERE corpus_id = ?",
+                                      [(i,) for i in target])
+                self.conn.executemany(
+                    "INSERT INTO amendments (corpus_id, seq, date, reason, main_contents) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    [(ids[k], seq, _text(a.get("date")), a.get("reason"), a.get("mainContents"))
+                     for k, items in amendments.items() if k in ids
+                     for seq, a in enumerate(items)])
+                titles = {ids[(r["dataset"], r["source_key"])]: r.get("title") for r in rows}
+                self._index_amendments(target, titles)
+                stale = stale or self._title_terms(target) != title_terms
+
+            if matches:
+                values = [(base_id, ids[k], match_type, now)
+                          for k, pairs in matches.items() if k in ids
+                          for base_id, match_type in pairs]
+                self.conn.executemany(
+                    "INSERT INTO matches (base_law_id, corpus_id, match_type, matched_at) "
+                    "VALUES (?, ?, ?, ?) ON CONFLICT (base_law_id, corpus_id) "
+                    "DO UPDATE SET match_type = excluded.match_type",
+                    [v for v in values if v[0] is not None])
+                self.conn.executemany(
+                    "INSERT INTO matches (base_law_id, corpus_id, match_type, matched_at) "
+                    "VALUES (?, ?, ?, ?) ON CONFLICT (corpus_id) WHERE base_law_id IS NULL "
+                    "DO UPDATE SET match_type = excluded.match_type",
+                    [v for v in values if v[0] is None])
+        if stale:
+            self.mark_aliases_stale()
+        return ids
+
+    def _aliases_affected(self, values):
+        """upsert 할 corpus 행(CORPUS_COLUMNS 순서)이 별칭 입력을 바꾸는지 (적재 전에 호출)
+
+        새 (lsId, 법령명)이거나 더 최근 시행일자, 또는 기존 행의 lsId/법령명/시행일자 변경
+        """
+        col = {c: i for i, c in enumerate(CORPUS_COLUMNS)}
+        names = sorted({v[col["norm_title"]] for v in values})
+        latest = {}
+        for i in range(0, len(names), 500):
+            chunk = names[i:i + 500]
+            marks = ", ".join("?" for _ in chunk)
+            for r in self.conn.execute(
+                    f"SELECT ls_id, norm_title, MAX(effective_date) FROM corpus "
+                    f"WHERE norm_title IN ({marks}) GROUP BY ls_id, norm_title", chunk):
+                latest[(r[0], r[1])] = r[2] or ""
+        for v in values:
+            known = latest.get((v[col["ls_id"]], v[col["norm_title"]]))
+            if known is None or (v[col["effective_date"]] or "") > known:
+                return True
+        previous = {}
+        for dataset in {v[col["dataset"]] for v in values}:
+            for r in self.conn.execute(
+                    "SELECT source_key, ls_id, norm_title, effective_date FROM corpus WHERE dataset = ?",
+                    (dataset,)):
+                previous[(dataset, r[0])] = tuple(r)[1:]
+        for v in values:
+            old = previous.get((v[col["dataset"]], v[col["source_key"]]))
+            if old is not None and old != (v[col["ls_id"]], v[col["norm_title"]], v[col["effective_date"]]):
+                return True
+        return False
+
+    def _title_terms(self, corpus_ids):
+        """corpus 행들의 개정내역 제명 변경 조항 {(corpus_id, kind, old, new)} (별칭 입력)"""
+        found = set()
+        for i in range(0, len(corpus_ids), 500):
+            chunk = corpus_ids[i:i + 500]
+            marks = ", ".join("?" for _ in chunk)
+            found.update(tuple(r) for r in self.conn.execute(
+                f"SELECT a.corpus_id, t.kind, t.old_term, t.new_term FROM amendment_terms t "
+                f"JOIN amendments a ON a.id = t.amendment_id "
+                f"WHERE a.corpus_id IN ({marks}) AND t.kind IN ('title', 'related_title')", chunk))
+        return found
+
+    def mark_aliases_stale(self):
+        """별칭 입력이 바뀜 → 재생성 (deferred_aliases 블록 안이면 블록 끝에서 1회)"""
+        self._aliases_stale = True
+        if not self._defer_aliases:
+            self.rebuild_aliases()
+
+    @contextlib.contextmanager
+    def deferred_aliases(self):
+        """블록 안 적재들의 별칭 재생성을 블록 끝에서 1회로 (여러 파일 대량 적재용)"""
+        self._defer_aliases += 1
+        try:
+            yield self
+        finally:
+            self._defer_aliases -= 1
+            if not self._defer_aliases and self._aliases_stale:
+                self.rebuild_aliases()
+
+    def _index_amendments(self, corpus_ids, titles=None):
+        """개정내역 → 조문/용어/시행일 색인 (amendment_index). 트랜잭션 안에서 호출"""
+        from amendment_index import index_rows
+
+        rows = []
+        for i in range(0, len(corpus_ids), 500):
+            chunk = corpus_ids[i:i + 500]
+            marks = ", ".join("?" for _ in chunk)
+            rows.extend(self.conn.execute(
+                f"SELECT a.id, a.reason, a.corpus_id, c.title FROM amendments a "
+                f"JOIN corpus c ON c.id = a.corpus_id WHERE a.corpus_id IN ({marks})", chunk))
+        titles = titles or {}
+        articles, terms, effective = index_rows(
+            (r["id"], r["reason"], titles.get(r["corpus_id"]) or r["title"]) for r in rows)
+        self.conn.executemany("INSERT OR IGNORE INTO amendment_articles VALUES (?, ?, ?)", articles)
+        self.conn.executemany(
+            "INSERT INTO amendment_terms (amendment_id, kind, old_term, new_term) VALUES (?, ?, ?, ?)",
+            terms)
+        self.conn.executemany("INSERT OR REPLACE INTO amendment_effective VALUES (?, ?, ?, ?, ?)",
+                              effective)
+        return {"amendments": len(rows), "articles": len(articles), "terms": len(terms),
+                "effective": len(effective)}
+
+    def reindex_amendments(self):
+        """기존 개정내역 전체 재색인 (색인 도입 이전 DB용)"""
+        with self.conn:
+            for table in ("amendment_articles", "amendment_terms", "amendment_effective"):
+                self.conn.execute(f"DELETE FROM {table}")
+            ids = [r[0] for r in self.conn.execute("SELECT DISTINCT corpus_id FROM amendments")]
+            result = self._index_amendments(ids)
+        result["aliases"] = self.rebuild_aliases()
+        return result
+
+    def rebuild_aliases(self):
+        """법령명 별칭(law_aliases) 재생성: 제명 변경 조항 + lsId 연속성. 별칭 수 반환"""
+        from law_alias_index import AliasIndex
+
+        pairs = AliasIndex.from_db(self).pairs()
+        with self.conn:
+            self.conn.execute("DELETE FROM law_aliases")
+            self.conn.executemany("INSERT INTO law_aliases (norm_title, canonical) VALUES (?, ?)", pairs)
+        self._aliases_stale = False
+        return len(pairs)
+
+    def _corpus_ids(self, keys):
+        datasets = {d for d, _ in keys}
+        ids = {}
+        for dataset in datasets:
+            for r in self.conn.execute(
+                    "SELECT id, source_key FROM corpus WHERE dataset = ?", (dataset,)):
+                key = (dataset, r["source_key"])
+                if key in keys:
+                    ids[key] = r["id"]
+        return ids
+
+    def upsert_base_laws(self, items):
+        """기본법규 대량 upsert (단일 트랜잭션)"""
+        now = datetime.now().isoformat(timespec="seconds")
+        values = []
+        for item in items:
+            cats = item.get("categories") or []
+            values.append((
+                item["id"], item["title"], normalize_law_name(item["title"]),
+                cats[0] if cats else None, item.get("lawType"),
+                (item.get("meta") or {}).get("ministry") or item.get("ministry"),
+                item.get("status"), item.get("effectiveDate"), now,
+            ))
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO base_laws (id, title, norm_title, category, law_type, ministry, "
+                "status, effective_date, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (id) DO UPDATE SET title = excluded.title, "
+                "norm_title = excluded.norm_title, category = excluded.category, "
+                "law_type = excluded.law_type, ministry = excluded.ministry, "
+                "status = excluded.status, effective_date = excluded.effective_date, "
+                "updated_at = excluded.updated_at", values)
+        return len(values)
+
+    def delete_base_law(self, base_law_id):
+        """기본법규 삭제 (매칭 포함)
+
+        매칭은 데이터셋 구분 없이 모두 삭제: 기본법규 행이 없어지므로 다른 데이터셋 매칭도 남길 대상이 없음
+        (추가/재매칭은 데이터셋별 교체, IncrementalMatcher._persist_add)
+        """
+        with self.conn:
+            self.conn.execute("DELETE FROM matches WHERE base_law_id = ?", (base_law_id,))
+            cur = self.conn.execute("DELETE FROM base_laws WHERE id = ?", (base_law_id,))
+        return cur.rowcount
+
+    def start_crawl_run(self, source, params=None):
+        with self.conn:
+            cur = self.conn.execute(
+                "INSERT INTO crawl_runs (source, params, started_at, status) VALUES (?, ?, ?, ?)",
+                (source, json.dumps(params or {}, ensure_ascii=False),
+                 datetime.now().isoformat(timespec="seconds"), "running"))
+        return cur.lastrowid
+
+    def finish_crawl_run(self, run_id, item_count, status="ok"):
+        with self.conn:
+            self.conn.execute(
+                "UPDATE crawl_runs SET finished_at = ?, item_count = ?, status = ? WHERE id = ?",
+                (datetime.now().isoformat(timespec="seconds"), item_count, status, run_id))
+
+    # ------------------------------------------------------------------
+    # 파일 → DB 가져오기
+    # ------------------------------------------------------------------
+
+    def import_items_json(self, items, dataset):
+        """index.json 형식 items 적재 (매칭/개정내역 포함)"""
+        rows, amendments, matches = [], {}, {}
+        for item in items:
+            meta = item.get("meta") or {}
+            cats = item.get("categories") or []
+            source = item.get("source")
+            key = (dataset, item["id"])
+            amend_type = None
+            for a in item.get("amendments") or []:
+                m = AMEND_TYPE_RE.search(a.get("reason") or "")
+                if m:
+                    amend_type = m.group(1)
+                    break
+            rows.append({
+                "dataset": dataset,
+                "source_key": item["id"],
+                "item_id": item["id"],
+                "title": item.get("title") or "",
+                "original_title": item.get("originalTitle"),
+                "ls_id": _text(meta.get("lsId")),
+                "law_type": item.get("lawType"),
+                "amend_type": amend_type,
+                "effective_date": _text(item.get("effectiveDate")),
+                "announced_date": _text(item.get("announcedDate")),
+                "ministry": item.get("ministry") or meta.get("ministry"),
+                "status": item.get("status"),
+                "category": cats[0] if cats else None,
+                "categories": json.dumps(cats, ensure_ascii=False),
+                "summary": item.get("summary"),
+                "source": source if isinstance(source, str) else json.dumps(source, ensure_ascii=False),
+            })
+            amendments[key] = item.get("amendments") or []
+            if meta.get("companyLawId") or meta.get("matchType"):
+                # companyLawId 없이 matchType만 있는 항목도 보존 (base_law_id NULL)
+                matches[key] = [(meta.get("companyLawId") or None, meta.get("matchType"))]
+        return self.upsert_corpus(rows, amendments, matches)
+
+    def import_index_json(self, path="docs/index.json", dataset="index"):
+        with open(path, "r", encoding="utf-8") as f:
+            return self.import_items_json(json.load(f).get("items", []), dataset)
+
+    def import_quarterly_details(self, path="docs/quarterly_details.json", dataset="quarterly"):
+        with open(path, "r", encoding="utf-8") as f:
+            return self.import_items_json(json.load(f).get("items", []), dataset)
+
+    def import_base_laws(self, path="docs/base_laws_207.json"):
+        with open(path, "r", encoding="utf-8") as f:
+            return self.upsert_base_laws(json.load(f).get("items", []))
+
+    def import_corpus_records(self, records, dataset):
+        """수집법령 레코드(Excel 행/FastLawCollector dict) 적재"""
+        rows = []
+        for rec in records:
+            row = {"dataset": dataset}
+            for src, dst in EXCEL_COLUMN_MAP.items():
+                if src in rec and row.get(dst) is None:
+                    row[dst] = _text(rec.get(src))
+            row["title"] = row.get("title") or ""
+            row["effective_date"] = _date(row.get("effective_date"))
+            row["announced_date"] = _date(row.get("announced_date"))
+            row["source_key"] = f"{row.get('serial_no') or row.get('ls_id') or row['title']}|{row.get('effective_date') or ''}"
+            rows.append(row)
+        return self.upsert_corpus(rows)
+
+    def import_corpus_excel(self, path="docs/2025_laws_complete.xlsx", sheet_name=0, dataset=None):
+        """수집법령 Excel 적재 (2025_laws_complete.xlsx / 2025_Laws_Complete_*.xlsx)"""
+        import pandas as pd
+
+        df = pd.read_excel(path, sheet_name=sheet_name, dtype=str)
+        dataset = dataset or os.path.splitext(os.path.basename(path))[0]
+        return self.import_corpus_records(df.to_dict("records"), dataset)
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def find_by_title(self, title, dataset=None):
+        sql = "SELECT * FROM corpus WHERE norm_title = ?"
+        args = [normalize_law_name(title)]
+        if dataset:
+            sql += " AND dataset = ?"
+            args.append(dataset)
+        return self.conn.execute(sql + " ORDER BY effective_date", args).fetchall()
+
+    def find_by_ls_id(self, ls_id):
+        return self.conn.execute(
+            "SELECT * FROM corpus WHERE ls_id = ? ORDER BY effective_date", (ls_id,)).fetchall()
+
+    def query_corpus(self, dataset=None, year=None, category=None, ministry=None,
+                     date_from=None, date_to=None):
+        """조건 조회 (인덱스 컬럼 기준)"""
+        clauses, args = [], []
+        for col, value in (("dataset", dataset), ("year", year),
+                           ("category", category), ("ministry", ministry)):
+            if value is not None:
+                clauses.append(f"{col} = ?")
+                args.append(value)
+        if date_from:
+            clauses.append("effective_date >= ?")
+            args.append(date_from)
+        if date_to:
+            clauses.append("effective_date <= ?")
+            args.append(date_to)
+        where = (" WHERE " + " AND ".join(clauses)) if clauses else ""
+        return self.conn.execute(
+            f"SELECT * FROM corpus{where} ORDER BY effective_date, id", args).fetchall()
+
+    def base_laws(self):
+        return self.conn.execute("SELECT * FROM base_laws ORDER BY id").fetchall()
+
+    def amendments_for(self, corpus_ids):
+        """corpus_id → 개정내역 목록"""
+        out = {}
+        ids = list(corpus_ids)
+        for i in range(0, len(ids), 500):
+            chunk = ids[i:i + 500]
+            marks = ", ".join("?" for _ in chunk)
+            for r in self.conn.execute(
+                    f"SELECT * FROM amendments WHERE corpus_id IN ({marks}) ORDER BY corpus_id, seq",
+                    chunk):
+                out.setdefault(r["corpus_id"], []).append(
+                    {"date": r["date"], "reason": r["reason"], "mainContents": r["main_contents"]})
+        return out
+
+    def matches_for(self, corpus_ids):
+        """corpus_id → (base_law_id, match_type) (base_law_id None: 기본법규 없는 매칭)"""
+        out = {}
+        ids = list(corpus_ids)
+        for i in range(0, len(ids), 500):
+            chunk = ids[i:i + 500]
+            marks = ", ".join("?" for _ in chunk)
+            for r in self.conn.execute(
+                    f"SELECT corpus_id, base_law_id, match_type FROM matches "
+                    f"WHERE corpus_id IN ({marks}) ORDER BY id", chunk):
+                out.setdefault(r["corpus_id"], (r["base_law_id"], r["match_type"]))
+        return out
+
+    # ------------------------------------------------------------------
+    # DB → 산출물
+    # ------------------------------------------------------------------
+
+    def export_items(self, dataset, year=None):
+        """index.json 형식 items 생성 (적재 순서 유지)"""
+        rows = sorted(self.query_corpus(dataset=dataset, year=year), key=lambda r: r["id"])
+        ids = [r["id"] for r in rows]
+        amendments = self.amendments_for(ids)
+        matches = self.matches_for(ids)
+        items = []
+        for r in rows:
+            base_id, match_type = matches.get(r["id"], ("", None))
+            source = r["source"]
+            if source and source.startswith("{"):
+                source = json.loads(source)
+            meta = {}
+            if r["ls_id"] is not None:
+                meta["lsId"] = r["ls_id"]
+            meta["matchType"] = match_type
+            meta["companyLawId"] = base_id or ""
+            items.append({
+                "id": r["item_id"] or r["source_key"],
+                "title": r["title"],
+                "summary": r["summary"],
+                "effectiveDate": r["effective_date"],
+                "lawType": r["law_type"],
+                "status": r["status"],
+                "ministry": r["ministry"],
+                "categories": json.loads(r["categories"]) if r["categories"] else [],
+                "amendments": amendments.get(r["id"], []),
+                "meta": meta,
+                "source": source,
+                "originalTitle": r["original_title"],
+            })
+        return items
+
+    def export_index_json(self, path="docs/index.json", dataset="index", year=None):
+        """docs/index.json 생성"""
+        items = self.export_items(dataset, year)
+        data = {
+            "year": year or (items and _year_of(items[0]["effectiveDate"])),
+            "totalCount": len(items),
+            "generatedAt": datetime.now().isoformat(timespec="seconds"),
+            "items": items,
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        return data
+
+    def export_quarterly_details(self, path="docs/quarterly_details.json",
+                                 dataset="quarterly", year=None):
+        """docs/quarterly_details.json 생성 (분기/카테고리 집계 포함)"""
+        items = self.export_items(dataset, year)
+        year = year or (items and _year_of(items[0]["effectiveDate"]))
+        quarters = {q: {"period": f"{year}년 {m}~{m + 2}월", "count": 0, "laws": []}
+                    for q, m in (("Q1", 1), ("Q2", 4), ("Q3", 7), ("Q4", 10))}
+        breakdown, matrix = {}, {}
+        for item in items:
+            q = quarter_of(item["effectiveDate"])
+            if q:
+                quarters[q]["laws"].append(item)
+                quarters[q]["count"] += 1
+            for cat in item["categories"][:1]:
+                breakdown[cat] = breakdown.get(cat, 0) + 1
+                row = matrix.setdefault(cat, {"Q1": 0, "Q2": 0, "Q3": 0, "Q4": 0})
+                if q:
+                    row[q] += 1
+        data = {
+            "generatedAt": datetime.now().isoformat(timespec="seconds"),
+            "year": year,
+            "description": f"{year}년 RegRader 법령 모니터링 데이터",
+            "total_laws": len(items),
+            "items": items,
+            "quarters": quarters,
+            "categoryBreakdown": breakdown,
+            "categoryQuarterMatrix": matrix,
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        return data
+
+    def export_base_laws_json(self, path="docs/base_laws_207.json", year=None):
+        """docs/base_laws_207.json 생성"""
+        items = [{
+            "id": r["id"],
+            "title": r["title"],
+            "categories": [r["category"]] if r["category"] else [],
+            "lawType": r["law_type"],
+            "effectiveDate": r["effective_date"],
+            "status": r["status"],
+            "meta": {"ministry": r["ministry"], "lastUpdated": r["updated_at"]},
+        } for r in self.base_laws()]
+        data = {
+            "generatedAt": int(datetime.now().timestamp()),
+            "year": year or datetime.now().year,
+            "description": f"{year or datetime.now().year}년 당사 적용 법규 {len(items)}개 기본 목록",
+            "total_laws": len(items),
+            "items": items,
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        return data
+
+    def export_corpus_excel(self, path, dataset, year=None):
+        """수집법령 Excel 생성 (2025_laws_complete.xlsx 컬럼 구성)"""
+        import pandas as pd
+
+        rows = self.query_corpus(dataset=dataset, year=year)
+        df = pd.DataFrame(
+            [{"순번": i + 1, **{label: r[col] for label, col in EXCEL_EXPORT_COLUMNS}}
+             for i, r in enumerate(rows)])
+        with pd.ExcelWriter(path, engine="openpyxl") as writer:
+            df.to_excel(writer, sheet_name="전체", index=False)
+            if not df.empty:
+                for status in df["법령상태"].dropna().unique():
+                    df[df["법령상태"] == status].to_excel(
+                        writer, sheet_name=f"상태_{status}", index=False)
+        return path
+
+    def stats(self):
+        tables = ("corpus", "base_laws", "matches", "amendments", "amendment_articles", "law_versions",
+                  "notification_deliveries", "law_aliases", "rule_versions", "category_changes", "crawl_runs")
+        return {t: self.conn.execute(f"SELECT COUNT(*) FROM {t}").fetchone()[0] for t in tables}
+
+
+def main():
+    """메인 실행: docs/ 산출물을 DB로 적재"""
+
+    print("🗄️  RegRader 법령 DB 적재")
+    print("=" * 60)
+
+    with LawDatabase() as db:
+        with db.deferred_aliases():  # 별칭은 전체 적재 후 1회 재생성
+            if os.path.exists("docs/base_laws_207.json"):
+                print(f"   ✅ 기본법규 {db.import_base_laws()}개")
+            if os.path.exists("docs/2025_laws_complete.xlsx"):
+                print(f"   ✅ 2025 수집법령 {len(db.import_corpus_excel())}개")
+            if os.path.exists("docs/index.json"):
+                print(f"   ✅ index.json {len(db.import_index_json())}개")
+            if os.path.exists("docs/quarterly_details.json"):
+                print(f"   ✅ quarterly_details.json {len(db.import_quarterly_details())}개")
+
+        print(f"\n📊 DB 현황 ({db.path}):")
+        for table, count in db.stats().items():
+            print(f"   • {table}: {count:,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+RegRader 법령 조회 API (asyncio)
+- 법령 데이터를 메모리 인덱스(카테고리/부처/분기/상태/개정유형/제목 접두어)로 적재
+- 필터/정렬/페이지 단위 JSON 응답 + ETag (If-None-Match → 304)
+- 단일 프로세스 비동기 처리로 다수 동시 접속 대응
+- 구축한 인덱스는 스냅샷(data/snapshots/)으로 저장 → 데이터 파일이 같으면 재시작 시 즉시 로드
+
+사용법: python law_query_server.py [--port 8080] [--data docs/index.json]
+  GET /api/laws?category=환경&quarter=2026-Q1&status=시행예정&sort=-effectiveDate&page=1&size=20
+      (분기는 연도 포함 'YYYY-Qn', 또는 quarter=Q1&year=2026)
+  GET /api/laws/<id>
+  GET /api/facets
+"""
+
+import argparse
+import asyncio
+import bisect
+import hashlib
+import json
+import os
+import re
+import sys
+from collections import OrderedDict
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import exact_matching_analyzer
+import law_db
+from exact_matching_analyzer import normalize_law_name
+from law_db import quarter_of
+
+DATA_FILES = ["docs/index.json"]
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 200
+RESPONSE_CACHE_SIZE = 1024
+
+AMEND_TYPE_RE = re.compile(r"(전부개정|일부개정|타법개정|일괄개정|타법폐지|폐지|제정)")
+
+# 목록 응답에 포함할 필드 (개정문 본문 등 대용량 필드 제외)
+LIST_FIELDS = ("id", "title", "effectiveDate", "lawType", "status", "ministry", "categories")
+
+STATUS_TEXT = {200: "OK", 304: "Not Modified", 400: "Bad Request", 404: "Not Found",
+               405: "Method Not Allowed"}
+
+SORT_KEYS = {
+    "effectiveDate": lambda it: (it.get("effectiveDate") or "", it.get("title") or ""),
+    "title": lambda it: (it.get("title") or "", it.get("effectiveDate") or ""),
+}
+
+
+def year_quarter(date_str):
+    """시행일자 → 'YYYY-Qn' (분기 facet 키, 연도가 다른 같은 분기를 구분)"""
+    quarter = quarter_of(date_str)
+    if not quarter:
+        return None
+    return "".join(ch for ch in str(date_str)[:10] if ch.isdigit())[:4] + "-" + quarter
+
+
+def amendment_type(item):
+    """개정유형 추출 (amendments[].reason 또는 lawType)"""
+    for a in item.get("amendments") or []:
+        m = AMEND_TYPE_RE.search(a.get("reason") or "")
+        if m:
+            return m.group(1)
+    m = AMEND_TYPE_RE.search(item.get("lawType") or "")
+    return m.group(1) if m else "기타"
+
+
+class LawIndex:
+    """법령 메모리 인덱스"""
+
+    FACETS = ("category", "ministry", "quarter", "status", "amendType")
+
+    def __init__(self, items):
+        self.items = list(items)
+        self.by_id = {}
+        self.facets = {f: {} for f in self.FACETS}
+        for pos, item in enumerate(self.items):
+            self.by_id.setdefault(str(item.get("id")), pos)
+            values = {
+                "category": item.get("categories") or ["기타"],
+                "ministry": [item.get("ministry") or (item.get("meta") or {}).get("ministry") or ""],
+                "quarter": [year_quarter(item.get("effectiveDate"))],
+                "status": [item.get("status") or ""],
+                "amendType": [amendment_type(item)],
+            }
+            for facet, vals in values.items():
+                for v in vals:
+                    if v:
+                        self.facets[facet].setdefault(v, set()).add(pos)
+
+        # 제목 접두어 검색: 정규화 제목 정렬 배열 + 이분 탐색
+        self._titles = sorted((normalize_law_name(it.get("title")), pos)
+                              for pos, it in enumerate(self.items))
+        self._title_keys = [t for t, _ in self._titles]
+
+        # 정렬 순위 사전 계산 (결과 집합만 순위로 정렬)
+        self.ranks = {}
+        for name, key in SORT_KEYS.items():
+            order = sorted(range(len(self.items)), key=lambda p: key(self.items[p]))
+            rank = [0] * len(self.items)
+            for r, pos in enumerate(order):
+                rank[pos] = r
+            self.ranks[name] = rank
+
+        raw = json.dumps(self.items, ensure_ascii=False, sort_keys=True)
+        self.version = hashlib.md5(raw.encode("utf-8")).hexdigest()[:12]
+
+    @classmethod
+    def from_files(cls, paths):
+        items = []
+        for path in paths:
+            with open(path, "r", encoding="utf-8") as f:
+                items.extend(json.load(f).get("items", []))
+        return cls(items)
+
+    @classmethod
+    def cached_from_files(cls, paths):
+        """from_files + 스냅샷 (index_snapshot, 원본 JSON 해시가 같으면 인덱스 구축 생략)"""
+        import law_alias_index
+        from index_snapshot import cached
+
+        key = "|".join(os.path.abspath(p) for p in paths)
+        # 인덱스 구축에 쓰는 코드 (정규화·분기 계산) 변경 시 재구축
+        code = [os.path.abspath(__file__), exact_matching_analyzer.__file__, law_db.__file__,
+                law_alias_index.__file__]
+        return cached("query", key, [*paths, *code], lambda: cls.from_files(paths))
+
+    def prefix(self, text):
+        """정규화 제목 접두어 일치 위치 집합"""
+        key = normalize_law_name(text)
+        lo = bisect.bisect_left(self._title_keys, key)
+        hi = bisect.bisect_left(self._title_keys, key + "\uffff")
+        return {pos for _, pos in self._titles[lo:hi]}
+
+    def search(self, filters, prefix=None, sort="-effectiveDate", page=1, size=DEFAULT_PAGE_SIZE):
+        """필터(교집합) → 정렬 → 페이지"""
+        candidates = []
+        for facet, values in filters.items():
+            index = self.facets.get(facet, {})
+            union = set()
+            for v in values:
+                union |= index.get(v, set())
+            candidates.append(union)
+        if prefix:
+            candidates.append(self.prefix(prefix))
+
+        if candidates:
+            candidates.sort(key=len)
+            result = candidates[0].intersection(*candidates[1:])
+        else:
+            result = range(len(self.items))
+
+        reverse = sort.startswith("-")
+        rank = self.ranks.get(sort.lstrip("-"), self.ranks["effectiveDate"])
+        ordered = sorted(result, key=rank.__getitem__, reverse=reverse)
+
+        start = (page - 1) * size
+        return len(ordered), [self.items[p] for p in ordered[start:start + size]]
+
+    def facet_counts(self):
+        return {facet: {k: len(v) for k, v in sorted(index.items())}
+                for facet, index in self.facets.items()}
+
+
+def quarter_keys(quarters, years):
+    """quarter 파라미터 → facet 키. 'Q1'은 year 파라미터와 조합 (연도 없으면 ValueError)"""
+    keys = []
+    for q in quarters:
+        if re.fullmatch(r"\d{4}-Q[1-4]", q):
+            keys.append(q)
+        elif re.fullmatch(r"Q[1-4]", q) and years:
+            keys.extend(f"{y}-{q}" for y in years)
+        else:
+            raise ValueError(q)
+    return keys
+
+
+class LawQueryServer:
+    """asyncio 기반 HTTP/1.1 조회 서버 (keep-alive 지원)"""
+
+    def __init__(self, index):
+        self.index = index
+        self._cache = OrderedDict()
+
+    def _respond(self, key, build):
+        """응답 본문 + ETag 캐시 (동일 쿼리는 직렬화 생략)"""
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
+        body = json.dumps(build(), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        etag = '"%s-%s"' % (self.index.version, hashlib.md5(body).hexdigest()[:16])
+        self._cache[key] = (body, etag)
+        if len(self._cache) > RESPONSE_CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return body, etag
+
+    def handle(self, path, query):
+        """(status, body, etag) 반환"""
+        if path == "/api/laws":
+            params = parse_qs(query)
+            filters = {f: params[f] for f in LawIndex.FACETS if f in params}
+            if "quarter" in filters:
+                years = params.get("year") or []
+                try:
+                    filters["quarter"] = quarter_keys(filters["quarter"], years)
+                except ValueError:
+                    return 400, b'{"error":"quarter needs a year (2026-Q1 or year=2026)"}', None
+            prefix = (params.get("q") or [""])[0]
+            sort = (params.get("sort") or ["-effectiveDate"])[0]
+            try:
+                page = max(int((params.get("page") or ["1"])[0]), 1)
+                size = min(max(int((params.get("size") or [str(DEFAULT_PAGE_SIZE)])[0]), 1), MAX_PAGE_SIZE)
+            except ValueError:
+                return 400, b'{"error":"invalid page/size"}', None
+            fields = LIST_FIELDS + tuple(f for f in (params.get("fields") or [""])[0].split(",") if f)
+            key = ("laws", tuple(sorted((k, tuple(v)) for k, v in filters.items())),
+                   prefix, sort, page, size, fields)
+
+            def build():
+                total, items = self.index.search(filters, prefix, sort, page, size)
+                return {"total": total, "page": page, "size": size,
+                        "items": [{f: it.get(f) for f in fields if f in it} for it in items]}
+
+            return (200,) + self._respond(key, build)
+
+        if path.startswith("/api/laws/"):
+            law_id = unquote(path[len("/api/laws/"):])
+            pos = self.index.by_id.get(law_id)
+            if pos is None:
+                return 404, b'{"error":"not found"}', None
+            return (200,) + self._respond(("law", law_id), lambda: self.index.items[pos])
+
+        if path == "/api/facets":
+            return (200,) + self._respond(("facets",), self.index.facet_counts)
+
+        return 404, b'{"error":"not found"}', None
+
+    async def serve_client(self, reader, writer):
+        try:
+            while True:
+                headers = {}
+                try:
+                    request_line = await reader.readline()
+                    if not request_line:
+                        break
+                    while True:
+                        line = await reader.readline()
+                        if line in (b"\r\n", b"\n", b""):
+                            break
+                        name, _, value = line.decode("latin-1").partition(":")
+                        headers[name.strip().lower()] = value.strip()
+                    parts = request_line.decode("latin-1").split()
+                except (asyncio.LimitOverrunError, ValueError):
+                    # 요청줄/헤더가 스트림 버퍼 한도 초과 → 나머지를 읽을 수 없으므로 응답 후 종료
+                    parts, headers = [], {"connection": "close"}
+
+                if len(parts) != 3 or not parts[2].startswith("HTTP/"):
+                    status, body, etag = 400, b'{"error":"bad request"}', None
+                elif parts[0] not in ("GET", "HEAD"):
+                    status, body, etag = 405, b'{"error":"method not allowed"}', None
+                else:
+                    url = urlsplit(parts[1])
+                    status, body, etag = self.handle(url.path, url.query)
+
+                if etag and headers.get("if-none-match") == etag:
+                    status, body = 304, b""
+
+                keep_alive = headers.get("connection", "").lower() != "close" and parts[-1:] == ["HTTP/1.1"]
+                out = [f"HTTP/1.1 {status} {STATUS_TEXT.get(status, '')}",
+                       "Content-Type: application/json; charset=utf-8",
+                       f"Content-Length: {len(body)}",
+                       "Access-Control-Allow-Origin: *",
+                       f"Connection: {'keep-alive' if keep_alive else 'close'}"]
+                if etag:
+                    out += [f"ETag: {etag}", "Cache-Control: public, max-age=60, must-revalidate"]
+                writer.write(("\r\n".join(out) + "\r\n\r\n").encode("latin-1"))
+                if parts and parts[0] != "HEAD":
+                    writer.write(body)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+async def serve(index, host="127.0.0.1", port=8080):
+    server = LawQueryServer(index)
+    srv = await asyncio.start_server(server.serve_client, host, port, backlog=1024)
+    async with srv:
+        await srv.serve_forever()
+
+
+def main():
+    """메인 실행"""
+
+    parser = argparse.ArgumentParser(description="RegRader 법령 조회 API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=int(os.environ.get("PORT") or 8080))
+    parser.add_argument("--data", action="append", help="items JSON (기본: docs/index.json)")
+    args = parser.parse_args()
+
+    index = LawIndex.cached_from_files(args.data or DATA_FILES)
+    print(f"⚡ RegRader 조회 API: http://{args.host}:{args.port}/api/laws "
+          f"({len(index.items)}개 법령, 버전 {index.version})", file=sys.stderr)
+    try:
+        asyncio.run(serve(index, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
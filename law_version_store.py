@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+법령 버전 저장소 (연도 누적)
+- (법령, 시행일자, 개정) 버전을 연도 구분 없이 누적 보관 (덮어쓰기 없음)
+- 구간 인덱스: "X일 기준 시행 중인 버전", "A~B 사이 변경" 조회 O(log n)
+- 연도 전환 시 과거 이력 재수집 불필요
+- 법령별 조회는 법령명 별칭(law_aliases)으로 묶음: 제명이 바뀐 법령도 이전 이름의 버전까지 한 이력
+
+사용법:
+  python law_version_store.py ingest [dataset ...]
+  python law_version_store.py asof 2025-07-01
+  python law_version_store.py changes 2025-04-01 2025-06-30
+"""
+
+import bisect
+import sys
+from datetime import datetime
+
+from exact_matching_analyzer import normalize_law_name
+from law_db import LawDatabase
+
+VERSION_COLUMNS = (
+    "norm_title", "title", "ls_id", "serial_no", "effective_date", "announced_date",
+    "amend_type", "law_type", "ministry", "dataset",
+)
+
+
+class VersionIndex:
+    """법령별 시행일자 구간 인덱스 + 전체 변경 타임라인"""
+
+    def __init__(self, versions, aliases=None):
+        self.aliases = aliases  # law_alias_index.AliasIndex (없으면 정규화 법령명 그대로)
+        by_law = {}
+        for v in versions:
+            if v.get("effective_date"):
+                by_law.setdefault(self.key(v["norm_title"]), []).append(v)
+
+        self.by_law = {}
+        timeline = []
+        for name, items in by_law.items():
+            # 같은 시행일자가 여러 건이면 공포일자/일련번호 순으로 마지막 버전이 유효
+            items.sort(key=lambda v: (v["effective_date"], v.get("announced_date") or "",
+                                      v.get("serial_no") or ""))
+            self.by_law[name] = ([v["effective_date"] for v in items], items)
+            timeline.extend(items)
+
+        timeline.sort(key=lambda v: (v["effective_date"], v["norm_title"]))
+        self._timeline = timeline
+        self._timeline_dates = [v["effective_date"] for v in timeline]
+
+    def key(self, law_name):
+        """법령 조회 키 (별칭 → 현재 법령명)"""
+        if self.aliases is not None:
+            return self.aliases.canonical(law_name)
+        return normalize_law_name(law_name)
+
+    def versions(self, law_name):
+        """법령의 전체 버전 (시행일자순)"""
+        return list(self.by_law.get(self.key(law_name), ((), ()))[1])
+
+    def in_force(self, law_name, on):
+        """on(YYYY-MM-DD) 기준 시행 중인 버전 (없으면 None)"""
+        entry = self.by_law.get(self.key(law_name))
+        if not entry:
+            return None
+        dates, items = entry
+        i = bisect.bisect_right(dates, on) - 1
+        return items[i] if i >= 0 else None
+
+    def in_force_many(self, law_names, on):
+        """여러 법령(기본법규 목록)의 on 기준 시행 버전"""
+        return {name: self.in_force(name, on) for name in law_names}
+
+    def changes_between(self, start, end, law_names=None):
+        """start < 시행일자 <= end 인 버전 (law_names 지정 시 해당 법령만)"""
+        lo = bisect.bisect_right(self._timeline_dates, start)
+        hi = bisect.bisect_right(self._timeline_dates, end)
+        changes = self._timeline[lo:hi]
+        if law_names is not None:
+            wanted = {self.key(n) for n in law_names}
+            changes = [v for v in changes if self.key(v["norm_title"]) in wanted]
+        return changes
+
+
+class LawVersionStore:
+    """법령 DB(law_versions 테이블) 기반 버전 저장소"""
+
+    def __init__(self, db):
+        self.db = db
+        self._index = None
+
+    def ingest_dataset(self, dataset):
+        """corpus 데이터셋의 버전을 누적 적재 (기존 버전 유지). 신규 버전 수 반환"""
+        rows = self.db.conn.execute(
+            f"SELECT {', '.join(c for c in VERSION_COLUMNS)} FROM corpus "
+            "WHERE dataset = ? AND effective_date IS NOT NULL", (dataset,)).fetchall()
+        return self._store([dict(r) for r in rows])
+
+    def ingest_records(self, records, dataset):
+        """레코드(dict, VERSION_COLUMNS 키) 누적 적재"""
+        rows = []
+        for rec in records:
+            rec = dict(rec, dataset=dataset)
+            rec.setdefault("norm_title", normalize_law_name(rec.get("title")))
+            rows.append(rec)
+        return self._store(rows)
+
+    def _store(self, rows):
+        """버전 적재. 일련번호가 없는 행(JSON 데이터셋)은 (법령, 시행일자)로 같은 버전 판단
+
+        - 개정구분은 키에서 제외: JSON은 개정이유 본문 정규식, xlsx는 제개정구분 열이라
+          같은 버전이어도 값이 다를 수 있음 (없거나 다른 법령의 개정구분을 집기도 함)
+        - 일련번호 없음: 같은 버전이 이미 있으면 건너뜀
+        - 일련번호 있음: 먼저 적재된 일련번호 없는 같은 버전이 있으면 그 행에 일련번호·개정구분 보완
+          (알림 이력 유지)
+        """
+        now = datetime.now().isoformat(timespec="seconds")
+        cols = ", ".join(VERSION_COLUMNS + ("first_seen",))
+        marks = ", ".join("?" for _ in range(len(VERSION_COLUMNS) + 1))
+        conn = self.db.conn
+        added = 0
+        with conn:
+            for rec in rows:
+                rec["serial_no"] = rec.get("serial_no") or ""
+                same = (rec["norm_title"], rec["effective_date"])
+                if not rec["serial_no"]:
+                    if conn.execute("SELECT 1 FROM law_versions WHERE norm_title = ? AND effective_date = ? "
+                                    "LIMIT 1", same).fetchone():
+                        continue
+                elif conn.execute(
+                        "UPDATE OR IGNORE law_versions SET serial_no = ?, "
+                        "amend_type = COALESCE(?, amend_type) WHERE id = "
+                        "(SELECT id FROM law_versions WHERE norm_title = ? AND effective_date = ? "
+                        "AND serial_no = '' LIMIT 1)",
+                        (rec["serial_no"], rec.get("amend_type")) + same).rowcount:
+                    continue
+                added += conn.execute(f"INSERT OR IGNORE INTO law_versions ({cols}) VALUES ({marks})",
+                                      [rec.get(c) for c in VERSION_COLUMNS] + [now]).rowcount
+        if added:
+            self.db.mark_aliases_stale()
+        self._index = None
+        return added
+
+    @property
+    def index(self):
+        if self._index is None:
+            from law_alias_index import AliasIndex
+
+            rows = self.db.conn.execute("SELECT * FROM law_versions").fetchall()
+            self._index = VersionIndex([dict(r) for r in rows], AliasIndex.load(self.db))
+        return self._index
+
+
+def main():
+    """메인 실행"""
+
+    if len(sys.argv) < 2 or sys.argv[1] not in ("ingest", "asof", "changes"):
+        print(__doc__)
+        return
+
+    with LawDatabase() as db:
+        store = LawVersionStore(db)
+        base_titles = [r["title"] for r in db.base_laws()]
+
+        if sys.argv[1] == "ingest":
+            datasets = sys.argv[2:] or [r[0] for r in db.conn.execute(
+                "SELECT DISTINCT dataset FROM corpus")]
+            for dataset in datasets:
+                print(f"   ✅ {dataset}: 신규 버전 {store.ingest_dataset(dataset):,}개")
+            total = db.conn.execute("SELECT COUNT(*) FROM law_versions").fetchone()[0]
+            print(f"\n📚 누적 버전: {total:,}개")
+
+        elif sys.argv[1] == "asof":
+            on = sys.argv[2]
+            in_force = store.index.in_force_many(base_titles, on)
+            found = {k: v for k, v in in_force.items() if v}
+            print(f"📅 {on} 기준 시행 중인 기본법규 버전: {len(found)}/{len(base_titles)}개")
+            for title, v in sorted(found.items()):
+                print(f"   • {title}: {v['effective_date']} {v.get('amend_type') or ''}")
+
+        else:
+            start, end = sys.argv[2], sys.argv[3]
+            changes = store.index.changes_between(start, end, base_titles)
+            print(f"🔄 {start} ~ {end} 기본법규 변경: {len(changes)}건")
+            for v in changes:
+                print(f"   📅 {v['effective_date']}: {v['title']} ({v.get('amend_type') or ''})")
+
+
+if __name__ == "__main__":
+    main()
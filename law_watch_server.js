@@ -4,10 +4,16 @@ const fs = require('fs');
 const app = express();
 const PORT = process.env.PORT || 3000;
 
+// 콘텐츠 해시 산출물 (publish_artifacts.py → docs/data/<이름>.<해시>.json)
+const HASHED_JSON = /^\/data\/[\w-]+\.[0-9a-f]{12}\.json$/;
+// 포인터 매니페스트 (원본 이름 → 해시 파일 경로)
+const MANIFEST = '/data/manifest.json';
+
 // 캐시 방지 미들웨어
 app.use((req, res, next) => {
-    // HTML과 JSON 파일에 대해서만 캐시 방지
-    if (req.path.endsWith('.html') || req.path.endsWith('.json')) {
+    // HTML과 JSON 파일에 대해서만 캐시 방지 (해시 산출물과 매니페스트는 아래 전용 라우트에서 처리)
+    if ((req.path.endsWith('.html') || req.path.endsWith('.json'))
+        && !HASHED_JSON.test(req.path) && req.path !== MANIFEST) {
         res.set({
             'Cache-Control': 'no-cache, no-store, must-revalidate',
             'Pragma': 'no-cache',
@@ -26,6 +32,46 @@ app.use((req, res, next) => {
     next();
 });
 
+// 해시 산출물: 내용이 바뀌면 파일명이 바뀌므로 영구 캐시 + 사전 압축본(.br/.gz) 전송
+app.get(HASHED_JSON, (req, res, next) => {
+    const filePath = path.join(__dirname, 'docs', req.path);
+    const accepted = req.headers['accept-encoding'] || '';
+    let servePath = filePath;
+    let encoding = null;
+    for (const [enc, ext] of [['br', '.br'], ['gzip', '.gz']]) {
+        if (accepted.includes(enc) && fs.existsSync(filePath + ext)) {
+            servePath = filePath + ext;
+            encoding = enc;
+            break;
+        }
+    }
+    if (!fs.existsSync(servePath)) {
+        return next();
+    }
+    res.set({
+        'Cache-Control': 'public, max-age=31536000, immutable',
+        'Content-Type': 'application/json; charset=utf-8',
+        'Vary': 'Accept-Encoding'
+    });
+    if (encoding) {
+        res.set('Content-Encoding', encoding);
+    }
+    res.sendFile(servePath);
+});
+
+// 매니페스트: 저장은 허용하되 매번 재검증 (ETag 일치 시 304, 본문 없이 수백 바이트 확인)
+app.get(MANIFEST, (req, res, next) => {
+    const filePath = path.join(__dirname, 'docs', MANIFEST);
+    if (!fs.existsSync(filePath)) {
+        return next();
+    }
+    res.set({
+        'Cache-Control': 'no-cache',
+        'Content-Type': 'application/json; charset=utf-8'
+    });
+    res.sendFile(filePath, { etag: true, lastModified: false });
+});
+
 // 정적 파일 서빙
 app.use(express.static(path.join(__dirname, 'docs'), {
     etag: false,
@@ -46,6 +92,6 @@ app.use((req, res) => {
 app.listen(PORT, () => {
     console.log(`✨ RegRader Law Watch Server is running on port ${PORT}`);
     console.log(`📁 Serving directory: ${path.join(__dirname, 'docs')}`);
-    console.log(`🚫 Cache disabled for .html and .json files`);
+    console.log(`🚫 Cache disabled for .html and .json files (except hashed docs/data/*.json; manifest revalidated via ETag)`);
     console.log(`🌐 Access at: http://localhost:${PORT}`);
 });
\ No newline at end of file
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+사업부별(멀티 테넌트) 일괄 매칭
+- 수집법령 인덱스는 1회만 생성
+- 사업부별 기본법규 목록을 순차 스트리밍하여 사업부별 매칭 결과/집계 산출
+- 처리량은 (사업부 수 × 수집법령 수)가 아니라 사업부별 기본법규 수에 비례
+
+사용법:
+  python multi_tenant_matcher.py 본사=docs/base_laws_207.json 공장=tenants/factory.json
+  python multi_tenant_matcher.py --dir tenants/   (디렉터리 내 *.json 전체)
+"""
+
+import glob
+import json
+import os
+import sys
+import time
+
+from corpus_index import CorpusIndex
+from incremental_matcher import IncrementalMatcher
+
+CORPUS_EXCEL = "docs/2025_laws_complete.xlsx"
+OUTPUT_DIR = "data/tenants"
+
+
+def load_company_laws(path):
+    """base_laws_207.json 형식 기본법규 목록 → 매칭 입력"""
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    items = data if isinstance(data, list) else data.get("items", [])
+    for item in items:
+        if isinstance(item, str):
+            item = {"title": item}
+        cats = item.get("categories") or []
+        yield {
+            "법규ID": item.get("id") or item["title"],
+            "법령명": item["title"],
+            "직무카테고리": cats[0] if cats else "미분류",
+            "시행일자": item.get("effectiveDate"),
+        }
+
+
+def iter_tenants(specs):
+    """(사업부명, 기본법규 파일) 스트림"""
+    for spec in specs:
+        if os.path.isdir(spec):
+            for path in sorted(glob.glob(os.path.join(spec, "*.json"))):
+                yield os.path.splitext(os.path.basename(path))[0], path
+        elif "=" in spec:
+            name, path = spec.split("=", 1)
+            yield name, path
+        else:
+            yield os.path.splitext(os.path.basename(spec))[0], spec
+
+
+class MultiTenantMatcher:
+    """수집법령 인덱스 1개로 여러 사업부 기본법규 매칭"""
+
+    def __init__(self, corpus):
+        self.corpus = corpus
+
+    def match_tenant(self, company_laws):
+        """사업부 1곳 매칭 → IncrementalMatcher (매칭 목록 + 집계)"""
+        return IncrementalMatcher(self.corpus, company_laws)
+
+    def run(self, tenants):
+        """(사업부명, 기본법규 목록) 스트림 → (사업부명, 매칭기) 스트림"""
+        for name, company_laws in tenants:
+            yield name, self.match_tenant(company_laws)
+
+
+def save_tenant_result(name, matcher, output_dir=OUTPUT_DIR):
+    os.makedirs(output_dir, exist_ok=True)
+    path = os.path.join(output_dir, f"{name}_matches.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({
+            "tenant": name,
+            "baseLaws": len(matcher.company_laws),
+            "summary": matcher.aggregates.summary(),
+            "matches": matcher.all_matches(),
+        }, f, ensure_ascii=False, indent=2, default=str)
+    return path
+
+
+def main():
+    """메인 실행"""
+
+    args = sys.argv[1:]
+    if not args:
+        print(__doc__)
+        return
+    if args[0] == "--dir":
+        args = args[1:]
+
+    print("🏢 사업부별 일괄 매칭")
+    print("=" * 60)
+
+    start = time.perf_counter()
+    corpus = CorpusIndex.cached_from_excel(CORPUS_EXCEL)
+    print(f"   ✅ 수집법령 인덱스: {len(corpus):,}개 ({time.perf_counter() - start:.2f}s)")
+
+    matcher = MultiTenantMatcher(corpus)
+    tenants = ((name, load_company_laws(path)) for name, path in iter_tenants(args))
+
+    count = 0
+    match_start = time.perf_counter()
+    for name, result in matcher.run(tenants):
+        count += 1
+        summary = result.aggregates.summary()
+        path = save_tenant_result(name, result)
+        top3 = ", ".join(f"{c}({n})" for c, n in summary["top3"])
+        print(f"   • {name}: 기본법규 {len(result.company_laws)}개 → 매칭 {summary['total']}개 "
+              f"[TOP 3: {top3}] → {path}")
+
+    elapsed = time.perf_counter() - match_start
+    print(f"\n📊 {count}개 사업부 매칭 완료: {elapsed * 1000:.1f}ms "
+          f"({count / elapsed if elapsed else 0:,.0f} 사업부/초)")
+
+
+if __name__ == "__main__":
+    main()
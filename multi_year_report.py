@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+연도별 수집법령 비교 리포트 (다년도)
+- 입력: 법령 DB corpus 전체 데이터셋(2025_laws_complete, index, quarterly …) 또는 Excel/JSON 파일
+  → (정규화 법령명, 시행일자) 기준 중복 제거 후 시행일자 연도/분기로 구분 (연도 수 제한 없음)
+- 비교 (모두 DataFrame groupby/pivot/merge, 행 단위 반복 없음)
+  · 연도×분기 개정 건수, 전년 동기 대비(YoY)·직전 분기 대비(QoQ) 증감
+  · 기본법규별 / 카테고리별 / 소관부처별 연도 건수와 전년 대비 증감 (상위 N)
+  · 연도별 신규 등장 / 사라진 법령 (정규화 법령명 기준)
+- 카테고리가 없는 레코드(2025 Excel 등)는 scrape.py 분류 규칙을 열 단위 정규식으로 적용
+- 결과: 요약 JSON (data/reports/multi_year_report.json)
+
+사용법:
+  python multi_year_report.py [--dataset 2025_laws_complete --dataset index ...] [--top 10]
+  python multi_year_report.py --file docs/2025_laws_complete.xlsx --file docs/index.json
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+
+from exact_matching_analyzer import normalize_law_name
+
+OUTPUT_PATH = "data/reports/multi_year_report.json"
+TOP_N = 10
+COLUMNS = ["title", "norm_title", "effective_date", "amend_type", "category", "ministry", "dataset"]
+
+
+def corpus_frame(db, datasets=None):
+    """법령 DB corpus → 비교용 DataFrame"""
+    import pandas as pd
+
+    sql = ("SELECT title, norm_title, effective_date, amend_type, category, ministry, dataset "
+           "FROM corpus WHERE effective_date IS NOT NULL")
+    args = []
+    if datasets:
+        sql += f" AND dataset IN ({', '.join('?' * len(datasets))})"
+        args = list(datasets)
+    return pd.read_sql_query(sql, db.conn, params=args)
+
+
+def file_frame(path):
+    """수집 Excel(2025_laws_complete.xlsx) / items JSON(index.json, quarterly_details.json) → DataFrame"""
+    import pandas as pd
+
+    dataset = os.path.splitext(os.path.basename(path))[0]
+    if path.endswith((".xlsx", ".xls")):
+        df = pd.read_excel(path, dtype=str)
+        df = pd.DataFrame({
+            "title": df["법령명"],
+            "effective_date": df["시행일자"],
+            "amend_type": df.get("제개정구분"),
+            "category": None,
+            "ministry": df.get("소관부처"),
+        })
+    else:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        items = data if isinstance(data, list) else data.get("items") or data.get("laws") or []
+        df = pd.json_normalize(items)
+        cats = df["categories"] if "categories" in df else pd.Series([None] * len(df))
+        ministry = df["ministry"] if "ministry" in df else df.get("meta.ministry")
+        df = pd.DataFrame({
+            "title": df["title"],
+            "effective_date": df["effectiveDate"],
+            "amend_type": df.get("lawType"),
+            "category": cats.map(lambda c: c[0] if isinstance(c, list) and c else None),
+            "ministry": ministry,
+        })
+    # 정규화는 고유 법령명에만 적용
+    df["norm_title"] = df["title"].map({t: normalize_law_name(t) for t in df["title"].dropna().unique()})
+    df["dataset"] = dataset
+    return df[COLUMNS]
+
+
+def prepare(df):
+    """날짜 정리, 연도/분기, (정규화 법령명, 시행일자) 중복 제거, 카테고리 보정"""
+    import pandas as pd
+
+    df = df.copy()
+    digits = df["effective_date"].astype(str).str.replace(r"\D", "", regex=True).str[:8]
+    df["effective_date"] = pd.to_datetime(digits, format="%Y%m%d", errors="coerce")
+    df = df.dropna(subset=["effective_date", "norm_title"])
+    df = df[df["norm_title"] != ""]
+    df = df.drop_duplicates(subset=["norm_title", "effective_date"], keep="first")
+    df["year"] = df["effective_date"].dt.year
+    df["quarter"] = df["effective_date"].dt.quarter
+    df["ministry"] = df["ministry"].fillna("").astype(str).str.strip()
+    df["amend_type"] = df["amend_type"].fillna("").astype(str)
+    missing = df["category"].isna() | (df["category"].astype(str).isin(["", "기타"]))
+    if missing.any():
+        df.loc[missing, "category"] = categorize_frame(df.loc[missing])
+    return df.reset_index(drop=True)
+
+
+def categorize_frame(df):
+    """scrape.categorize(...)[0] 의 열 단위 버전: (제목 규칙 ∪ 소관부처 포함) 일치 카테고리 중 정렬상 첫 번째"""
+    from html import unescape
+
+    import numpy as np
+
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "scraper"))
+    from scrape import CATE_RULES, MINISTRY_TO_CAT
+
+    titles = df["title"].fillna("").astype(str).map(unescape)
+    ministries = df["ministry"].fillna("").astype(str)
+    cats = sorted(set(CATE_RULES) | {c for m_cats in MINISTRY_TO_CAT.values() for c in m_cats})
+    hits = np.zeros((len(df), len(cats)), dtype=bool)
+    for j, cat in enumerate(cats):
+        if cat in CATE_RULES:
+            # 캡처 그룹 → 비캡처 (str.contains 는 일치 여부만 필요)
+            pattern = "|".join(re.sub(r"\((?!\?)", "(?:", p) for p in CATE_RULES[cat])
+            hits[:, j] = titles.str.contains(pattern, regex=True).to_numpy()
+    for ministry, m_cats in MINISTRY_TO_CAT.items():
+        # scrape.categorize 와 같이 부분 문자열 일치 ("개인정보보호위원회,행정안전부")
+        hit = ministries.str.contains(ministry, regex=False).to_numpy()
+        for cat in m_cats:
+            hits[:, cats.index(cat)] |= hit
+    result = np.full(len(df), "기타", dtype=object)
+    any_hit = hits.any(axis=1)
+    result[any_hit] = np.asarray(cats, dtype=object)[hits[any_hit].argmax(axis=1)]
+    return result
+
+
+def _delta_table(counts, top):
+    """(키 × 연도) 건수 pivot → 연도별 전년 대비 증감 상위 N (절댓값 기준)"""
+    years = list(counts.columns)
+    out = {}
+    for prev, cur in zip(years, years[1:]):
+        delta = (counts[cur] - counts[prev]).rename("delta")
+        frame = counts[[prev, cur]].join(delta)
+        frame = frame[frame["delta"] != 0]
+        frame = frame.reindex(frame["delta"].abs().sort_values(ascending=False).index).head(top)
+        out[f"{prev}->{cur}"] = [
+            {"key": key, str(prev): int(row[prev]), str(cur): int(row[cur]), "delta": int(row["delta"])}
+            for key, row in frame.iterrows()
+        ]
+    return out
+
+
+def build_report(df, base_laws=None, top=TOP_N):
+    """prepare() 결과 → 비교 리포트 dict"""
+    import pandas as pd
+
+    years = sorted(df["year"].unique().tolist())
+    report = {"years": [int(y) for y in years],
+              "coverage": {str(k): int(v) for k, v in df.groupby("year").size().items()},
+              "datasets": {f"{y}:{d}": int(n) for (y, d), n in df.groupby(["year", "dataset"]).size().items()}}
+
+    # 연도×분기 → YoY(같은 분기 전년), QoQ(직전 분기)
+    quarterly = (df.groupby(["year", "quarter"]).size()
+                 .reindex(pd.MultiIndex.from_product([years, [1, 2, 3, 4]], names=["year", "quarter"]),
+                          fill_value=0))
+    q = quarterly.reset_index(name="count")
+    q["yoy"] = q.groupby("quarter")["count"].diff()
+    q["qoq"] = q["count"].diff()
+    report["quarters"] = [
+        {"period": f"{int(r.year)} Q{int(r.quarter)}", "count": int(r.count),
+         "yoy": None if pd.isna(r.yoy) else int(r.yoy), "qoq": None if pd.isna(r.qoq) else int(r.qoq)}
+        for r in q.itertuples(index=False)
+    ]
+
+    # 개정유형 × 연도
+    report["amendTypes"] = {str(y): {k: int(v) for k, v in grp.value_counts().items() if k}
+                            for y, grp in df.groupby("year")["amend_type"]}
+
+    def pivot(col, frame=df):
+        return frame.pivot_table(index=col, columns="year", values="effective_date", aggfunc="size",
+                                 fill_value=0).reindex(columns=years, fill_value=0)
+
+    report["categories"] = {
+        "counts": {cat: {str(y): int(n) for y, n in row.items()} for cat, row in pivot("category").iterrows()},
+        "deltas": _delta_table(pivot("category"), top),
+    }
+    report["ministries"] = {"deltas": _delta_table(pivot("ministry")[lambda t: t.index != ""], top)}
+
+    # 기본법규: 정규화 법령명 merge (기본법규 카테고리는 당사 직무 기준)
+    if base_laws is not None and len(base_laws):
+        joined = df.merge(base_laws[["norm_title", "base_category"]].drop_duplicates("norm_title"),
+                          on="norm_title", how="inner")
+        report["baseLaws"] = {
+            "matched": {str(y): int(n) for y, n in joined.groupby("year").size().items()},
+            "byCategory": {cat: {str(y): int(n) for y, n in row.items()}
+                           for cat, row in pivot("base_category", joined).iterrows()},
+            "deltas": _delta_table(pivot("title", joined), top),
+        }
+
+    # 신규 등장 / 사라진 법령 (연도별 정규화 법령명 존재 여부)
+    presence = pd.crosstab(df["norm_title"], df["year"]).reindex(columns=years, fill_value=0) > 0
+    titles = df.drop_duplicates("norm_title").set_index("norm_title")["title"]
+    changes = {}
+    for prev, cur in zip(years, years[1:]):
+        appeared = presence.index[presence[cur] & ~presence[prev]]
+        disappeared = presence.index[presence[prev] & ~presence[cur]]
+        changes[f"{prev}->{cur}"] = {
+            "appeared": int(len(appeared)), "disappeared": int(len(disappeared)),
+            "appearedSample": titles.reindex(appeared[:top]).tolist(),
+            "disappearedSample": titles.reindex(disappeared[:top]).tolist(),
+        }
+    report["lawChanges"] = changes
+    return report
+
+
+def base_laws_frame(db):
+    import pandas as pd
+
+    return pd.read_sql_query("SELECT norm_title, category AS base_category FROM base_laws", db.conn)
+
+
+def main(argv=None):
+    """메인 실행"""
+    import time
+
+    parser = argparse.ArgumentParser(description="연도별 수집법령 비교 리포트")
+    parser.add_argument("--db", default=None, help="법령 DB 경로")
+    parser.add_argument("--dataset", action="append", help="비교할 corpus 데이터셋 (기본: 전체)")
+    parser.add_argument("--file", action="append", help="DB 대신 Excel/JSON 파일 (반복 가능)")
+    parser.add_argument("--top", type=int, default=TOP_N)
+    parser.add_argument("--output", default=OUTPUT_PATH)
+    args = parser.parse_args(argv)
+
+    import pandas as pd
+    from law_db import DB_PATH, LawDatabase
+
+    start = time.perf_counter()
+    with LawDatabase(args.db or DB_PATH) as db:
+        if args.file:
+            raw = pd.concat([file_frame(p) for p in args.file], ignore_index=True)
+        else:
+            raw = corpus_frame(db, args.dataset)
+        base = base_laws_frame(db)
+    df = prepare(raw)
+    if df.empty:
+        print("❌ 비교할 수집법령이 없습니다. (python law_db.py 먼저 실행)")
+        return 1
+    report = build_report(df, base, args.top)
+    elapsed = time.perf_counter() - start
+
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=1)
+
+    print(f"📈 다년도 비교: {', '.join(map(str, report['years']))} ({len(df):,}건, {elapsed:.2f}s)")
+    print("=" * 60)
+    for y, n in report["coverage"].items():
+        print(f"   • {y}: {n:,}건")
+    print("\n📅 분기별 (전년 동기 / 직전 분기 대비):")
+    for row in report["quarters"]:
+        yoy = "" if row["yoy"] is None else f" YoY {row['yoy']:+d}"
+        qoq = "" if row["qoq"] is None else f" QoQ {row['qoq']:+d}"
+        print(f"   • {row['period']}: {row['count']:,}건{yoy}{qoq}")
+    for span, c in report["lawChanges"].items():
+        print(f"\n🔄 {span}: 신규 {c['appeared']:,}개, 사라짐 {c['disappeared']:,}개")
+    if "baseLaws" in report:
+        print(f"\n🎯 기본법규 개정: {report['baseLaws']['matched']}")
+    print(f"\n💾 저장: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+"""
+법령 변경 알림 다이제스트 발송 (서버 측)
+- 입력: 법령 버전 저장소(law_versions)의 기간 내 기본법규 변경 + 기본법규 직무 카테고리
+- 수신자별(구독 카테고리) 미발송 변경만 모아 카테고리 섹션으로 묶은 다이제스트 1통
+  · 같은 (카테고리, 변경 목록) 섹션은 1회만 렌더링해 수신자 간 재사용
+- SMTP 연결 1개를 재사용해 연속 발송 (MESSAGES_PER_CONNECTION 통마다 재연결)
+- 발송 성공 즉시 notification_deliveries 에 (수신자, 버전) 기록 → 재실행 시 재발송 없음
+- 로컬 SMTP 수신기(sink)로 실제 메일 서버 없이 확인 가능
+
+사용법:
+  python notifier.py send [--from 2026-01-01] [--to 2026-03-31] [--recipients data/recipients.json] [--dry-run]
+  python notifier.py sink [--port 8025] [--outbox data/outbox]     (로컬 SMTP 수신기)
+  SMTP_HOST=127.0.0.1 SMTP_PORT=8025 python notifier.py send
+수신자 파일: [{"email": "a@example.com", "name": "홍길동", "categories": ["환경", "안전"]}, …]
+  (categories 생략 = 전체 카테고리)
+설정(환경변수): SMTP_HOST, SMTP_PORT, SMTP_USER, SMTP_PASSWORD, SMTP_STARTTLS=1, NOTIFY_FROM
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import smtplib
+import sys
+import threading
+import time
+from datetime import date, datetime, timedelta
+from email.message import EmailMessage
+
+RECIPIENTS_PATH = "data/recipients.json"
+OUTBOX_DIR = "data/outbox"
+MESSAGES_PER_CONNECTION = 100  # 서버의 연결당 메시지 수 제한 대비
+SINK_PORT = 8025
+
+
+def load_recipients(path=RECIPIENTS_PATH):
+    """수신자 목록 (이메일 소문자 기준 중복 제거)"""
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    items = data if isinstance(data, list) else data.get("recipients", [])
+    seen, recipients = set(), []
+    for item in items:
+        if isinstance(item, str):
+            item = {"email": item}
+        email = item["email"].strip().lower()
+        if email in seen:
+            continue
+        seen.add(email)
+        recipients.append({"email": email, "name": item.get("name") or email.split("@")[0],
+                           "categories": sorted(set(item.get("categories") or []))})
+    return recipients
+
+
+def quarter_range(today=None):
+    """오늘이 속한 분기 (시작일, 종료일)"""
+    today = today or date.today()
+    first_month = (today.month - 1) // 3 * 3 + 1
+    start = date(today.year, first_month, 1)
+    end = (date(today.year + 1, 1, 1) if first_month == 10 else date(today.year, first_month + 3, 1))
+    return start.isoformat(), (end - timedelta(days=1)).isoformat()
+
+
+def base_law_changes(db, start, end):
+    """start ~ end 시행 기본법규 변경 → [(버전 dict, 카테고리 목록)]"""
+    from law_version_store import LawVersionStore
+
+    index = LawVersionStore(db).index
+    categories = {}  # 현재 법령명(별칭 해소) → 카테고리
+    for row in db.conn.execute("SELECT norm_title, category FROM base_laws"):
+        categories.setdefault(index.key(row["norm_title"]), set()).add(row["category"] or "미분류")
+    day_before = (date.fromisoformat(start) - timedelta(days=1)).isoformat()
+    changes = [(v, index.key(v["norm_title"])) for v in index.changes_between(day_before, end)]
+    return [(v, sorted(categories[key])) for v, key in changes if key in categories]
+
+
+def delivered_pairs(db, version_ids):
+    """이미 발송한 (수신자, 버전 id)"""
+    ids = list(version_ids)
+    sent = set()
+    for i in range(0, len(ids), 500):
+        chunk = ids[i:i + 500]
+        rows = db.conn.execute(
+            f"SELECT recipient, version_id FROM notification_deliveries "
+            f"WHERE version_id IN ({', '.join('?' * len(chunk))})", chunk)
+        sent.update((r[0], r[1]) for r in rows)
+    return sent
+
+
+def plan_digests(recipients, changes, sent=()):
+    """수신자별 다이제스트 [(수신자, [(카테고리, (버전, …))])] — 미발송 변경이 없으면 제외
+
+    변경이 구독 카테고리 여러 개에 걸치면 첫 카테고리 섹션에만 넣음
+    """
+    digests = []
+    for r in recipients:
+        wanted = set(r["categories"])
+        sections = {}
+        for v, cats in changes:
+            if (r["email"], v["id"]) in sent:
+                continue
+            cat = next((c for c in cats if not wanted or c in wanted), None)
+            if cat is not None:
+                sections.setdefault(cat, []).append(v)
+        if sections:
+            digests.append((r, [(c, tuple(sections[c])) for c in sorted(sections)]))
+    return digests
+
+
+class DigestRenderer:
+    """다이제스트 메일 작성 (섹션 텍스트는 (카테고리, 변경 목록)별 1회만 렌더링)"""
+
+    def __init__(self, sender, start, end):
+        self.sender = sender
+        self.start, self.end = start, end
+        self._sections = {}
+        self.rendered = 0
+
+    def section(self, category, versions):
+        key = (category, tuple(v["id"] for v in versions))
+        text = self._sections.get(key)
+        if text is None:
+            lines = [f"■ {category} ({len(versions)}건)"]
+            for v in versions:
+                extra = ", ".join(x for x in (v.get("amend_type"), v.get("ministry")) if x)
+                lines.append(f"  - {v['effective_date']} {v['title']}" + (f" ({extra})" if extra else ""))
+            text = "\n".join(lines)
+            self._sections[key] = text
+            self.rendered += 1
+        return text
+
+    def message(self, recipient, sections):
+        count = sum(len(vs) for _, vs in sections)
+        msg = EmailMessage()
+        msg["From"] = self.sender
+        msg["To"] = recipient["email"]
+        msg["Subject"] = f"[RegRader] 법령 변경 알림 {self.start}~{self.end} ({count}건)"
+        body = [f"{recipient['name']}님, 구독 분야 기본법규 변경 {count}건입니다. ({self.start} ~ {self.end})", ""]
+        body.extend(self.section(c, vs) + "\n" for c, vs in sections)
+        body.append("-- \nRegRader 법령 변경 알림 · 이미 받은 변경은 다시 보내지 않습니다.")
+        msg.set_content("\n".join(body))
+        return msg
+
+
+def digest_id(email, version_ids):
+    raw = email + ":" + ",".join(map(str, sorted(version_ids)))
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:12]
+
+
+class SMTPBatchSender:
+    """SMTP 연결 재사용 발송기 (per_connection 통마다, 또는 끊기면 재연결)"""
+
+    def __init__(self, host=None, port=None, user=None, password=None, starttls=None,
+                 per_connection=MESSAGES_PER_CONNECTION, timeout=30):
+        self.host = host or os.environ.get("SMTP_HOST", "localhost")
+        self.port = int(port or os.environ.get("SMTP_PORT", 25))
+        self.user = user or os.environ.get("SMTP_USER")
+        self.password = password or os.environ.get("SMTP_PASSWORD")
+        self.starttls = (os.environ.get("SMTP_STARTTLS") == "1") if starttls is None else starttls
+        self.per_connection = per_connection
+        self.timeout = timeout
+        self.smtp = None
+        self.sent_on_connection = 0
+        self.connections = 0
+
+    def _connect(self):
+        self.close()
+        self.smtp = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        if self.starttls:
+            self.smtp.starttls()
+        if self.user:
+            self.smtp.login(self.user, self.password or "")
+        self.sent_on_connection = 0
+        self.connections += 1
+
+    def send(self, msg):
+        if self.smtp is None or self.sent_on_connection >= self.per_connection:
+            self._connect()
+        try:
+            self.smtp.send_message(msg)
+        except smtplib.SMTPServerDisconnected:
+            self._connect()  # 유휴 종료 등 → 1회 재연결 후 재시도
+            self.smtp.send_message(msg)
+        self.sent_on_connection += 1
+
+    def close(self):
+        if self.smtp is not None:
+            try:
+                self.smtp.quit()
+            except smtplib.SMTPException:
+                pass
+            self.smtp = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def send_digests(db, recipients, start, end, sender=None, dry_run=False, from_addr=None):
+    """기간 내 변경 다이제스트 발송 → 통계 dict"""
+    from_addr = from_addr or os.environ.get("NOTIFY_FROM", "regrader@localhost")
+    changes = base_law_changes(db, start, end)
+    sent = delivered_pairs(db, (v["id"] for v, _ in changes))
+    digests = plan_digests(recipients, changes, sent)
+    renderer = DigestRenderer(from_addr, start, end)
+    stats = {"changes": len(changes), "recipients": len(recipients), "digests": len(digests),
+             "sent": 0, "failed": [], "items": 0}
+    if dry_run or not digests:
+        stats["items"] = sum(len(vs) for _, secs in digests for _, vs in secs)
+        return stats
+
+    sender = sender or SMTPBatchSender()
+    now = datetime.now().isoformat(timespec="seconds")
+    with sender:
+        for recipient, sections in digests:
+            ids = [v["id"] for _, vs in sections for v in vs]
+            try:
+                sender.send(renderer.message(recipient, sections))
+            except (smtplib.SMTPRecipientsRefused, smtplib.SMTPDataError) as e:
+                stats["failed"].append({"email": recipient["email"], "error": str(e)})
+                continue
+            # 발송 직후 기록 (중단 후 재실행해도 이미 보낸 수신자에게 재발송하지 않음)
+            did = digest_id(recipient["email"], ids)
+            with db.conn:
+                db.conn.executemany(
+                    "INSERT OR IGNORE INTO notification_deliveries (recipient, version_id, digest_id, sent_at) "
+                    "VALUES (?, ?, ?, ?)", [(recipient["email"], vid, did, now) for vid in ids])
+            stats["sent"] += 1
+            stats["items"] += len(ids)
+    stats["connections"] = sender.connections
+    stats["sectionsRendered"] = renderer.rendered
+    return stats
+
+
+class SMTPSink:
+    """로컬 SMTP 수신기 (시험용: 받은 메시지를 메모리/outbox 디렉터리에 보관)"""
+
+    def __init__(self, outbox=None):
+        self.outbox = outbox
+        self.messages = []
+        self.sessions = 0
+        if outbox:
+            os.makedirs(outbox, exist_ok=True)
+
+    async def handle(self, reader, writer):
+        self.sessions += 1
+
+        def reply(line):
+            writer.write((line + "\r\n").encode("utf-8"))
+
+        reply("220 regrader-sink ESMTP")
+        await writer.drain()
+        mail_from, rcpts = None, []
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            command = line.decode("utf-8", "replace").strip()
+            verb = command[:4].upper()
+            if verb in ("EHLO", "HELO"):
+                reply("250-regrader-sink\r\n250-8BITMIME\r\n250 SMTPUTF8" if verb == "EHLO" else "250 regrader-sink")
+            elif verb == "MAIL":
+                mail_from, rcpts = command[10:].split()[0].strip("<>"), []
+                reply("250 OK")
+            elif verb == "RCPT":
+                rcpts.append(command[8:].split()[0].strip("<>"))
+                reply("250 OK")
+            elif verb == "DATA":
+                reply("354 End data with <CR><LF>.<CR><LF>")
+                await writer.drain()
+                data = bytearray()
+                while True:
+                    chunk = await reader.readline()
+                    if not chunk or chunk == b".\r\n":
+                        break
+                    data += chunk[1:] if chunk.startswith(b"..") else chunk
+                self._store(mail_from, rcpts, bytes(data))
+                reply("250 OK queued")
+            elif verb in ("RSET", "NOOP"):
+                reply("250 OK")
+            elif verb == "QUIT":
+                reply("221 Bye")
+                await writer.drain()
+                break
+            else:
+                reply("502 Command not implemented")
+            await writer.drain()
+        writer.close()
+
+    def _store(self, mail_from, rcpts, data):
+        self.messages.append({"from": mail_from, "to": rcpts, "data": data})
+        if self.outbox:
+            path = os.path.join(self.outbox, f"{int(time.time() * 1000)}_{len(self.messages):05d}.eml")
+            with open(path, "wb") as f:
+                f.write(data)
+
+    async def serve(self, host="127.0.0.1", port=SINK_PORT, ready=None):
+        server = await asyncio.start_server(self.handle, host, port)
+        if ready is not None:
+            ready(server.sockets[0].getsockname()[1])
+        async with server:
+            await server.serve_forever()
+
+    def start_in_thread(self, host="127.0.0.1", port=0):
+        """백그라운드 스레드에서 실행 → 실제 포트 반환 (시험/벤치마크용)"""
+        started = threading.Event()
+        bound = []
+
+        def ready(p):
+            bound.append(p)
+            started.set()
+
+        threading.Thread(target=lambda: asyncio.run(self.serve(host, port, ready)), daemon=True).start()
+        started.wait(5)
+        return bound[0]
+
+
+def main(argv=None):
+    """메인 실행"""
+
+    parser = argparse.ArgumentParser(description="법령 변경 알림 다이제스트 발송")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p = sub.add_parser("send", help="기간 내 변경 다이제스트 발송")
+    p.add_argument("--db", default=None, help="법령 DB 경로")
+    p.add_argument("--from", dest="start", help="시작일 (기본: 이번 분기 첫날)")
+    p.add_argument("--to", dest="end", help="종료일 (기본: 이번 분기 마지막 날)")
+    p.add_argument("--recipients", default=RECIPIENTS_PATH)
+    p.add_argument("--dry-run", action="store_true", help="발송/기록 없이 대상만 집계")
+    p = sub.add_parser("sink", help="로컬 SMTP 수신기")
+    p.add_argument("--host", default="127.0.0.1")
+    p.add_argument("--port", type=int, default=SINK_PORT)
+    p.add_argument("--outbox", default=OUTBOX_DIR)
+    args = parser.parse_args(argv)
+
+    if args.command == "sink":
+        sink = SMTPSink(args.outbox)
+        print(f"📮 로컬 SMTP 수신기: {args.host}:{args.port} → {args.outbox}", file=sys.stderr)
+        try:
+            asyncio.run(sink.serve(args.host, args.port))
+        except KeyboardInterrupt:
+            pass
+        return 0
+
+    from law_db import DB_PATH, LawDatabase
+
+    q_start, q_end = quarter_range()
+    start, end = args.start or q_start, args.end or q_end
+    recipients = load_recipients(args.recipients)
+    print(f"📧 법령 변경 알림: {start} ~ {end}, 수신자 {len(recipients)}명")
+    print("=" * 60)
+    with LawDatabase(args.db or DB_PATH) as db:
+        started = time.perf_counter()
+        stats = send_digests(db, recipients, start, end, dry_run=args.dry_run)
+        elapsed = time.perf_counter() - started
+    print(f"   • 기본법규 변경: {stats['changes']}건")
+    print(f"   • 다이제스트: {stats['digests']}통 (미발송 변경 {stats['items']}건)")
+    if args.dry_run:
+        print("\n🔎 dry-run: 발송/기록 없음")
+        return 0
+    print(f"   • 발송: {stats['sent']}통, SMTP 연결 {stats.get('connections', 0)}회, "
+          f"섹션 렌더링 {stats.get('sectionsRendered', 0)}회 ({elapsed:.2f}s)")
+    for f in stats["failed"]:
+        print(f"   ❌ {f['email']}: {f['error']}")
+    return 1 if stats["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+CPU 바운드 파싱/분류 단계 프로세스 풀 병렬 처리
+- 대상 단계 (레코드 1건 = OpenAPI 원본 항목, 선택적으로 상세 HTML/개정문 포함)
+  · scrape.openapi_item: 제목 정리, yyyymmdd_to_iso, norm_lawtype, categorize
+  · 상세 페이지 소관부처 정규식 (detailHtml) → 재분류
+  · 기간·개정 여부 필터 (is_target_item → is_amendment)
+  · enrich: 법령명 정규화 (meta.normTitle), 개정문 조문 색인 (amendment_index.parse_amendment)
+- 입력을 chunk 단위로 워커에 분배, executor.map 으로 입력 순서 그대로 결과 반환 (결정적)
+- 컴파일된 분류 규칙 등 읽기 전용 상태는 워커당 1회 초기화 (initializer)
+- workers <= 1 이면 같은 코드를 현재 프로세스에서 실행 (결과 동일)
+
+사용법:
+  from parallel_parse import process_records
+  items = process_records(raw_items, workers=4, window=(연초, 연말))
+  python regrader_cli.py scrape --workers 4
+  python benchmarks/parallel_scaling.py [--records 100000]
+"""
+
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(ROOT, "scraper"))
+
+DEFAULT_CHUNK = 2000
+
+# 워커 전역 상태 (initializer에서 1회 설정)
+_STATE = {}
+
+
+def _init_worker(cate_rules=None, ministry_map=None, window=None, enrich=True):
+    """워커 초기화: 모듈 로드 + 분류 규칙 컴파일 (레코드마다 반복하지 않음)"""
+    import scrape
+
+    rules = scrape.CATE_RULES if cate_rules is None else cate_rules
+    _STATE.update(
+        rules={cat: [re.compile(r) for r in patterns] for cat, patterns in rules.items()},
+        ministry_map=scrape.MINISTRY_TO_CAT if ministry_map is None else ministry_map,
+        window=window,
+        enrich=enrich,
+    )
+
+
+def process_record(raw):
+    """원본 레코드 1건 → 결과 항목 (기간/개정 필터 탈락 시 None)"""
+    import scrape
+    from amendment_index import parse_amendment
+    from exact_matching_analyzer import normalize_law_name
+
+    rules, ministry_map = _STATE["rules"], _STATE["ministry_map"]
+    item = scrape.openapi_item(raw, rules, ministry_map)
+    if _STATE["window"] and not scrape.is_target_item(item, *_STATE["window"]):
+        return None
+    if not _STATE["enrich"]:
+        return item
+    meta = item["meta"]
+    html = raw.get("detailHtml")
+    if html and not meta["ministry"]:
+        meta["ministry"] = scrape.parse_ministry_html(html)
+        item["categories"] = scrape.categorize(item["title"], meta["ministry"], rules, ministry_map)
+    meta["normTitle"] = normalize_law_name(item["title"])
+    body = raw.get("개정문")
+    if body:
+        parsed = parse_amendment(body, item["title"])
+        meta["amendedArticles"] = [f"{key}:{op}" for key, op in parsed["articles"]]
+        meta["effective"] = parsed["effective"]
+    return item
+
+
+def _process_chunk(chunk):
+    return [process_record(raw) for raw in chunk]
+
+
+def chunked(records, size):
+    for i in range(0, len(records), size):
+        yield records[i:i + size]
+
+
+def process_records(records, workers=None, chunksize=DEFAULT_CHUNK, window=None,
+                    cate_rules=None, ministry_map=None, enrich=True):
+    """원본 레코드 목록 → 결과 항목 목록 (입력 순서 유지, 필터 탈락분 제외)
+
+    workers: 프로세스 수 (None = CPU 수, 1 이하 = 현재 프로세스에서 순차 처리)
+    window:  (시작일, 종료일) 지정 시 scrape.is_target_item 으로 기간 내 개정 항목만
+    enrich:  False 면 openapi_item 결과 그대로 (scrape.run 순차 처리와 동일 출력)
+    """
+    records = list(records)
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    initargs = (cate_rules, ministry_map, window, enrich)
+    if workers <= 1 or len(records) < 2:
+        _init_worker(*initargs)
+        results = _process_chunk(records)
+    else:
+        # 워커당 4개 이상 chunk가 돌도록 (마지막 chunk 대기 시간 분산)
+        size = max(1, min(chunksize, -(-len(records) // (workers * 4))))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=initargs) as pool:
+            results = [item for chunk in pool.map(_process_chunk, chunked(records, size))
+                       for item in chunk]
+    return [item for item in results if item is not None]
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+선택적 CPU/메모리 프로파일링 훅 (스크립트 공통)
+- 켜는 방법: REGRADER_PROFILE=1 (cpu+mem) | cpu | mem 환경변수, 또는 --profile 플래그
+  (regrader_cli.py --profile …, scrape.py/fast_law_collector.py/exact_matching_analyzer.py --profile)
+- 단계(stage)별 cProfile 호출 통계(.prof, snakeviz/pstats로 열람) + tracemalloc 할당 상위 지점(.mem.txt)
+- 실행 종료 시 summary.json 저장 + stderr에 단계별 상위 N개 요약 출력
+  → iterrows / Excel I/O / 정규식 / 네트워크 중 어디서 시간·메모리를 쓰는지 코드 수정 없이 확인
+- 꺼져 있으면 stage()는 아무것도 하지 않음 (cProfile/tracemalloc 미로드)
+- 중첩 단계는 바깥 단계 cProfile을 잠시 멈추고 측정 (각 .prof는 하위 단계 제외)
+- cProfile은 enable한 스레드만 측정 → 작업 스레드는 thread_stage()로 스레드별 .prof
+  (scrape.py run_pipelined의 단계 스레드: pipeline:fetch/parse/enrich, CPU만·메모리는 바깥 단계에 합산)
+  · 최대 메모리(peakBytes)는 단계별로 누적 → 하위 단계의 reset_peak가 바깥 단계 값을 지우지 않음
+
+사용법:
+  REGRADER_PROFILE=1 python fast_law_collector.py
+  python regrader_cli.py --profile match
+  python profiling_hooks.py some_script.py [인자…]     (단계 미정의 스크립트: 전체를 main 단계로)
+출력 위치: data/profiles/<스크립트>_<시각>/ (REGRADER_PROFILE_DIR), 요약 상위 N: REGRADER_PROFILE_TOP
+"""
+
+import atexit
+import contextlib
+import json
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+
+ENV_VAR = "REGRADER_PROFILE"
+PROFILE_DIR = os.environ.get("REGRADER_PROFILE_DIR", "data/profiles")
+TOP_N = int(os.environ.get("REGRADER_PROFILE_TOP", "5"))
+TRACE_FRAMES = 10  # tracemalloc 할당 지점 추적 깊이
+
+_SESSION = None
+
+
+def _modes(value):
+    value = (value or "").strip().lower()
+    if value in ("", "0", "off", "false"):
+        return set()
+    if value in ("1", "on", "true", "all"):
+        return {"cpu", "mem"}
+    return {m for m in value.split(",") if m in ("cpu", "mem")}
+
+
+class ProfileSession:
+    """실행 1회분 프로파일 (단계별 결과 누적 → finish()에서 요약)"""
+
+    def __init__(self, script, modes=("cpu", "mem"), out_dir=None, top=TOP_N):
+        self.script = script
+        self.modes = set(modes)
+        self.top = top
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.out_dir = out_dir or os.path.join(PROFILE_DIR, f"{script}_{stamp}")
+        os.makedirs(self.out_dir, exist_ok=True)
+        self.stages = []
+        self.started = time.perf_counter()
+        self._profilers = []  # 활성 cProfile 스택 (중첩 단계)
+        self._peaks = []      # 활성 단계별 최대 메모리 스택 (중첩 단계)
+        self._finished = False
+        self._lock = threading.Lock()  # 작업 스레드 단계 기록 (stages/파일 번호)
+        if "mem" in self.modes:
+            import tracemalloc
+
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(TRACE_FRAMES)
+
+    def _file(self, name, suffix):
+        safe = "".join(c if c.isalnum() or c in "-_" else "_" for c in name)
+        return os.path.join(self.out_dir, f"{len(self.stages) + 1:02d}_{safe}{suffix}")
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        record = {"stage": name}
+        profiler = snapshot = None
+        if self._profilers:
+            self._profilers[-1].disable()
+        if "mem" in self.modes:
+            import tracemalloc
+
+            # 스냅샷 비용이 cProfile 결과에 섞이지 않도록 먼저
+            snapshot = tracemalloc.take_snapshot()
+            self._fold_peak()
+            self._peaks.append(0)
+        if "cpu" in self.modes:
+            import cProfile
+
+            profiler = cProfile.Profile()
+            self._profilers.append(profiler)
+            profiler.enable()
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield record
+        finally:
+            record["wallSec"] = round(time.perf_counter() - wall, 4)
+            record["cpuSec"] = round(time.process_time() - cpu, 4)
+            if profiler is not None:
+                profiler.disable()
+            if snapshot is not None:
+                self._fold_peak()
+                record["peakBytes"] = self._peaks.pop()
+                if self._peaks:  # 하위 단계 최대치는 바깥 단계에도 포함
+                    self._peaks[-1] = max(self._peaks[-1], record["peakBytes"])
+            try:
+                with self._lock:
+                    if profiler is not None:
+                        self._record_cpu(name, profiler, record)
+                    if snapshot is not None:
+                        self._record_mem(name, snapshot, record)
+                    self.stages.append(record)
+            finally:
+                # 기록(스냅샷/덤프) 비용이 바깥 단계 cProfile에 섞이지 않도록 기록 후 재개
+                if profiler is not None:
+                    self._profilers.pop()
+                    if self._profilers:
+                        self._profilers[-1].enable()
+
+    @contextlib.contextmanager
+    def thread_stage(self, name):
+        """작업 스레드 단계: 그 스레드 전용 cProfile로 측정 (CPU 시간은 스레드 기준)"""
+        record = {"stage": name, "thread": threading.current_thread().name}
+        profiler = None
+        if "cpu" in self.modes:
+            import cProfile
+
+            profiler = cProfile.Profile()
+            try:
+                profiler.enable()
+            except ValueError:  # 다른 프로파일러가 이미 활성 (Python 3.12+ sys.monitoring)
+                profiler = None
+        wall, cpu = time.perf_counter(), time.thread_time()
+        try:
+            yield record
+        finally:
+            record["wallSec"] = round(time.perf_counter() - wall, 4)
+            record["cpuSec"] = round(time.thread_time() - cpu, 4)
+            if profiler is not None:
+                profiler.disable()
+            with self._lock:
+                if profiler is not None:
+                    self._record_cpu(name, profiler, record)
+                self.stages.append(record)
+
+    def _fold_peak(self):
+        """지금까지의 tracemalloc 최대치를 안쪽 활성 단계에 반영하고 초기화"""
+        import tracemalloc
+
+        if self._peaks:
+            self._peaks[-1] = max(self._peaks[-1], tracemalloc.get_traced_memory()[1])
+        tracemalloc.reset_peak()
+
+    def _record_cpu(self, name, profiler, record):
+        import pstats
+
+        path = self._file(name, ".prof")
+        profiler.dump_stats(path)
+        stats = pstats.Stats(profiler).stats
+        top = sorted(stats.items(), key=lambda kv: kv[1][3], reverse=True)
+        record["profile"] = os.path.basename(path)
+        record["topFunctions"] = [
+            {"func": f"{os.path.basename(file)}:{line}({func})", "calls": nc, "cumSec": round(ct, 4),
+             "selfSec": round(tt, 4)}
+            for (file, line, func), (cc, nc, tt, ct, callers) in top
+            if func not in ("<module>", "enable", "disable")
+            and not file.endswith("contextlib.py") and not file.startswith("<frozen")
+        ][:self.top]
+
+    def _record_mem(self, name, before, record):
+        import tracemalloc
+
+        ignore = (tracemalloc.Filter(False, tracemalloc.__file__),
+                  tracemalloc.Filter(False, __file__),
+                  tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"))
+        after = tracemalloc.take_snapshot().filter_traces(ignore)
+        diffs = [d for d in after.compare_to(before.filter_traces(ignore), "lineno") if d.size_diff > 0]
+        record["allocDeltaBytes"] = sum(d.size_diff for d in diffs)
+        path = self._file(name, ".mem.txt")
+        with open(path, "w", encoding="utf-8") as f:
+            for d in diffs[:50]:
+                f.write(f"{d}\n")
+        record["memory"] = os.path.basename(path)
+        record["topAllocations"] = [
+            {"site": f"{os.path.basename(d.traceback[0].filename)}:{d.traceback[0].lineno}",
+             "sizeDiffBytes": d.size_diff, "countDiff": d.count_diff}
+            for d in diffs[:self.top]
+        ]
+
+    def finish(self):
+        """summary.json 저장 + stderr 요약 (atexit에서 1회)"""
+        if self._finished:
+            return
+        self._finished = True
+        summary = {"script": self.script, "modes": sorted(self.modes),
+                   "totalWallSec": round(time.perf_counter() - self.started, 4),
+                   "stages": self.stages}
+        with open(os.path.join(self.out_dir, "summary.json"), "w", encoding="utf-8") as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+
+        err = sys.stderr
+        print(f"\n🔬 프로파일 ({self.script}, 전체 {summary['totalWallSec']:.2f}s) → {self.out_dir}", file=err)
+        for s in self.stages:
+            mem = f", 피크 {s['peakBytes'] / 1e6:.1f}MB" if "peakBytes" in s else ""
+            print(f"   ▸ {s['stage']}: {s['wallSec']:.2f}s (CPU {s['cpuSec']:.2f}s{mem})", file=err)
+            for fn in s.get("topFunctions", []):
+                print(f"       {fn['cumSec']:8.3f}s {fn['calls']:>8}회  {fn['func']}", file=err)
+            for a in s.get("topAllocations", []):
+                print(f"       {a['sizeDiffBytes'] / 1e6:8.2f}MB {a['countDiff']:>8}개  {a['site']}", file=err)
+
+
+def init(script, argv=None, force=False):
+    """--profile 플래그/REGRADER_PROFILE 확인 → 세션 시작 (이미 있으면 그대로). 꺼져 있으면 None"""
+    global _SESSION
+    if _SESSION is not None:
+        return _SESSION
+    argv = sys.argv[1:] if argv is None else argv
+    modes = _modes(os.environ.get(ENV_VAR))
+    if not modes and (force or "--profile" in argv):
+        modes = {"cpu", "mem"}
+    if not modes:
+        return None
+    _SESSION = ProfileSession(script, modes)
+    atexit.register(_SESSION.finish)
+    return _SESSION
+
+
+def stage(name):
+    """프로파일 단계 (꺼져 있으면 no-op)"""
+    if _SESSION is None:
+        return contextlib.nullcontext()
+    return _SESSION.stage(name)
+
+
+def thread_stage(name):
+    """작업 스레드 프로파일 단계 (꺼져 있으면 no-op)"""
+    if _SESSION is None:
+        return contextlib.nullcontext()
+    return _SESSION.thread_stage(name)
+
+
+def main():
+    """임의 스크립트를 main 단계로 프로파일: python profiling_hooks.py script.py [인자…]"""
+    import runpy
+
+    if len(sys.argv) < 2:
+        print(__doc__)
+        return 1
+    path = sys.argv[1]
+    sys.argv = sys.argv[1:]
+    sys.path.insert(0, os.path.dirname(os.path.abspath(path)))
+    init(os.path.splitext(os.path.basename(path))[0], force=True)
+    with stage("main"):
+        runpy.run_path(path, run_name="__main__")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
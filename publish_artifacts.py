@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+게시용 JSON 산출물 생성 (minify + 사전 압축 + 콘텐츠 해시 파일명)
+- docs/index.json 등 → docs/data/<이름>.<해시>.json (+ .gz, brotli 설치 시 .br)
+- 포인터 매니페스트 docs/data/manifest.json: 원본 이름 → 해시 파일 경로
+- 해시 파일은 내용이 바뀌지 않으므로 영구 캐시 가능, 클라이언트는 매니페스트(수백 바이트)만 재검증
+- 기존 고정 이름 파일(docs/index.json 등)은 그대로 유지 (기존 페이지 호환)
+
+사용법:
+  python publish_artifacts.py [docs]
+  python regrader_cli.py publish   (DB → docs/ JSON 재생성 후 자동 실행)
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import sys
+from datetime import datetime
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성 (pip install brotli)
+    brotli = None
+
+ARTIFACTS = ("index.json", "quarterly_details.json", "base_laws_207.json")
+OUTPUT_SUBDIR = "data"
+MANIFEST_NAME = "manifest.json"
+HASH_LENGTH = 12
+KEEP_GENERATIONS = 2  # 이전 세대 해시 파일 보존 수 (매니페스트 갱신 중 로드하던 클라이언트용)
+
+
+def minify(data):
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def content_hash(raw):
+    return hashlib.sha256(raw).hexdigest()[:HASH_LENGTH]
+
+
+def _write_if_missing(path, produce):
+    """해시 파일은 같은 이름 = 같은 내용 → 이미 있으면 생략. 기록 여부 반환"""
+    if os.path.exists(path):
+        return False
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(produce())
+    os.replace(tmp_path, path)
+    return True
+
+
+def publish_file(src_path, out_dir):
+    """JSON 1개 → 해시 파일(+압축본). 매니페스트 항목 반환"""
+    with open(src_path, "r", encoding="utf-8") as f:
+        raw = minify(json.load(f))
+    digest = content_hash(raw)
+    stem = os.path.splitext(os.path.basename(src_path))[0]
+    name = f"{stem}.{digest}.json"
+    path = os.path.join(out_dir, name)
+
+    written = _write_if_missing(path, lambda: raw)
+    entry = {
+        "path": f"{OUTPUT_SUBDIR}/{name}",
+        "hash": digest,
+        "bytes": len(raw),
+        "sourceBytes": os.path.getsize(src_path),
+    }
+    # gzip: mtime=0 으로 같은 입력 → 같은 바이트
+    written |= _write_if_missing(path + ".gz", lambda: gzip.compress(raw, compresslevel=9, mtime=0))
+    entry["gzipBytes"] = os.path.getsize(path + ".gz")
+    if brotli is not None:
+        written |= _write_if_missing(path + ".br", lambda: brotli.compress(raw, quality=11))
+        entry["brBytes"] = os.path.getsize(path + ".br")
+    entry["written"] = written
+    return entry
+
+
+def prune_old(out_dir, stem, keep_hashes):
+    """stem.<해시>.json* 중 keep_hashes 이외 삭제"""
+    removed = 0
+    for fname in os.listdir(out_dir):
+        parts = fname.split(".")
+        if len(parts) >= 3 and parts[0] == stem and parts[2] == "json" and parts[1] not in keep_hashes:
+            os.remove(os.path.join(out_dir, fname))
+            removed += 1
+    return removed
+
+
+def publish(docs_dir="docs", artifacts=ARTIFACTS):
+    """docs_dir 의 JSON 산출물 게시 → 매니페스트 반환"""
+    out_dir = os.path.join(docs_dir, OUTPUT_SUBDIR)
+    os.makedirs(out_dir, exist_ok=True)
+    manifest_path = os.path.join(out_dir, MANIFEST_NAME)
+
+    previous = {}
+    if os.path.exists(manifest_path):
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            previous = json.load(f).get("files", {})
+
+    files = {}
+    for name in artifacts:
+        src_path = os.path.join(docs_dir, name)
+        if not os.path.exists(src_path):
+            continue
+        entry = publish_file(src_path, out_dir)
+        history = [entry["hash"]] + [h for h in previous.get(name, {}).get("history", [])
+                                     if h != entry["hash"]]
+        entry["history"] = history[:KEEP_GENERATIONS + 1]
+        prune_old(out_dir, os.path.splitext(name)[0], set(entry["history"]))
+        files[name] = entry
+
+    manifest = {
+        "generatedAt": datetime.now().isoformat(timespec="seconds"),
+        "files": {name: {k: v for k, v in e.items() if k != "written"} for name, e in files.items()},
+    }
+    # 내용이 같으면 매니페스트도 그대로 (클라이언트 재검증 시 304 유지)
+    if {n: e["hash"] for n, e in files.items()} != {n: e.get("hash") for n, e in previous.items()}:
+        tmp_path = manifest_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, manifest_path)
+    return files
+
+
+def main():
+    """메인 실행"""
+
+    docs_dir = sys.argv[1] if len(sys.argv) > 1 else "docs"
+    print("📦 게시 산출물 생성 (minify + gzip" + (" + brotli" if brotli else "") + ")")
+    print("=" * 60)
+    files = publish(docs_dir)
+    for name, e in files.items():
+        br = f", br {e['brBytes']:,}" if "brBytes" in e else ""
+        state = "신규" if e["written"] else "변경 없음"
+        print(f"   ✅ {name}: {e['sourceBytes']:,} → {e['bytes']:,} (gz {e['gzipBytes']:,}{br}) "
+              f"→ {e['path']} [{state}]")
+    print(f"\n📋 매니페스트: {os.path.join(docs_dir, OUTPUT_SUBDIR, MANIFEST_NAME)}")
+
+
+if __name__ == "__main__":
+    main()
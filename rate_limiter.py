@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+프로세스 간 공유 요청 속도 제한 + 일일 쿼터 관리
+- (호스트, OC 키)별 토큰 버킷 상태를 data/ratelimit/*.json 에 두고 파일 잠금(fcntl.flock)으로 공유
+  → cron 스크랩/백필/보강 작업이 동시에 돌아도 합산 요청 속도가 한도를 넘지 않음
+- 일일 사용량 기록 (한도 설정 시 초과하면 QuotaExceeded)
+- 상류 제한 응답(429/503) 시 penalize() → 같은 키를 쓰는 모든 프로세스가 함께 대기
+
+사용법:
+  from rate_limiter import limiter_for_url
+  limiter_for_url(url).acquire()      (요청 직전)
+  python rate_limiter.py [status]     (키별 토큰/오늘 사용량 확인)
+설정(환경변수): RATE_LIMIT_DIR, RATE_LIMIT_RPS, RATE_LIMIT_BURST, RATE_LIMIT_DAILY
+"""
+
+import fcntl
+import hashlib
+import json
+import os
+import sys
+import time
+import urllib.parse
+from datetime import date
+
+STATE_DIR = os.environ.get("RATE_LIMIT_DIR", "data/ratelimit")
+
+# 호스트별 (초당 요청 수, 버스트 크기, 일일 한도(None=무제한))
+HOST_LIMITS = {
+    "www.law.go.kr": (10.0, 10, None),
+}
+DEFAULT_LIMIT = (5.0, 5, None)
+
+
+class QuotaExceeded(Exception):
+    """일일 쿼터 소진"""
+
+
+def _env_limit(host):
+    rate, burst, daily = HOST_LIMITS.get(host, DEFAULT_LIMIT)
+    rate = float(os.environ.get("RATE_LIMIT_RPS", rate))
+    burst = int(os.environ.get("RATE_LIMIT_BURST", burst))
+    daily = os.environ.get("RATE_LIMIT_DAILY", daily)
+    return rate, burst, int(daily) if daily else None
+
+
+class RateLimiter:
+    """파일 잠금 기반 토큰 버킷 (host, key 단위)"""
+
+    def __init__(self, host, key="", rate=None, burst=None, daily_quota=None, state_dir=None):
+        env_rate, env_burst, env_daily = _env_limit(host)
+        self.host = host
+        self.rate = rate or env_rate
+        self.burst = burst or env_burst
+        self.daily_quota = daily_quota if daily_quota is not None else env_daily
+        state_dir = state_dir or STATE_DIR
+        os.makedirs(state_dir, exist_ok=True)
+        # OC 키는 파일명에 그대로 남기지 않음
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:10]
+        self.path = os.path.join(state_dir, f"{host}.{digest}.json")
+
+    def _locked(self, update):
+        """잠금 상태에서 상태 읽기 → update(state, now) → 저장. update 반환값 반환"""
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        with open(fd, "r+", encoding="utf-8") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                raw = f.read()
+                state = json.loads(raw) if raw else {}
+                now = time.time()
+                today = date.today().isoformat()
+                if state.get("day") != today:
+                    state.update(day=today, used=0)
+                if "tokens" not in state:
+                    state.update(tokens=float(self.burst), updated=now)
+                # 경과 시간만큼 토큰 보충
+                elapsed = max(0.0, now - state["updated"])
+                state["tokens"] = min(float(self.burst), state["tokens"] + elapsed * self.rate)
+                state["updated"] = now
+                result = update(state, now)
+                f.seek(0)
+                f.truncate()
+                json.dump(state, f)
+                f.flush()  # 잠금 해제 전에 기록
+                return result
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def try_acquire(self, tokens=1):
+        """토큰 획득 시도 → 0(성공) 또는 다음 시도까지 대기 초"""
+
+        def take(state, now):
+            if self.daily_quota is not None and state["used"] + tokens > self.daily_quota:
+                raise QuotaExceeded(f"{self.host}: 일일 쿼터 {self.daily_quota}회 소진")
+            blocked = state.get("blocked_until", 0) - now
+            if blocked > 0:
+                return blocked
+            if state["tokens"] >= tokens:
+                state["tokens"] -= tokens
+                state["used"] += tokens
+                return 0.0
+            return (tokens - state["tokens"]) / self.rate
+
+        return self._locked(take)
+
+    def acquire(self, tokens=1):
+        """토큰 획득까지 대기. 총 대기 초 반환"""
+        waited = 0.0
+        while True:
+            wait = self.try_acquire(tokens)
+            if wait <= 0:
+                return waited
+            time.sleep(wait)
+            waited += wait
+
+    def penalize(self, seconds):
+        """상류 제한 응답 → seconds 동안 이 키의 모든 요청 보류 (프로세스 공통)"""
+
+        def block(state, now):
+            state["blocked_until"] = max(state.get("blocked_until", 0), now + seconds)
+            state["tokens"] = 0.0
+
+        self._locked(block)
+
+    def usage(self):
+        """현재 상태 (tokens, used, day, blocked_until)"""
+        return self._locked(lambda state, now: dict(state))
+
+
+_LIMITERS = {}
+
+
+def limiter_for(host, key=""):
+    """(host, key)별 RateLimiter (프로세스 내 재사용)"""
+    if (host, key) not in _LIMITERS:
+        _LIMITERS[(host, key)] = RateLimiter(host, key)
+    return _LIMITERS[(host, key)]
+
+
+def limiter_for_url(url):
+    """URL의 호스트 + OC 파라미터(없으면 LAW_OC)로 RateLimiter 선택"""
+    parts = urllib.parse.urlsplit(url)
+    oc = urllib.parse.parse_qs(parts.query).get("OC", [os.environ.get("LAW_OC", "")])[0]
+    return limiter_for(parts.hostname or "", oc)
+
+
+def main():
+    """메인 실행"""
+
+    if not os.path.isdir(STATE_DIR):
+        print(f"❌ 상태 디렉토리 없음: {STATE_DIR}")
+        return 1
+    print(f"🚦 요청 속도 제한 상태 ({STATE_DIR})")
+    print("=" * 60)
+    for fname in sorted(os.listdir(STATE_DIR)):
+        if not fname.endswith(".json"):
+            continue
+        host = fname.rsplit(".", 2)[0]
+        limiter = RateLimiter(host)
+        limiter.path = os.path.join(STATE_DIR, fname)
+        state = limiter.usage()
+        quota = f"/{limiter.daily_quota:,}" if limiter.daily_quota else ""
+        blocked = state.get("blocked_until", 0) - time.time()
+        print(f"   {fname}: 토큰 {state['tokens']:.1f}/{limiter.burst} ({limiter.rate:g}/s), "
+              f"오늘 {state['used']:,}{quota}회" + (f", 보류 {blocked:.0f}s" if blocked > 0 else ""))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
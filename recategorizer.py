@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+"""
+분류 규칙 증분 재분류
+- scrape.py의 CATE_RULES / MINISTRY_TO_CAT 을 버전으로 관리 (법령 DB rule_versions)
+- 법령명 1/2-gram 역색인(title_grams)을 DB에 유지 → 규칙 키워드로 후보 레코드 즉시 조회
+- 규칙 변경 시 추가/삭제된 정규식 분기와 변경된 부처 키에 걸리는 레코드만 재분류
+- 카테고리 변경 리포트 (category_changes 이력 + JSON)
+- 첫 실행(이전 버전 없음)은 기준선: 규칙 버전만 기록하고 규칙과의 차이는 리포트만 (DB 미반영)
+- 기존 대표 카테고리(categories[0] = 직무카테고리)는 재분류해도 유지 (나머지 카테고리만 규칙 결과)
+- 큐레이션 데이터셋(index: docs/index.json 직무 분류)은 기본 대상에서 제외 (--dataset index 로 명시)
+
+사용법:
+  python recategorizer.py [--dataset quarterly] [--rules rules.json] [--dry-run] [--full] [--report 경로]
+  python regrader_cli.py recategorize ...
+rules.json 형식: {"CATE_RULES": {...}, "MINISTRY_TO_CAT": {...}} (생략 시 scrape.py 규칙)
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from html import unescape
+
+from law_db import LawDatabase
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+CURATED_DATASETS = ("index",)  # 직무 카테고리를 사람이 정한 데이터셋 (기본 재분류 대상 아님)
+REGEX_META = set(".^$*+?{}[]()|\\")
+
+
+# ----------------------------------------------------------------------
+# 규칙 → 분기/필수 키워드
+# ----------------------------------------------------------------------
+
+def load_rules(path=None):
+    """규칙 (CATE_RULES, MINISTRY_TO_CAT). path 생략 시 scrape.py 모듈 규칙"""
+    if path:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data["CATE_RULES"], data["MINISTRY_TO_CAT"]
+    sys.path.insert(0, os.path.join(ROOT, "scraper"))
+    import scrape
+    return scrape.CATE_RULES, scrape.MINISTRY_TO_CAT
+
+
+def rules_hash(cate_rules, ministry_map):
+    payload = json.dumps({"CATE_RULES": cate_rules, "MINISTRY_TO_CAT": ministry_map},
+                         ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def split_alternatives(pattern):
+    """최상위 '|' 기준 분기 분리 (괄호/문자 클래스/이스케이프 내부 제외)"""
+    branches, cur, depth, i = [], [], 0, 0
+    while i < len(pattern):
+        ch = pattern[i]
+        if ch == "\\":
+            cur.append(pattern[i:i + 2])
+            i += 2
+            continue
+        if ch == "[":
+            end = pattern.find("]", i + 1)
+            end = len(pattern) - 1 if end < 0 else end
+            cur.append(pattern[i:end + 1])
+            i = end + 1
+            continue
+        if ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+        elif ch == "|" and depth == 0:
+            branches.append("".join(cur))
+            cur = []
+            i += 1
+            continue
+        cur.append(ch)
+        i += 1
+    branches.append("".join(cur))
+    return branches
+
+
+def required_literal(branch):
+    """분기와 일치하는 모든 법령명이 반드시 포함하는 가장 긴 리터럴 (없으면 "")"""
+    literals, cur, depth, i = [], "", 0, 0
+
+    def flush():
+        nonlocal cur
+        if cur:
+            literals.append(cur)
+        cur = ""
+
+    while i < len(branch):
+        ch = branch[i]
+        if ch == "\\":
+            flush()
+            i += 2
+        elif ch == "[":
+            flush()
+            end = branch.find("]", i + 1)
+            i = len(branch) if end < 0 else end + 1
+        elif ch == "(":
+            flush()
+            depth += 1
+            i += 1
+        elif ch == ")":
+            depth -= 1
+            i += 1
+        elif depth > 0:
+            i += 1
+        elif ch in "?*{":
+            # 0회 허용 수량자 → 직전 글자는 필수 아님
+            cur = cur[:-1]
+            flush()
+            i = branch.find("}", i) + 1 if ch == "{" else i + 1
+            i = i or len(branch)
+        elif ch in REGEX_META:
+            flush()
+            i += 1
+        else:
+            cur += ch
+            i += 1
+    flush()
+    return max(literals, key=len, default="")
+
+
+def rule_branches(cate_rules):
+    """{(카테고리, 분기 정규식)}"""
+    return {(cat, branch) for cat, rules in cate_rules.items()
+            for rule in rules for branch in split_alternatives(rule)}
+
+
+def title_grams(title):
+    """법령명 1/2-gram 집합 (공백 제외)"""
+    text = unescape(title or "")
+    grams = {ch for ch in text if not ch.isspace()}
+    grams.update(text[i:i + 2] for i in range(len(text) - 1) if not any(c.isspace() for c in text[i:i + 2]))
+    return grams
+
+
+def literal_grams(literal):
+    if len(literal) == 1:
+        return {literal}
+    return {literal[i:i + 2] for i in range(len(literal) - 1)}
+
+
+# ----------------------------------------------------------------------
+# 재분류기
+# ----------------------------------------------------------------------
+
+class Recategorizer:
+    """법령 DB corpus 카테고리 증분 재분류기"""
+
+    def __init__(self, db, dataset):
+        self.db = db
+        self.dataset = dataset
+
+    def sync_title_index(self):
+        """신규/법령명 변경 레코드만 gram 역색인 갱신. 갱신 레코드 수 반환"""
+        rows = self.db.conn.execute(
+            "SELECT c.id, c.title FROM corpus c LEFT JOIN title_gram_rows t ON t.corpus_id = c.id "
+            "WHERE t.title IS NULL OR t.title != c.title").fetchall()
+        if not rows:
+            return 0
+        with self.db.conn:
+            self.db.conn.executemany("DELETE FROM title_grams WHERE corpus_id = ?", [(r["id"],) for r in rows])
+            self.db.conn.executemany(
+                "INSERT OR IGNORE INTO title_grams (gram, corpus_id) VALUES (?, ?)",
+                [(g, r["id"]) for r in rows for g in title_grams(r["title"])])
+            self.db.conn.executemany(
+                "INSERT OR REPLACE INTO title_gram_rows (corpus_id, title) VALUES (?, ?)",
+                [(r["id"], r["title"]) for r in rows])
+        return len(rows)
+
+    def candidates_for_literal(self, literal):
+        """리터럴의 gram을 모두 가진 레코드 id (포함 여부는 재분류 시 정규식으로 확인)"""
+        grams = sorted(literal_grams(literal))
+        marks = ", ".join("?" for _ in grams)
+        return {r[0] for r in self.db.conn.execute(
+            f"SELECT g.corpus_id FROM title_grams g JOIN corpus c ON c.id = g.corpus_id "
+            f"WHERE g.gram IN ({marks}) AND c.dataset = ? "
+            f"GROUP BY g.corpus_id HAVING COUNT(DISTINCT g.gram) = ?",
+            grams + [self.dataset, len(grams)])}
+
+    def candidates_for_ministry(self, ministry_key):
+        return {r[0] for r in self.db.conn.execute(
+            "SELECT id FROM corpus WHERE instr(ministry, ?) > 0 AND dataset = ?",
+            (ministry_key, self.dataset))}
+
+    def all_records(self):
+        return {r[0] for r in self.db.conn.execute(
+            "SELECT id FROM corpus WHERE dataset = ?", (self.dataset,))}
+
+    def latest_version(self):
+        """데이터셋에 마지막으로 적용된 규칙 버전 (없으면 None)"""
+        return self.db.conn.execute(
+            "SELECT v.* FROM rule_applications a JOIN rule_versions v ON v.id = a.rule_version_id "
+            "WHERE a.dataset = ? ORDER BY a.id DESC LIMIT 1", (self.dataset,)).fetchone()
+
+    def affected_records(self, old_rules, new_rules):
+        """규칙 변경으로 카테고리가 바뀔 수 있는 레코드 id + 변경 내역"""
+        old_cate, old_min = old_rules
+        new_cate, new_min = new_rules
+        changed_branches = rule_branches(old_cate) ^ rule_branches(new_cate)
+        changed_ministries = {m for m in set(old_min) | set(new_min)
+                              if sorted(old_min.get(m, [])) != sorted(new_min.get(m, []))}
+
+        affected = set()
+        for _, branch in changed_branches:
+            literal = required_literal(branch)
+            if not literal:  # 필수 키워드 없는 분기 → 전체 대상
+                return self.all_records(), changed_branches, changed_ministries
+            affected |= self.candidates_for_literal(literal)
+        for ministry_key in changed_ministries:
+            affected |= self.candidates_for_ministry(ministry_key)
+        return affected, changed_branches, changed_ministries
+
+    def run(self, rules, dry_run=False, full=False):
+        """규칙 적용 → 리포트(dict). full=True 면 규칙 변경과 무관하게 전체 재분류"""
+        sys.path.insert(0, os.path.join(ROOT, "scraper"))
+        from scrape import categorize
+
+        cate_rules, ministry_map = rules
+        digest = rules_hash(cate_rules, ministry_map)
+        previous = self.latest_version()
+        report = {"dataset": self.dataset, "ruleVersion": digest,
+                  "previousVersion": previous["hash"] if previous else None, "changes": []}
+
+        indexed = self.sync_title_index()
+        if previous and previous["hash"] == digest and not full:
+            report.update(mode="unchanged", candidates=0, indexed=indexed)
+            return report
+
+        if previous and not full:
+            old = json.loads(previous["rules"])
+            ids, branches, ministries = self.affected_records(
+                (old["CATE_RULES"], old["MINISTRY_TO_CAT"]), rules)
+            report.update(mode="incremental",
+                          changedBranches=sorted(f"{c}: {b}" for c, b in branches),
+                          changedMinistries=sorted(ministries))
+        else:
+            # 이전 버전이 없으면 기준선: 차이만 리포트하고 반영하지 않음
+            ids = self.all_records()
+            report["mode"] = "full" if previous else "baseline"
+        report.update(candidates=len(ids), indexed=indexed)
+
+        changes = []
+        id_list = sorted(ids)
+        for i in range(0, len(id_list), 500):
+            chunk = id_list[i:i + 500]
+            marks = ", ".join("?" for _ in chunk)
+            for r in self.db.conn.execute(
+                    f"SELECT id, dataset, item_id, title, ministry, categories FROM corpus "
+                    f"WHERE id IN ({marks})", chunk):
+                old_cats = json.loads(r["categories"]) if r["categories"] else []
+                new_cats = merge_categories(
+                    old_cats, categorize(r["title"], r["ministry"], cate_rules, ministry_map))
+                if old_cats[:1] + sorted(old_cats[1:]) != new_cats:
+                    changes.append({"corpusId": r["id"], "dataset": r["dataset"], "id": r["item_id"],
+                                    "title": r["title"], "old": old_cats, "new": new_cats})
+        report["changes"] = changes
+        report["summary"] = summarize_changes(changes)
+
+        if not dry_run:
+            self._apply(digest, cate_rules, ministry_map, report)
+        return report
+
+    def _apply(self, digest, cate_rules, ministry_map, report):
+        now = datetime.now().isoformat(timespec="seconds")
+        rules_json = json.dumps({"CATE_RULES": cate_rules, "MINISTRY_TO_CAT": ministry_map},
+                                ensure_ascii=False, sort_keys=True)
+        changes = [] if report["mode"] == "baseline" else report["changes"]
+        with self.db.conn:
+            self.db.conn.execute(
+                "INSERT OR IGNORE INTO rule_versions (hash, rules, created_at) VALUES (?, ?, ?)",
+                (digest, rules_json, now))
+            version_id = self.db.conn.execute(
+                "SELECT id FROM rule_versions WHERE hash = ?", (digest,)).fetchone()[0]
+            self.db.conn.execute(
+                "INSERT INTO rule_applications (dataset, rule_version_id, mode, candidates, changed, "
+                "applied_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (self.dataset, version_id, report["mode"], report["candidates"], len(changes), now))
+            self.db.conn.executemany(
+                "UPDATE corpus SET categories = ?, category = ?, updated_at = ? WHERE id = ?",
+                [(json.dumps(c["new"], ensure_ascii=False), c["new"][0], now, c["corpusId"])
+                 for c in changes])
+            self.db.conn.executemany(
+                "INSERT INTO category_changes (rule_version_id, corpus_id, old_categories, "
+                "new_categories, changed_at) VALUES (?, ?, ?, ?, ?)",
+                [(version_id, c["corpusId"], json.dumps(c["old"], ensure_ascii=False),
+                  json.dumps(c["new"], ensure_ascii=False), now) for c in changes])
+
+
+def merge_categories(old_cats, new_cats):
+    """규칙 분류 결과 + 기존 대표 카테고리 유지 (대표가 없거나 '기타'면 규칙 결과 그대로)"""
+    if not old_cats or old_cats[0] == "기타":
+        return new_cats
+    return [old_cats[0]] + [c for c in new_cats if c not in (old_cats[0], "기타")]
+
+
+def default_datasets(db):
+    """카테고리가 있는 데이터셋 중 큐레이션 데이터셋 제외"""
+    return [r[0] for r in db.conn.execute(
+        "SELECT DISTINCT dataset FROM corpus WHERE categories IS NOT NULL ORDER BY dataset")
+        if r[0] not in CURATED_DATASETS]
+
+
+def summarize_changes(changes):
+    """카테고리별 추가/제거 건수"""
+    gained, lost = {}, {}
+    for c in changes:
+        for cat in set(c["new"]) - set(c["old"]):
+            gained[cat] = gained.get(cat, 0) + 1
+        for cat in set(c["old"]) - set(c["new"]):
+            lost[cat] = lost.get(cat, 0) + 1
+    return {"records": len(changes), "gained": gained, "lost": lost}
+
+
+def print_report(report, limit=20):
+    print(f"🏷️  [{report['dataset']}] 분류 규칙 {report['ruleVersion']} "
+          f"(이전 {report['previousVersion'] or '없음'}) - {report['mode']}")
+    print(f"   • 역색인 갱신 {report['indexed']:,}건")
+    if report["mode"] == "unchanged":
+        print("   ✅ 규칙 변경 없음")
+        return
+    if report["mode"] == "baseline":
+        print(f"   • 첫 실행: 규칙 버전을 기준선으로 기록, 규칙과 다른 {report['summary']['records']:,}건은 "
+              f"반영하지 않음 (반영: --full)")
+    if report["mode"] == "incremental":
+        print(f"   • 변경 분기 {len(report['changedBranches'])}개, 변경 부처 {len(report['changedMinistries'])}개")
+    print(f"   • 재분류 후보 {report['candidates']:,}건 → 카테고리 변경 {report['summary']['records']:,}건")
+    for cat, n in sorted(report["summary"]["gained"].items()):
+        print(f"      + {cat}: {n}건")
+    for cat, n in sorted(report["summary"]["lost"].items()):
+        print(f"      - {cat}: {n}건")
+    for c in report["changes"][:limit]:
+        print(f"   📝 {c['title']}: {', '.join(c['old']) or '-'} → {', '.join(c['new'])}")
+    if len(report["changes"]) > limit:
+        print(f"   ... 외 {len(report['changes']) - limit}건")
+
+
+def main(argv=None):
+    """메인 실행"""
+
+    parser = argparse.ArgumentParser(description="분류 규칙 증분 재분류")
+    parser.add_argument("--db", default="data/regrader.db")
+    parser.add_argument("--dataset", action="append",
+                        help="대상 데이터셋 (반복 가능, 기본: 카테고리가 있는 데이터셋 중 index 제외)")
+    parser.add_argument("--rules", help="규칙 JSON (기본: scrape.py CATE_RULES/MINISTRY_TO_CAT)")
+    parser.add_argument("--dry-run", action="store_true", help="DB 반영 없이 리포트만")
+    parser.add_argument("--full", action="store_true", help="규칙 변경 여부와 무관하게 전체 재분류")
+    parser.add_argument("--report", help="변경 리포트 JSON 저장 경로")
+    args = parser.parse_args(argv)
+
+    rules = load_rules(args.rules)
+    reports = []
+    with LawDatabase(args.db) as db:
+        for dataset in args.dataset or default_datasets(db):
+            start = time.perf_counter()
+            report = Recategorizer(db, dataset).run(rules, dry_run=args.dry_run, full=args.full)
+            report["elapsedMs"] = round((time.perf_counter() - start) * 1000, 1)
+            print_report(report)
+            print(f"   ⏱️  {report['elapsedMs']}ms\n")
+            reports.append(report)
+
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(reports, f, ensure_ascii=False, indent=2)
+        print(f"💾 리포트: {args.report}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
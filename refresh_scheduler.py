@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+시행일 기반 법령 갱신 스케줄러
+- 시행일(effectiveDate)이 가까운 법령일수록 짧은 갱신 주기
+- 최근 변경이 감지된 법령은 주기 단축
+- 우선순위 큐(heap)로 제한된 요청 예산을 변경 가능성이 높은 법령에 배분
+- 갱신 요청: OpenAPI 시행일 법령 검색(scrape.http_get, 공유 속도 제한). 쿼터 소진 시 상태 저장 후 중단
+- 재조회 결과 시행일이 바뀌면 레코드 키(제목+시행일)도 새 시행일로 이동
+
+사용법:
+  python refresh_scheduler.py [plan] [--budget 50]   (이번 실행 갱신 대상만 출력)
+  python refresh_scheduler.py run [--budget 50]      (기한이 지난 레코드 재조회 + 상태 저장)
+  python regrader_cli.py refresh plan|run [--budget 50]
+"""
+
+import argparse
+import hashlib
+import heapq
+import json
+import os
+import sys
+import urllib.parse
+from datetime import date, datetime
+
+INDEX_JSON = "docs/index.json"
+QUARTERLY_JSON = "docs/quarterly_details.json"
+STATE_PATH = "data/refresh_state.json"
+
+HOUR = 3600
+DAY = 24 * HOUR
+
+# 시행 전 법령: 시행일까지 남은 일수 → 갱신 주기(초)
+UPCOMING_INTERVALS = [
+    (7, 6 * HOUR),
+    (30, 1 * DAY),
+    (90, 3 * DAY),
+]
+UPCOMING_DEFAULT = 7 * DAY
+
+# 시행 후 법령: 시행일로부터 지난 일수 → 갱신 주기(초)
+EFFECTIVE_INTERVALS = [
+    (30, 3 * DAY),
+    (180, 14 * DAY),
+]
+EFFECTIVE_DEFAULT = 30 * DAY
+
+# 최근 변경 감지 시 주기 단축
+RECENT_CHANGE_DAYS = 14
+RECENT_CHANGE_FACTOR = 0.5
+MIN_INTERVAL = 1 * HOUR
+
+
+def record_key(item):
+    """파일 간 공통 키 (id는 파일마다 달라 제목+시행일 사용)"""
+    title = " ".join(str(item.get("title") or "").split())
+    return f"{title}|{item.get('effectiveDate') or ''}"
+
+
+def record_fingerprint(item):
+    """변경 감지용 지문 (갱신 대상 필드만)"""
+    payload = {
+        "effectiveDate": item.get("effectiveDate"),
+        "lawType": item.get("lawType"),
+        "status": item.get("status"),
+        "amendments": [
+            (a.get("date"), a.get("reason")) for a in (item.get("amendments") or [])
+        ],
+    }
+    raw = json.dumps(payload, ensure_ascii=False, sort_keys=True)
+    return hashlib.md5(raw.encode("utf-8")).hexdigest()
+
+
+def load_corpus_records(index_path=INDEX_JSON, quarterly_path=QUARTERLY_JSON):
+    """index.json + quarterly_details.json 레코드 통합 (제목+시행일 기준 중복 제거)"""
+    records = {}
+
+    if index_path and os.path.exists(index_path):
+        with open(index_path, "r", encoding="utf-8") as f:
+            for item in json.load(f).get("items", []):
+                records.setdefault(record_key(item), item)
+
+    if quarterly_path and os.path.exists(quarterly_path):
+        with open(quarterly_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        laws = list(data.get("items", []))
+        for quarter in (data.get("quarters") or {}).values():
+            laws.extend(quarter.get("laws", []))
+        for item in laws:
+            records.setdefault(record_key(item), item)
+
+    return records
+
+
+def _parse_date(value):
+    if not value:
+        return None
+    try:
+        return datetime.strptime(str(value)[:10], "%Y-%m-%d").date()
+    except ValueError:
+        return None
+
+
+def refresh_interval(item, today=None, last_changed=None):
+    """레코드별 갱신 주기(초) 계산"""
+    today = today or date.today()
+    eff = _parse_date(item.get("effectiveDate"))
+
+    if eff is None:
+        interval = EFFECTIVE_DEFAULT
+    elif eff >= today or item.get("status") == "시행예정":
+        days_until = max((eff - today).days, 0)
+        interval = UPCOMING_DEFAULT
+        for limit, value in UPCOMING_INTERVALS:
+            if days_until <= limit:
+                interval = value
+                break
+    else:
+        days_since = (today - eff).days
+        interval = EFFECTIVE_DEFAULT
+        for limit, value in EFFECTIVE_INTERVALS:
+            if days_since <= limit:
+                interval = value
+                break
+
+    # 최근 개정일 또는 최근 변경 감지 시 주기 단축
+    changed = _parse_date(last_changed)
+    for amendment in item.get("amendments") or []:
+        amended = _parse_date(amendment.get("date"))
+        if amended and amended <= today and (changed is None or amended > changed):
+            changed = amended
+    if changed and 0 <= (today - changed).days <= RECENT_CHANGE_DAYS:
+        interval *= RECENT_CHANGE_FACTOR
+
+    return max(int(interval), MIN_INTERVAL)
+
+
+class RefreshScheduler:
+    """시행일 기반 갱신 우선순위 큐"""
+
+    def __init__(self, records, state_path=STATE_PATH, now=None):
+        self.records = records
+        self.state_path = state_path
+        self.state = self._load_state()
+        self._heap = []
+        self._due = {}
+        self.rebuild(now)
+
+    def _load_state(self):
+        if self.state_path and os.path.exists(self.state_path):
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        return {}
+
+    def save_state(self):
+        """갱신 이력 저장 (마지막 갱신/변경 시각, 지문)"""
+        if not self.state_path:
+            return
+        os.makedirs(os.path.dirname(self.state_path) or ".", exist_ok=True)
+        with open(self.state_path, "w", encoding="utf-8") as f:
+            json.dump(self.state, f, ensure_ascii=False, indent=2)
+
+    def _schedule(self, key, now):
+        item = self.records[key]
+        st = self.state.get(key, {})
+        today = datetime.fromtimestamp(now).date()
+        interval = refresh_interval(item, today, st.get("lastChanged"))
+        last = st.get("lastRefreshed")
+        due = now if last is None else last + interval
+        self._due[key] = due
+        # 기한이 같으면 주기가 짧은(변경 가능성이 높은) 레코드 우선
+        heapq.heappush(self._heap, (due, interval, key))
+
+    def rebuild(self, now=None):
+        """전체 레코드 기준 큐 재구성"""
+        now = now if now is not None else datetime.now().timestamp()
+        self._heap = []
+        self._due = {}
+        for key in self.records:
+            self._schedule(key, now)
+
+    def next_batch(self, budget, now=None):
+        """예산(요청 수) 내에서 갱신 기한이 지난 레코드를 우선순위 순으로 반환"""
+        now = now if now is not None else datetime.now().timestamp()
+        batch = []
+        while self._heap and len(batch) < budget:
+            due, _, key = self._heap[0]
+            if self._due.get(key) != due:
+                heapq.heappop(self._heap)  # 재스케줄로 무효화된 항목
+                continue
+            if due > now:
+                break
+            heapq.heappop(self._heap)
+            del self._due[key]
+            batch.append(key)
+        return batch
+
+    def mark_refreshed(self, key, new_item=None, now=None):
+        """갱신 결과 반영 후 재스케줄. 변경 여부 반환"""
+        now = now if now is not None else datetime.now().timestamp()
+        st = self.state.setdefault(key, {})
+        changed = False
+        if new_item is not None:
+            fp = record_fingerprint(new_item)
+            old_fp = st.get("fingerprint") or record_fingerprint(self.records[key])
+            changed = fp != old_fp
+            st["fingerprint"] = fp
+            self.records[key] = new_item
+            if changed:
+                st["lastChanged"] = datetime.fromtimestamp(now).date().isoformat()
+        st["lastRefreshed"] = now
+        if new_item is not None and record_key(new_item) != key:
+            key = self._rekey(key, record_key(new_item))
+        self._schedule(key, now)
+        return changed
+
+    def _rekey(self, old_key, new_key):
+        """시행일 변경 → 레코드/상태를 새 키로 이동 (기존 큐 항목은 _due 불일치로 무효화)"""
+        self.records[new_key] = self.records.pop(old_key)
+        self.state[new_key] = self.state.pop(old_key)
+        self._due.pop(old_key, None)
+        return new_key
+
+    def refresh_due(self, fetch, budget, now=None):
+        """기한이 지난 레코드를 fetch(item)로 갱신
+
+        fetch는 새 레코드(없어진 법령이면 None) 반환. 예외는 오류로 따로 집계하고 다음 주기에 재시도
+        쿼터 소진(rate_limiter.QuotaExceeded)은 그때까지의 상태를 저장한 뒤 전파
+        """
+        from rate_limiter import QuotaExceeded
+
+        results = {"refreshed": 0, "changed": 0, "missing": 0, "errors": 0, "changedKeys": []}
+        try:
+            for key in self.next_batch(budget, now):
+                try:
+                    new_item = fetch(self.records[key])
+                except QuotaExceeded:
+                    self._schedule(key, now if now is not None else datetime.now().timestamp())
+                    raise
+                except Exception as e:
+                    results["errors"] += 1
+                    print(f"   ⚠️ 갱신 오류: {key} → {type(e).__name__}: {e}", file=sys.stderr)
+                    self.mark_refreshed(key, None, now)  # 다음 주기에 재시도
+                    continue
+                if new_item is None:
+                    results["missing"] += 1
+                    self.mark_refreshed(key, None, now)
+                    continue
+                results["refreshed"] += 1
+                if self.mark_refreshed(key, new_item, now):
+                    results["changed"] += 1
+                    results["changedKeys"].append(record_key(new_item))
+        finally:
+            self.save_state()
+        return results
+
+    def upcoming(self, limit=20):
+        """다음 갱신 예정 목록 (기한순)"""
+        return sorted(self._due.items(), key=lambda x: x[1])[:limit]
+
+
+def openapi_fetch(oc=None, today=None):
+    """OpenAPI 시행일 법령 검색(target=eflaw, 법령명)으로 레코드 1건을 재조회하는 fetch(item)
+
+    같은 법령(lsId, 없으면 법령명)의 버전 중 시행일이 같은 것, 없으면 가장 가까운 것 → 시행일/법령종류/상태 갱신
+    검색 결과에 없으면 None, 응답 실패는 예외
+    """
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "scraper"))
+    import scrape
+
+    oc = oc or scrape.default_oc()
+    today = today or date.today().isoformat()
+
+    def fetch(item):
+        title = item.get("title") or ""
+        ls_id = str((item.get("meta") or {}).get("lsId") or "").lstrip("0")
+        params = {"OC": oc, "target": "eflaw", "type": "JSON", "query": title, "display": "100"}
+        raw = scrape.http_get(scrape.OPENAPI + "?" + urllib.parse.urlencode(params), timeout=30, retries=2)
+        if raw is None:
+            raise IOError("OpenAPI 응답 없음")
+        versions = []
+        for x in scrape.find_items(json.loads(raw.decode("utf-8", "ignore"))):
+            same = (str(x.get("법령ID") or "").lstrip("0") == ls_id if ls_id
+                    else (x.get("법령명한글") or "").strip() == title)
+            eff = scrape.yyyymmdd_to_iso(x.get("시행일자"))
+            if same and eff:
+                versions.append((eff, x))
+        if not versions:
+            return None
+        old = _parse_date(item.get("effectiveDate")) or date.today()
+        eff, x = min(versions, key=lambda v: (v[0] != item.get("effectiveDate"),
+                                              abs((_parse_date(v[0]) - old).days)))
+        new_item = dict(item, effectiveDate=eff,
+                        lawType=x.get("법령구분명") or x.get("법종구분명") or item.get("lawType"))
+        if eff > today:
+            new_item["status"] = "시행예정"
+        elif item.get("status") == "시행예정":
+            new_item["status"] = "시행"
+        return new_item
+
+    return fetch
+
+
+def main(argv=None):
+    """메인 실행: 갱신 계획 출력 (plan) 또는 기한이 지난 레코드 재조회 (run)"""
+
+    parser = argparse.ArgumentParser(description="시행일 기반 법령 갱신 스케줄러")
+    parser.add_argument("mode", nargs="?", choices=("plan", "run"), default="plan")
+    parser.add_argument("--budget", type=int, default=int(os.environ.get("REFRESH_BUDGET") or 50),
+                        help="이번 실행 요청 예산 (기본 50, REFRESH_BUDGET)")
+    parser.add_argument("--state", default=STATE_PATH, help="갱신 이력 파일")
+    args = parser.parse_args(argv)
+
+    records = load_corpus_records()
+    scheduler = RefreshScheduler(records, state_path=args.state)
+
+    print("🗓️  시행일 기반 갱신 스케줄")
+    print("=" * 60)
+    print(f"   전체 레코드: {len(records)}개, 요청 예산: {args.budget}건")
+
+    if args.mode == "run":
+        from rate_limiter import QuotaExceeded
+
+        try:
+            results = scheduler.refresh_due(openapi_fetch(), args.budget)
+        except QuotaExceeded as e:
+            print(f"❌ 갱신 중단 (쿼터 소진): {e}")
+            return 1
+        print(f"\n🔄 재조회 {results['refreshed']}건 (변경 {results['changed']}건), "
+              f"검색 결과 없음 {results['missing']}건, 오류 {results['errors']}건")
+        for key in results["changedKeys"]:
+            print(f"   ✏️ {key}")
+        return 1 if results["errors"] and not results["refreshed"] else 0
+
+    batch = scheduler.next_batch(args.budget)
+    print(f"\n🔄 이번 실행 갱신 대상: {len(batch)}개")
+    for key in batch:
+        item = records[key]
+        interval = refresh_interval(item)
+        print(f"   📅 {item.get('effectiveDate')} [{item.get('status', '')}] "
+              f"{item.get('title')} (주기 {interval / HOUR:.0f}h)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
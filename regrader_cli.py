@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+RegRader 통합 CLI
+- 하위 명령: collect / crawl / scrape / match / build-base / publish / recategorize / notify / refresh / health
+- 무거운 의존성(pandas, openpyxl, requests)은 해당 하위 명령 실행 시에만 로드
+  → cron/헬스체크 같은 잦은 호출은 pandas import 비용을 내지 않음
+  (기동 시간 측정: python benchmarks/cli_startup.py)
+
+사용법:
+  python regrader_cli.py collect [--ndjson] [--excel] [--no-archive]
+  python regrader_cli.py crawl plan|work|status|merge JOB ...   (분산 수집 큐, crawl_queue.py)
+  python regrader_cli.py scrape [--ndjson] [--today 2025-07-01] [--output docs/index.json]
+                                [--limit 200] [--max-pages 10] [--page-size 200] [--workers 4] [--phased]
+  python regrader_cli.py match [--ndjson] [--base-laws docs/base_laws_207.json] [--dataset collected]
+    (--dataset 기본: collect/crawl merge 적재분(collected)이 있으면 그것, 없으면 2025_laws_complete)
+  python regrader_cli.py build-base [--output docs/base_laws_207.json]
+  python regrader_cli.py publish [--docs-dir docs] [--year 2026] [--no-artifacts]
+  python regrader_cli.py recategorize [--dataset quarterly] [--rules rules.json] [--dry-run]
+  python regrader_cli.py notify send|sink ...   (법령 변경 알림 다이제스트, notifier.py)
+  python regrader_cli.py refresh plan|run [--budget 50]   (시행일 기반 우선순위 재조회, refresh_scheduler.py)
+  python regrader_cli.py health
+  python regrader_cli.py --profile <하위 명령> ...   (단계별 CPU/메모리 프로파일, profiling_hooks.py)
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import sys
+
+import profiling_hooks
+from profiling_hooks import stage as profile_stage
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+DB_PATH = "data/regrader.db"  # law_db.DB_PATH (기동 시 law_db 미로드)
+
+
+def cmd_collect(args):
+    """국가법령정보 OpenAPI 수집 (FastLawCollector) → 법령 DB 적재"""
+    from crawl_archive import CrawlArchive
+    from fast_law_collector import FastLawCollector, default_oc
+    from rate_limiter import QuotaExceeded
+
+    archive = None if args.no_archive else CrawlArchive.new_run("collector", {"oc": default_oc()})
+    collector = FastLawCollector(archive=archive)
+    try:
+        if args.ndjson:
+            collector.stream_ndjson()
+            return 0
+        df_laws = collector.collect_all_laws()
+    except QuotaExceeded as e:
+        # 부분 결과는 적재하지 않고 수집이력만 failed로 남김
+        print(f"❌ 수집 중단 (쿼터 소진): {e}", file=sys.stderr)
+        if not args.ndjson:
+            collector.record_failed_run(e, args.db)
+        return 1
+    finally:
+        if archive is not None:
+            archive.close()
+            print(f"📦 수집 아카이브: {archive.path}", file=sys.stderr)
+
+    if len(df_laws) == 0:
+        print("❌ 수집된 법령이 없습니다.")
+        return 1
+    collector.save_to_db(args.db)
+    if args.excel:
+        collector.save_to_excel()
+    return 0
+
+
+def cmd_crawl(args):
+    """분산 수집 작업 큐 (crawl_queue) — merge 시 --db 전달"""
+    from crawl_queue import main as crawl_main
+
+    argv = list(args.args)
+    if argv[:1] == ["merge"] and "--db" not in argv:
+        argv += ["--db", args.db]
+    return crawl_main(argv)
+
+
+def cmd_notify(args):
+    """법령 변경 알림 다이제스트 (notifier) — send 시 --db 전달"""
+    from notifier import main as notify_main
+
+    argv = list(args.args)
+    if argv[:1] == ["send"] and "--db" not in argv:
+        argv += ["--db", args.db]
+    return notify_main(argv)
+
+
+def cmd_scrape(args):
+    """연간 시행법령 스크랩 (scraper/scrape.py) → JSON/NDJSON"""
+    sys.path.insert(0, os.path.join(ROOT, "scraper"))
+    import scrape
+
+    argv = (["--ndjson"] if args.ndjson else []) + (["--phased"] if args.phased else [])
+    options = {"today": args.today, "limit": args.limit, "max_pages": args.max_pages,
+               "workers": args.workers}
+    if not args.output:
+        scrape.main(argv, **options)
+        return 0
+    tmp_path = args.output + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f, contextlib.redirect_stdout(f):
+        scrape.main(argv, **options)
+    os.replace(tmp_path, args.output)
+    print(f"✅ 저장: {args.output}", file=sys.stderr)
+    if args.page_size and not args.ndjson:
+        # <stem>.p1.json … + <stem>.pages.json (전체 파일은 그대로 유지)
+        with open(args.output, "r", encoding="utf-8") as f:
+            result = json.load(f)
+        stem = os.path.splitext(os.path.basename(args.output))[0]
+        files = scrape.write_pages(result, os.path.dirname(args.output) or ".", stem, args.page_size)
+        print(f"✅ 페이지 분할: {len(files)}개 ({args.page_size}건 단위)", file=sys.stderr)
+    return 0
+
+
+def cmd_match(args):
+    """기본법규 × 수집법령 100% 매칭"""
+    if args.ndjson:
+        # stdin NDJSON(collect/scrape --ndjson) → stdout 매칭 NDJSON
+        # 기본법규: --base-laws 파일 → DB base_laws → 저장소 docs/index.json
+        from exact_matching_analyzer import main_ndjson
+        from incremental_matcher import company_law_from_db_row
+        from law_db import LawDatabase
+        from multi_tenant_matcher import load_company_laws
+
+        company_laws = None
+        try:
+            if args.base_laws:
+                company_laws = list(load_company_laws(args.base_laws))
+            elif os.path.exists(args.db):
+                with LawDatabase(args.db) as db:
+                    company_laws = [company_law_from_db_row(r) for r in db.base_laws()] or None
+        except (OSError, ValueError, KeyError) as e:
+            print(f"❌ 기본법규 로드 오류: {e}", file=sys.stderr)
+            return 1
+        return main_ndjson(company_laws=company_laws, db_path=args.db)
+
+    from corpus_index import CorpusIndex, default_dataset
+    from incremental_matcher import IncrementalMatcher, company_law_from_db_row
+    from law_db import LawDatabase
+    from multi_tenant_matcher import load_company_laws
+
+    with LawDatabase(args.db) as db:
+        args.dataset = args.dataset or default_dataset(db)
+        with profile_stage("load_corpus"):
+            corpus = CorpusIndex.cached_from_db(db, args.dataset)
+        if not len(corpus):
+            print(f"❌ 법령 DB에 수집법령({args.dataset})이 없습니다. (python law_db.py 먼저 실행)")
+            return 1
+        if args.base_laws:
+            company_laws = list(load_company_laws(args.base_laws))
+        else:
+            company_laws = [company_law_from_db_row(r) for r in db.base_laws()]
+        with profile_stage("match"):
+            if args.save:
+                # 기본법규별 add_base_law → base_laws/matches 테이블 갱신
+                matcher = IncrementalMatcher(corpus, db=db)
+                for law in company_laws:
+                    matcher.add_base_law(law)
+            else:
+                matcher = IncrementalMatcher(corpus, company_laws)
+
+    summary = matcher.aggregates.summary()
+    print(f"🎯 기본법규 {len(matcher.company_laws)}개 × 수집법령 {len(corpus):,}개 → 매칭 {summary['total']}개")
+    print(f"   • 분기별: {summary['quarters']}")
+    print(f"   • 상태별: {summary['statuses']}")
+    print(f"   • TOP 3: {', '.join(f'{c}({n})' for c, n in summary['top3'])}")
+    return 0
+
+
+def cmd_build_base(args):
+    """207개 기본 법규 JSON 생성"""
+    from create_207_base_laws import create_base_laws_json
+
+    create_base_laws_json(args.output)
+    return 0
+
+
+def cmd_publish(args):
+    """법령 DB → docs/ 게시용 JSON 재생성 + 해시/압축 산출물 (publish_artifacts)"""
+    from law_db import LawDatabase
+
+    os.makedirs(args.docs_dir, exist_ok=True)
+    with LawDatabase(args.db) as db:
+        datasets = {r[0] for r in db.conn.execute("SELECT DISTINCT dataset FROM corpus")}
+        if "index" in datasets:
+            data = db.export_index_json(os.path.join(args.docs_dir, "index.json"), year=args.year)
+            print(f"   ✅ index.json {data['totalCount']}개")
+        if "quarterly" in datasets:
+            data = db.export_quarterly_details(os.path.join(args.docs_dir, "quarterly_details.json"),
+                                               year=args.year)
+            print(f"   ✅ quarterly_details.json {data['total_laws']}개")
+        if db.stats()["base_laws"]:
+            data = db.export_base_laws_json(os.path.join(args.docs_dir, "base_laws_207.json"),
+                                            year=args.year)
+            print(f"   ✅ base_laws_207.json {data['total_laws']}개")
+
+    if not args.no_artifacts:
+        from publish_artifacts import publish
+
+        for name, entry in publish(args.docs_dir).items():
+            print(f"   📦 {name} → {entry['path']} (gz {entry['gzipBytes']:,} bytes)")
+    return 0
+
+
+def cmd_recategorize(args):
+    """분류 규칙 변경분만 증분 재분류 (recategorizer)"""
+    from recategorizer import main as recategorize_main
+
+    argv = ["--db", args.db]
+    for dataset in args.dataset or ():
+        argv += ["--dataset", dataset]
+    if args.rules:
+        argv += ["--rules", args.rules]
+    if args.report:
+        argv += ["--report", args.report]
+    argv += [flag for flag, on in (("--dry-run", args.dry_run), ("--full", args.full)) if on]
+    return recategorize_main(argv)
+
+
+def cmd_refresh(args):
+    """시행일 기반 갱신 스케줄러 (refresh_scheduler) — 요청 예산을 갱신 기한이 지난 법령에 배분"""
+    from refresh_scheduler import main as refresh_main
+
+    return refresh_main(list(args.args))
+
+
+def cmd_health(args):
+    """헬스체크: 법령 DB/게시 파일 상태 (pandas 등 미로드)"""
+    ok = True
+    if os.path.exists(args.db):
+        from law_db import LawDatabase
+
+        with LawDatabase(args.db) as db:
+            stats = db.stats()
+        print(f"✅ DB {args.db}: " + ", ".join(f"{t} {n:,}" for t, n in stats.items()))
+        ok = stats["corpus"] > 0
+    else:
+        print(f"❌ DB 없음: {args.db}")
+        ok = False
+    for name in ("index.json", "quarterly_details.json", "base_laws_207.json"):
+        path = os.path.join(args.docs_dir, name)
+        if os.path.exists(path):
+            print(f"✅ {path} ({os.path.getsize(path):,} bytes)")
+        else:
+            print(f"❌ 없음: {path}")
+            ok = False
+    return 0 if ok else 1
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="regrader", description="RegRader 통합 CLI")
+    parser.add_argument("--db", default=os.environ.get("REGRADER_DB", DB_PATH), help="법령 DB 경로")
+    parser.add_argument("--profile", action="store_true",
+                        help="단계별 CPU/메모리 프로파일 (data/profiles/, REGRADER_PROFILE=1 과 같음)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("collect", help="OpenAPI 법령 수집 → DB 적재")
+    p.add_argument("--ndjson", action="store_true", help="NDJSON 스트리밍 출력 (DB 미적재)")
+    p.add_argument("--excel", action="store_true", help="Excel 파일도 저장")
+    p.add_argument("--no-archive", action="store_true", help="수집 응답 아카이브 생략")
+    p.set_defaults(func=cmd_collect)
+
+    p = sub.add_parser("crawl", help="분산 수집 작업 큐 (plan/work/status/merge)", add_help=False)
+    p.add_argument("args", nargs=argparse.REMAINDER)
+    p.set_defaults(func=cmd_crawl)
+
+    p = sub.add_parser("scrape", help="연간 시행법령 스크랩")
+    p.add_argument("--ndjson", action="store_true", help="NDJSON 스트리밍 출력")
+    p.add_argument("--today", help="기준일 YYYY-MM-DD (기본: 오늘)")
+    p.add_argument("--output", help="결과 파일 (기본: stdout)")
+    p.add_argument("--limit", type=int, help="최신 N건만 (기본: 전체)")
+    p.add_argument("--max-pages", type=int, help="OpenAPI 페이지 상한 (기본: 마지막 페이지까지)")
+    p.add_argument("--page-size", type=int, help="--output 옆에 N건 단위 페이지 파일도 저장")
+    p.add_argument("--workers", type=int, help="파싱/분류 프로세스 수 (parallel_parse, 지정 시 단계별 실행)")
+    p.add_argument("--phased", action="store_true", help="단계별 순차 실행 (기본: 단계 동시 파이프라인)")
+    p.set_defaults(func=cmd_scrape)
+
+    p = sub.add_parser("match", help="기본법규 100%% 매칭")
+    p.add_argument("--ndjson", action="store_true", help="stdin NDJSON → stdout 매칭 NDJSON")
+    p.add_argument("--base-laws", help="기본법규 JSON (기본: DB base_laws)")
+    p.add_argument("--dataset", help="수집법령 데이터셋 (기본: collected → 2025_laws_complete)")
+    p.add_argument("--save", action="store_true", help="매칭 결과 DB 저장")
+    p.set_defaults(func=cmd_match)
+
+    p = sub.add_parser("build-base", help="207개 기본 법규 JSON 생성")
+    p.add_argument("--output", default="docs/base_laws_207.json")
+    p.set_defaults(func=cmd_build_base)
+
+    p = sub.add_parser("publish", help="DB → docs/ JSON 재생성")
+    p.add_argument("--docs-dir", default="docs")
+    p.add_argument("--year", type=int)
+    p.add_argument("--no-artifacts", action="store_true", help="해시/압축 산출물(docs/data/) 생략")
+    p.set_defaults(func=cmd_publish)
+
+    p = sub.add_parser("recategorize", help="분류 규칙 변경분 증분 재분류")
+    p.add_argument("--dataset", action="append", help="대상 데이터셋 (반복 가능, 기본: index 제외)")
+    p.add_argument("--rules", help="규칙 JSON (기본: scrape.py 규칙)")
+    p.add_argument("--report", help="변경 리포트 JSON 저장 경로")
+    p.add_argument("--dry-run", action="store_true")
+    p.add_argument("--full", action="store_true")
+    p.set_defaults(func=cmd_recategorize)
+
+    p = sub.add_parser("notify", help="법령 변경 알림 다이제스트 (send/sink)", add_help=False)
+    p.add_argument("args", nargs=argparse.REMAINDER)
+    p.set_defaults(func=cmd_notify)
+
+    p = sub.add_parser("refresh", help="시행일 기반 우선순위 재조회 (plan/run)", add_help=False)
+    p.add_argument("args", nargs=argparse.REMAINDER)
+    p.set_defaults(func=cmd_refresh)
+
+    p = sub.add_parser("health", help="DB/게시 파일 상태 점검")
+    p.add_argument("--docs-dir", default="docs")
+    p.set_defaults(func=cmd_health)
+    return parser
+
+
+def main(argv=None):
+    """메인 실행"""
+
+    parser = build_parser()
+    args, extra = parser.parse_known_args(argv)
+    if extra and args.command not in ("crawl", "notify", "refresh"):
+        parser.error(f"unrecognized arguments: {' '.join(extra)}")
+    if extra:
+        args.args = extra + list(args.args)  # 앞쪽 옵션(--budget 3 등)이 extra로 빠짐 → 원래 순서 복원
+    profiling_hooks.init(f"regrader_{args.command}", force=args.profile)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
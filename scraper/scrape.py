@@ -1,19 +1,26 @@
-import os, sys, json, time, hashlib, re, random
+import os, sys, json, time, hashlib, re, random, heapq, queue, threading
 import urllib.parse, urllib.request
 from datetime import date, datetime
 from html import unescape
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from crawl_archive import CrawlArchive
+from rate_limiter import limiter_for_url
+import profiling_hooks
+from profiling_hooks import stage as profile_stage
+
 UA = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) law-watch/3.3"
 OPENAPI = "https://www.law.go.kr/DRF/lawSearch.do"
+DETAIL_URL = "https://www.law.go.kr/LSW/lsInfoP.do"
 LAW_RSS = "https://www.law.go.kr/rss/lsRss.do?section=LS"
 
-TODAY = date.today()
-YEAR_START = date(TODAY.year, 1, 1)
-YEAR_END   = date(TODAY.year, 12, 31)
 
 AMEND_RE = re.compile(r"(전부개정|일부개정|타법개정|일괄개정|개정(령|법률|규칙)?)")
 DATE_RE = re.compile(r"(\d{4})(\d{2})(\d{2})", re.I)
 
+# 수집 아카이브 (기록: 원본 응답 저장 / 재생: 네트워크 대신 아카이브에서 읽기)
+ARCHIVE = None
+
 # 1) 키워드 규칙(확장)
 CATE_RULES = {
     "안전": [
@@ -58,18 +65,43 @@ MINISTRY_TO_CAT = {
     "해양수산부": ["환경","안전"],
 }
 
-def http_get(url, timeout=45, headers=None, retries=5, backoff=2.0):
+def default_oc():
+    return os.environ.get("LAW_OC") or "knowhow1"
+
+# until(지금까지 받은 bytes, 마지막 블록 크기)가 참이 되면 나머지 본문은 받지 않고 연결 종료
+def http_get(url, timeout=45, headers=None, retries=5, backoff=2.0, until=None, chunk=16384):
+    if ARCHIVE is not None and ARCHIVE.replay:
+        raw = ARCHIVE.get(url)
+        if raw is None:
+            print(f"[WARN] not in archive: {url}", file=sys.stderr)
+        return raw
     last = None
     hdr = {"User-Agent": UA, "Accept": "*/*"}
     if headers: hdr.update(headers)
+    limiter = limiter_for_url(url)  # 프로세스 간 공유 속도 제한
     for i in range(retries):
+        limiter.acquire()  # 일일 쿼터 소진(QuotaExceeded)은 재시도 없이 실행 중단
         try:
             req = urllib.request.Request(url, headers=hdr)
             with urllib.request.urlopen(req, timeout=timeout) as r:
-                return r.read()
+                if until is None:
+                    raw = r.read()
+                else:
+                    buf = bytearray()
+                    while True:
+                        block = r.read(chunk)
+                        if not block: break
+                        buf += block
+                        if until(buf, len(block)): break
+                    raw = bytes(buf)
+            if ARCHIVE is not None:
+                ARCHIVE.record(url, raw)
+            return raw
         except Exception as e:
             last = e
             sleep = (backoff ** i) + random.uniform(0,0.6)
+            if getattr(e, "code", None) in (429, 503):
+                limiter.penalize(sleep)  # 상류 제한 → 같은 키 사용 작업 모두 대기
             print(f"[WARN] GET fail ({i+1}/{retries}) {url} -> {e}; retry in {sleep:.1f}s", file=sys.stderr)
             time.sleep(sleep)
     print(f"[ERROR] GET failed after retries: {url} -> {last}", file=sys.stderr)
@@ -92,24 +124,96 @@ def norm_lawtype(title, raw_type):
         if k in (title or ""): return k
     return ""
 
-def categorize(title, ministry):
+# cate_rules/ministry_map 생략 시 모듈 규칙 사용 (recategorizer.py가 규칙 버전별로 호출)
+def categorize(title, ministry, cate_rules=None, ministry_map=None):
     title = unescape(title or "")
     cats = set()
-    for cat, rules in CATE_RULES.items():
+    for cat, rules in (CATE_RULES if cate_rules is None else cate_rules).items():
         for r in rules:
             if re.search(r, title):
                 cats.add(cat); break
     if ministry:
-        for m, m_cats in MINISTRY_TO_CAT.items():
+        for m, m_cats in (MINISTRY_TO_CAT if ministry_map is None else ministry_map).items():
             if m in ministry:
                 cats.update(m_cats)
     return sorted(cats) if cats else ["기타"]
 
-def parse_openapi_year(oc, start_d, end_d, display=100, max_pages=10):
-    if not oc: return []
-    os.makedirs("docs/_debug", exist_ok=True)
-    collected = []
-    for page in range(1, max_pages+1):
+# 응답의 전체 건수(totalCnt) — 페이지 상한으로 잘린 건수 보고용
+def find_total_count(data):
+    if isinstance(data, dict):
+        for k, v in data.items():
+            if k == "totalCnt":
+                try: return int(v)
+                except (TypeError, ValueError): return None
+            found = find_total_count(v)
+            if found is not None: return found
+    return None
+
+# 응답 JSON에서 법령 항목(dict) 목록 (응답 구조 차이와 무관하게 깊이 우선 탐색)
+def find_items(data):
+    items = []
+    def walk(x):
+        if isinstance(x, list):
+            for v in x: walk(v)
+        elif isinstance(x, dict):
+            if any(k in x for k in ("법령명한글","법령명","title")):
+                items.append(x)
+            for v in x.values(): walk(v)
+    walk(data)
+    return items
+
+def parse_openapi_year(oc, start_d, end_d, display=100, max_pages=None, stats=None):
+    return list(iter_openapi_year(oc, start_d, end_d, display, max_pages, stats))
+
+# OpenAPI 원본 항목 1건 → 결과 항목 (CPU 처리만, 병렬 처리 시 워커에서 실행: parallel_parse.py)
+def openapi_item(it, cate_rules=None, ministry_map=None):
+    title = unescape((it.get("법령명한글") or it.get("법령명") or it.get("title") or "").strip())
+    eff = yyyymmdd_to_iso(it.get("시행일자") or it.get("시행일") or it.get("efYd"))
+    lawtype = norm_lawtype(title, it.get("제개정구분명") or it.get("구분"))
+    law_id = (it.get("법령ID") or it.get("lsId") or it.get("법령일련번호") or "").strip()
+    ministry = (it.get("소관부처명") or it.get("부처명") or "").strip()
+    cats = categorize(title, ministry, cate_rules, ministry_map)
+
+    detail_url = f"{DETAIL_URL}?lsId={law_id}" if law_id else ""
+    search_url = "https://www.law.go.kr/lsSc.do?query=" + urllib.parse.quote(title)
+
+    return {
+        "title": title,
+        "summary": "",
+        "effectiveDate": eff,
+        "announcedDate": None,
+        "lawType": lawtype,
+        "categories": cats,
+        "meta": {"ministry": ministry, "lsId": law_id},
+        "source": {"name":"국가법령정보(OpenAPI)","url": detail_url or search_url,"search": search_url}
+    }
+
+# 페이지 단위로 파싱하며 항목을 즉시 내보냄 (스트리밍 출력용)
+def iter_openapi_year(oc, start_d, end_d, display=100, max_pages=None, stats=None):
+    for it in iter_openapi_raw(oc, start_d, end_d, display, max_pages, stats):
+        yield openapi_item(it)
+
+# OpenAPI 원본 항목(dict) 스트림. 기본은 마지막 페이지(항목 < display)까지 전부.
+# max_pages 지정 시 잘린 건수는 stats["droppedByPages"]
+def iter_openapi_raw(oc, start_d, end_d, display=100, max_pages=None, stats=None):
+    for items in iter_openapi_pages(oc, start_d, end_d, display, max_pages, stats):
+        yield from items
+
+# 페이지 단위 원본 항목 목록 스트림 (파이프라인 수집 단계의 묶음 단위)
+def iter_openapi_pages(oc, start_d, end_d, display=100, max_pages=None, stats=None):
+    stats = {} if stats is None else stats
+    stats.update(fetched=0, droppedByPages=0)
+    if not oc: return
+    page = 0
+    while True:
+        page += 1
+        if max_pages is not None and page > max_pages:
+            total = stats.get("totalCnt")
+            stats["droppedByPages"] = max(0, total - stats["fetched"]) if total else None
+            if stats["droppedByPages"] != 0:
+                print(f"[WARN] OpenAPI max_pages={max_pages} 도달: {stats['fetched']}/{total or '?'}건만 수집",
+                      file=sys.stderr)
+            break
         params = {
             "OC": oc, "target": "eflaw", "type":"JSON",
             "display": str(display), "page": str(page),
@@ -119,54 +223,28 @@ def parse_openapi_year(oc, start_d, end_d, display=100, max_pages=10):
         url = OPENAPI + "?" + urllib.parse.urlencode(params, safe="~:")
         raw = http_get(url)
         if not raw: break
-        open(f"docs/_debug/openapi_p{page}.json","wb").write(raw)
         try:
             data = json.loads(raw.decode("utf-8","ignore"))
         except Exception as e:
             print(f"[WARN] OpenAPI JSON decode fail p{page}: {e}", file=sys.stderr)
             break
 
-        items = []
-        def walk(x):
-            if isinstance(x, list):
-                for v in x: walk(v)
-            elif isinstance(x, dict):
-                if any(k in x for k in ("법령명한글","법령명","title")):
-                    items.append(x)
-                for v in x.values(): walk(v)
-        walk(data)
+        items = find_items(data)
         if not items: break
+        total = find_total_count(data)
+        if total is not None: stats["totalCnt"] = total
+        stats["fetched"] += len(items)
 
-        for it in items:
-            title = unescape((it.get("법령명한글") or it.get("법령명") or it.get("title") or "").strip())
-            eff = yyyymmdd_to_iso(it.get("시행일자") or it.get("시행일") or it.get("efYd"))
-            lawtype = norm_lawtype(title, it.get("제개정구분명") or it.get("구분"))
-            law_id = (it.get("법령ID") or it.get("lsId") or it.get("법령일련번호") or "").strip()
-            ministry = (it.get("소관부처명") or it.get("부처명") or "").strip()
-            cats = categorize(title, ministry)
-
-            detail_url = f"https://www.law.go.kr/LSW/lsInfoP.do?lsId={law_id}" if law_id else ""
-            search_url = "https://www.law.go.kr/lsSc.do?query=" + urllib.parse.quote(title)
-
-            collected.append({
-                "title": title,
-                "summary": "",
-                "effectiveDate": eff,
-                "announcedDate": None,
-                "lawType": lawtype,
-                "categories": cats,
-                "meta": {"ministry": ministry, "lsId": law_id},
-                "source": {"name":"국가법령정보(OpenAPI)","url": detail_url or search_url,"search": search_url}
-            })
+        yield items
 
         if len(items) < display: break
-    return collected
 
-def parse_rss_backup():
-    os.makedirs("docs/_debug", exist_ok=True)
+def parse_rss_backup(start_d=None, end_d=None):
+    if start_d is None or end_d is None:
+        _, year_start, year_end = year_range()
+        start_d, end_d = start_d or year_start, end_d or year_end
     raw = http_get(LAW_RSS)
     if not raw: return []
-    open("docs/_debug/law_rss.xml","wb").write(raw)
     xml = raw.decode("utf-8","ignore")
     blocks = re.findall(r"<item\b[^>]*>(.*?)</item>", xml, flags=re.I|re.S)
     out = []
@@ -181,7 +259,7 @@ def parse_rss_backup():
         if not eff: continue
         try: dd = datetime.strptime(eff, "%Y-%m-%d").date()
         except: continue
-        if not (YEAR_START <= dd <= YEAR_END): continue
+        if not (start_d <= dd <= end_d): continue
         if not is_amendment(title + " " + desc): continue
         cats = categorize(title, "")
         out.append({
@@ -192,89 +270,403 @@ def parse_rss_backup():
         })
     return out
 
-# 상세 페이지에서 소관부처 보정(최대 N건)
-def fetch_ministry_from_detail(lsId):
+# 상세 페이지 HTML → 소관부처
+MINISTRY_HTML_RE = re.compile(r"(소관부처|주무부처)\s*</(?:th|dt)>\s*<(?:td|dd)[^>]*>\s*([^<]+)", re.I)
+# 수신 중 판정용 (bytes, 값 뒤 '<'까지 받아야 셀이 끝난 것)
+MINISTRY_CELL_END_RE = re.compile((MINISTRY_HTML_RE.pattern + "<").encode("utf-8"), re.I)
+MINISTRY_CELL_MAX = 512  # 블록 경계에 걸친 셀을 찾기 위해 직전 블록에서 다시 보는 길이
+MINISTRY_LOOKUP_DISPLAY = 20
+
+def parse_ministry_html(html):
+    m = MINISTRY_HTML_RE.search(html or "")
+    return unescape(m.group(2)).strip() if m else ""
+
+def ministry_cell_received(buf, last_block):
+    return MINISTRY_CELL_END_RE.search(buf, max(0, len(buf) - last_block - MINISTRY_CELL_MAX)) is not None
+
+# DRF 목록 응답(법령명 검색, 항목당 수백 바이트)에서 같은 법령ID 항목의 소관부처명
+def fetch_ministry_from_api(lsId, title, oc=None):
+    if not (lsId and title): return ""
+    params = {"OC": oc or default_oc(), "target": "law", "type": "JSON",
+              "query": title, "display": str(MINISTRY_LOOKUP_DISPLAY)}
+    raw = http_get(OPENAPI + "?" + urllib.parse.urlencode(params), timeout=30, retries=2)
+    if not raw: return ""
+    try:
+        data = json.loads(raw.decode("utf-8","ignore"))
+    except ValueError:
+        return ""
+    for x in find_items(data):
+        if str(x.get("법령ID") or "").lstrip("0") == lsId.lstrip("0"):
+            return (x.get("소관부처명") or "").strip()
+    return ""
+
+# 상세 페이지는 소관부처 셀을 받는 즉시 중단 (본문 조문 대부분은 받지 않음). 실패 시 None
+def fetch_ministry_from_html(lsId):
+    raw = http_get(f"{DETAIL_URL}?lsId={lsId}", timeout=30, retries=2, until=ministry_cell_received)
+    if not raw: return None
+    return parse_ministry_html(raw.decode("utf-8","ignore"))
+
+def fetch_ministry_from_detail(lsId, title=None):
     if not lsId: return ""
+    key = f"ministry:{lsId}"
+    if ARCHIVE is not None and ARCHIVE.replay and key in ARCHIVE:
+        return ARCHIVE.get(key).decode("utf-8")
     cache = f"docs/_debug/ministry_{lsId}.txt"
     if os.path.exists(cache):
-        return open(cache, "r", encoding="utf-8").read().strip()
-    url = f"https://www.law.go.kr/LSW/lsInfoP.do?lsId={lsId}"
-    raw = http_get(url, timeout=30, retries=3)
-    if not raw: return ""
-    html = raw.decode("utf-8","ignore")
-    m = re.search(r"(소관부처|주무부처)\s*</(?:th|dt)>\s*<(?:td|dd)[^>]*>\s*([^<]+)", html, flags=re.I)
-    val = unescape(m.group(2)).strip() if m else ""
-    try:
-        open(cache,"w",encoding="utf-8").write(val)
-    except: pass
+        val = open(cache, "r", encoding="utf-8").read().strip()
+    else:
+        # DRF 목록 응답 우선, 없으면 상세 페이지 HTML
+        val = fetch_ministry_from_api(lsId, title)
+        if not val:
+            val = fetch_ministry_from_html(lsId)
+            if val is None: return ""
+        try:
+            os.makedirs("docs/_debug", exist_ok=True)
+            open(cache,"w",encoding="utf-8").write(val)
+        except: pass
+    # 캐시 적중분도 기록해 아카이브만으로 재처리 가능하게 함
+    if ARCHIVE is not None:
+        ARCHIVE.record(key, val.encode("utf-8"), "ministry")
     return val
 
+def is_target_item(it, start_d, end_d):
+    # 기간 내 시행 + 개정만
+    if "개정" not in (it.get("lawType") or "") and not is_amendment(it.get("title")):
+        return False
+    d = it.get("effectiveDate")
+    if not d: return False
+    try: dd = datetime.strptime(d, "%Y-%m-%d").date()
+    except: return False
+    return start_d <= dd <= end_d
+
+def needs_refine(it):
+    return (it.get("categories") or ["기타"]) == ["기타"]
+
+def refine_item(it):
+    lsId = it.get("meta",{}).get("lsId") or ""
+    ministry = it.get("meta",{}).get("ministry") or ""
+    if not ministry:
+        ministry = fetch_ministry_from_detail(lsId, it.get("title"))
+        if ministry:
+            it["meta"]["ministry"] = ministry
+    new_cats = categorize(it.get("title") or "", ministry)
+    if new_cats != ["기타"]:
+        it["categories"] = new_cats
+    return it
+
 def refine_categories(items, max_lookups=20):
     looked = 0
     for it in items:
-        cats = it.get("categories") or ["기타"]
-        if cats != ["기타"]: continue
+        if not needs_refine(it): continue
         if looked >= max_lookups: break
-        lsId = it.get("meta",{}).get("lsId") or ""
-        ministry = it.get("meta",{}).get("ministry") or ""
-        if not ministry:
-            ministry = fetch_ministry_from_detail(lsId)
-            if ministry:
-                it["meta"]["ministry"] = ministry
-        new_cats = categorize(it.get("title") or "", ministry)
-        if new_cats != ["기타"]:
-            it["categories"] = new_cats
+        refine_item(it)
         looked += 1
     return items
 
-def build_results(candidates, limit=200):
-    seen, out = set(), []
+def result_record(it):
+    key = (it.get("title") or "") + (it.get("source",{}).get("url") or "")
+    return {
+        "id": hashlib.md5(key.encode("utf-8")).hexdigest(),
+        "title": it.get("title") or "",
+        "summary": it.get("summary") or "",
+        "effectiveDate": it.get("effectiveDate"),
+        "announcedDate": it.get("announcedDate"),
+        "lawType": it.get("lawType") or "",
+        "categories": it.get("categories") or ["기타"],
+        "meta": it.get("meta") or {},
+        "source": it.get("source") or {"name":"","url":""}
+    }
+
+def result_sort_key(rec):
+    return (rec.get("effectiveDate") or "", rec.get("title") or "")
+
+def unique_records(candidates, stats=None):
+    seen = set()
     for it in candidates:
-        key = (it.get("title") or "") + (it.get("source",{}).get("url") or "")
-        _id = hashlib.md5(key.encode("utf-8")).hexdigest()
-        if _id in seen: continue
-        seen.add(_id)
-        out.append({
-            "id": _id,
-            "title": it.get("title") or "",
-            "summary": it.get("summary") or "",
-            "effectiveDate": it.get("effectiveDate"),
-            "announcedDate": it.get("announcedDate"),
-            "lawType": it.get("lawType") or "",
-            "categories": it.get("categories") or ["기타"],
-            "meta": it.get("meta") or {},
-            "source": it.get("source") or {"name":"","url":""}
-        })
-    out.sort(key=lambda x: (x.get("effectiveDate") or "", x.get("title") or ""), reverse=True)
-    return out[:limit]
+        rec = result_record(it)
+        if rec["id"] in seen: continue
+        seen.add(rec["id"])
+        if stats is not None: stats["unique"] = len(seen)
+        yield rec
 
-def main():
-    oc = os.environ.get("LAW_OC") or "knowhow1"
+# 중복 제거 후 최신순(시행일, 제목 역순). limit=None 이면 전부,
+# limit 지정 시 전체 정렬 없이 크기 limit 힙으로 상위 N개만 유지 (잘린 건수는 stats["droppedByLimit"])
+def build_results(candidates, limit=None, stats=None):
+    stats = {} if stats is None else stats
+    stats["unique"] = 0
+    records = unique_records(candidates, stats)
+    if limit is None:
+        out = sorted(records, key=result_sort_key, reverse=True)
+    else:
+        out = heapq.nlargest(limit, records, key=result_sort_key)
+    stats["droppedByLimit"] = stats["unique"] - len(out)
+    return out
 
-    api_items = parse_openapi_year(oc, YEAR_START, YEAR_END, display=100, max_pages=10)
+# 결과를 page_size 단위 파일로 분할: <stem>.p<N>.json (+ 목록 <stem>.pages.json)
+def write_pages(result, out_dir, stem="index", page_size=200):
+    items = result["items"]
+    total_pages = max(1, -(-len(items) // page_size))
+    files = []
+    for n in range(total_pages):
+        name = f"{stem}.p{n+1}.json"
+        page = {k: v for k, v in result.items() if k != "items"}
+        page.update(page=n+1, pageSize=page_size, totalPages=total_pages,
+                    items=items[n*page_size:(n+1)*page_size])
+        with open(os.path.join(out_dir, name), "w", encoding="utf-8") as f:
+            json.dump(page, f, ensure_ascii=False, indent=2)
+        files.append(name)
+    with open(os.path.join(out_dir, f"{stem}.pages.json"), "w", encoding="utf-8") as f:
+        json.dump({"totalCount": len(items), "pageSize": page_size, "pages": files}, f,
+                  ensure_ascii=False, indent=2)
+    return files
 
-    # 올해 시행 + 개정만
-    filtered = []
-    for it in api_items:
-        if "개정" not in (it.get("lawType") or "") and not is_amendment(it.get("title")):
-            continue
-        d = it.get("effectiveDate")
-        if not d: continue
-        try: dd = datetime.strptime(d, "%Y-%m-%d").date()
-        except: continue
-        if YEAR_START <= dd <= YEAR_END:
-            filtered.append(it)
+# 기준일은 import 시점이 아니라 실행 시점에 결정 (장기 실행/재처리 시 날짜 고정 방지)
+def year_range(today=None):
+    """기준일(기본: 오늘, 'YYYY-MM-DD' 허용) → (기준일, 연초, 연말)"""
+    today = datetime.strptime(today, "%Y-%m-%d").date() if isinstance(today, str) else (today or date.today())
+    return today, date(today.year, 1, 1), date(today.year, 12, 31)
+
+def run(oc, today=None, limit=None, max_pages=None, workers=None):
+    today, year_start, year_end = year_range(today)
+    stats = {}
+
+    if workers and workers > 1:
+        # 파싱/분류/필터를 프로세스 풀에서 (입력 순서 유지 → 순차 처리와 같은 결과)
+        from parallel_parse import process_records
+        with profile_stage("openapi"):
+            raw_items = list(iter_openapi_raw(oc, year_start, year_end, display=100, max_pages=max_pages, stats=stats))
+        with profile_stage("parse"):
+            filtered = process_records(raw_items, workers, window=(year_start, year_end), enrich=False)
+    else:
+        with profile_stage("openapi"):
+            api_items = parse_openapi_year(oc, year_start, year_end, display=100, max_pages=max_pages, stats=stats)
+
+        # 올해 시행 + 개정만
+        filtered = [it for it in api_items if is_target_item(it, year_start, year_end)]
 
     if not filtered:
         print("[INFO] Using RSS backup (OpenAPI가 유효 항목 0건).", file=sys.stderr)
-        filtered = parse_rss_backup()
+        with profile_stage("rss"):
+            filtered = parse_rss_backup(year_start, year_end)
 
     # 소관부처 기반 재분류(기타 보정)
-    filtered = refine_categories(filtered, max_lookups=20)
+    with profile_stage("refine"):
+        filtered = refine_categories(filtered, max_lookups=20)
+
+    with profile_stage("build_results"):
+        results = build_results(filtered, limit, stats)
+    dropped = {"pages": stats.get("droppedByPages") or 0, "limit": stats["droppedByLimit"]}
+    if any(dropped.values()):
+        print(f"[WARN] 상한으로 제외된 항목: 페이지 {dropped['pages']}건, limit {dropped['limit']}건", file=sys.stderr)
+    return {"generatedAt": int(time.time()), "year": today.year, "totalCount": len(results),
+            "dropped": dropped, "items": results}
+
+# 파이프라인 단계 간 큐 크기 (페이지 묶음 수). 가득 차면 앞 단계가 대기 (backpressure)
+PIPELINE_QUEUE_SIZE = int(os.environ.get("LAW_PIPELINE_QUEUE", "4"))
+
+# 단계별 처리량 집계: 작업 시간(busy), 앞 단계 대기(waited), 뒤 단계 대기(blocked, backpressure)
+class StageMeter:
+    def __init__(self, name):
+        self.name = name
+        self.batches = self.items_in = self.items_out = 0
+        self.busy = self.waited = self.blocked = 0.0
+        self.started = self.finished = None
+
+    def as_dict(self):
+        wall = (self.finished or time.perf_counter()) - (self.started or time.perf_counter())
+        return {"stage": self.name, "batches": self.batches, "in": self.items_in, "out": self.items_out,
+                "busy": round(self.busy, 3), "waited": round(self.waited, 3),
+                "blocked": round(self.blocked, 3), "wall": round(wall, 3),
+                "perSec": round(self.items_in / self.busy, 1) if self.busy else None}
+
+def _pipe_put(q, batch, stop, meter):
+    t = time.perf_counter()
+    while not stop.is_set():
+        try:
+            q.put(batch, timeout=0.2)
+            break
+        except queue.Full:
+            continue
+    meter.blocked += time.perf_counter() - t
+
+def _pipe_drain(q, stop):
+    while True:
+        try:
+            batch = q.get(timeout=0.2)
+        except queue.Empty:
+            if stop.is_set(): return
+            continue
+        if batch is None: return
+        yield batch
+
+# 단계 스레드: batches(원본 또는 앞 단계 큐) → work(묶음) → outq. 끝나면(오류 포함) 종료 신호 None
+# pull_is_work: 묶음을 받는 시간 자체가 작업 (수집 단계의 네트워크 수신)
+# --profile: 스레드마다 자체 cProfile (pipeline:<단계>), 주 스레드의 pipeline 단계는 결과 정리만 측정
+def _pipe_stage(meter, batches, work, outq, stop, errors, pull_is_work=False):
+    meter.started = time.perf_counter()
+    try:
+        with profiling_hooks.thread_stage(f"pipeline:{meter.name}"):
+            while not stop.is_set():
+                t = time.perf_counter()
+                batch = next(batches, None)
+                pulled = time.perf_counter()
+                if pull_is_work: meter.busy += pulled - t
+                else: meter.waited += pulled - t
+                if batch is None: break
+                out = work(batch)
+                meter.busy += time.perf_counter() - pulled
+                meter.batches += 1
+                meter.items_in += len(batch)
+                meter.items_out += len(out)
+                if out: _pipe_put(outq, out, stop, meter)
+    except Exception as e:
+        errors.append(e)
+        stop.set()
+    finally:
+        meter.finished = time.perf_counter()
+        _pipe_put(outq, None, stop, meter)
+
+# run()과 같은 결과를 단계 동시 실행으로: 수집(페이지) → 파싱/필터/분류 → 소관부처 보강 → 결과 정리
+# 단계 사이는 크기 제한 큐 → 첫 페이지 항목의 보강이 다음 페이지 수신과 겹침, 메모리는 큐 크기만큼만 대기
+# 보강 대상은 run()의 refine_categories와 같이 입력 순서상 앞의 max_lookups건
+def run_pipelined(oc, today=None, limit=None, max_pages=None, max_lookups=20, queue_size=None, stats=None):
+    today, year_start, year_end = year_range(today)
+    stats = {} if stats is None else stats
+    queue_size = queue_size or PIPELINE_QUEUE_SIZE
+    looked = 0
 
-    results = build_results(filtered, 200)
+    def parse(raw_items):
+        items = (openapi_item(it) for it in raw_items)
+        return [it for it in items if is_target_item(it, year_start, year_end)]
+
+    def enrich(items):
+        nonlocal looked
+        for it in items:
+            if needs_refine(it) and looked < max_lookups:
+                refine_item(it)
+                looked += 1
+        return items
+
+    pages = iter_openapi_pages(oc, year_start, year_end, display=100, max_pages=max_pages, stats=stats)
+    meters = [StageMeter(n) for n in ("fetch", "parse", "enrich", "build")]
+    queues = [queue.Queue(maxsize=queue_size) for _ in range(3)]
+    stop, errors = threading.Event(), []
+    sources = [pages] + [_pipe_drain(q, stop) for q in queues[:2]]
+    threads = [threading.Thread(target=_pipe_stage, name=f"scrape-{m.name}", daemon=True,
+                                args=(m, src, work, q, stop, errors, m.name == "fetch"))
+               for m, src, work, q in zip(meters, sources, (list, parse, enrich), queues)]
+
+    build = meters[3]
+    def enriched():
+        batches = _pipe_drain(queues[2], stop)
+        while True:
+            t = time.perf_counter()
+            batch = next(batches, None)
+            build.waited += time.perf_counter() - t
+            if batch is None: return
+            build.batches += 1
+            build.items_in += len(batch)
+            yield from batch
+
+    with profile_stage("pipeline"):
+        for th in threads: th.start()
+        build.started = time.perf_counter()
+        try:
+            results = build_results(enriched(), limit, stats)
+        except BaseException:
+            stop.set()
+            raise
+        finally:
+            for th in threads: th.join()
+        build.finished = time.perf_counter()
+        build.busy = build.finished - build.started - build.waited
+        build.items_out = len(results)
+    if errors:
+        raise errors[0]
+    stats["stages"] = [m.as_dict() for m in meters]
+
+    if not build.items_in:
+        print("[INFO] Using RSS backup (OpenAPI가 유효 항목 0건).", file=sys.stderr)
+        with profile_stage("rss"):
+            filtered = parse_rss_backup(year_start, year_end)
+        with profile_stage("refine"):
+            filtered = refine_categories(filtered, max_lookups=max_lookups)
+        with profile_stage("build_results"):
+            results = build_results(filtered, limit, stats)
+    for st in stats["stages"]:
+        print(f"[INFO] pipeline {st['stage']:<6} {st['in']:>6,}건 → {st['out']:>6,}건 ({st['batches']}묶음), "
+              f"작업 {st['busy']:.2f}s / 입력 대기 {st['waited']:.2f}s / 출력 대기 {st['blocked']:.2f}s"
+              + (f", {st['perSec']:,.0f}건/s" if st["perSec"] else ""), file=sys.stderr)
+
+    dropped = {"pages": stats.get("droppedByPages") or 0, "limit": stats["droppedByLimit"]}
+    if any(dropped.values()):
+        print(f"[WARN] 상한으로 제외된 항목: 페이지 {dropped['pages']}건, limit {dropped['limit']}건", file=sys.stderr)
+    return {"generatedAt": int(time.time()), "year": today.year, "totalCount": len(results),
+            "dropped": dropped, "items": results}
+
+# NDJSON 스트리밍: 파싱/분류가 끝난 항목을 한 줄씩 즉시 출력, 마지막 줄은 요약 레코드
+# (정렬/개수 제한 없음, 메모리는 중복 제거용 id 집합만 유지)
+def stream_ndjson(oc, out=None, today=None, max_lookups=20):
+    out = out or sys.stdout
+    today, year_start, year_end = year_range(today)
+    seen, by_cat, looked = set(), {}, 0
+
+    def emit(items):
+        nonlocal looked
+        count = 0
+        for it in items:
+            if needs_refine(it) and looked < max_lookups:
+                refine_item(it)
+                looked += 1
+            rec = result_record(it)
+            if rec["id"] in seen: continue
+            seen.add(rec["id"])
+            for c in rec["categories"]:
+                by_cat[c] = by_cat.get(c, 0) + 1
+            out.write(json.dumps(rec, ensure_ascii=False, separators=(",",":")) + "\n")
+            out.flush()
+            count += 1
+        return count
+
+    source, stats = "openapi", {}
+    api_items = iter_openapi_year(oc, year_start, year_end, display=100, stats=stats)
+    if not emit(it for it in api_items if is_target_item(it, year_start, year_end)):
+        print("[INFO] Using RSS backup (OpenAPI가 유효 항목 0건).", file=sys.stderr)
+        source = "rss"
+        emit(parse_rss_backup(year_start, year_end))
+
+    summary = {"type": "summary", "generatedAt": int(time.time()), "year": today.year,
+               "count": len(seen), "source": source, "categories": by_cat,
+               "dropped": {"pages": stats.get("droppedByPages") or 0}}
+    out.write(json.dumps(summary, ensure_ascii=False, separators=(",",":")) + "\n")
+    out.flush()
+    return summary
+
+def main(argv=None, today=None, limit=None, max_pages=None, workers=None):
+    global ARCHIVE
+    argv = sys.argv[1:] if argv is None else argv
+    oc = default_oc()
+    ndjson = "--ndjson" in argv or os.environ.get("LAW_OUTPUT") == "ndjson"
+    today, _, _ = year_range(today)
+    profiling_hooks.init("scrape", argv)
+
+    # 수집 응답은 실행별 아카이브 1개로 기록 (재처리: python crawl_archive.py reprocess <아카이브>)
+    ARCHIVE = CrawlArchive.new_run("scrape", {"oc": oc, "today": today.isoformat()})
+    try:
+        if ndjson:
+            with profile_stage("stream_ndjson"):
+                stream_ndjson(oc, today=today)
+            return
+        if (workers and workers > 1) or "--phased" in argv or os.environ.get("LAW_PIPELINE") == "0":
+            result = run(oc, today=today, limit=limit, max_pages=max_pages, workers=workers)
+        else:
+            result = run_pipelined(oc, today=today, limit=limit, max_pages=max_pages)
+    finally:
+        if ARCHIVE is not None:
+            ARCHIVE.close()
+            print(f"[INFO] crawl archived: {ARCHIVE.path}", file=sys.stderr)
     os.makedirs("docs", exist_ok=True)
-    print(json.dumps({"generatedAt": int(time.time()), "year": TODAY.year, "items": results}, ensure_ascii=False, indent=2))
+    print(json.dumps(result, ensure_ascii=False, indent=2))
 
 if __name__ == "__main__":
     main()